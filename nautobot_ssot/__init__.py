@@ -96,6 +96,7 @@ class NautobotSSOTAppConfig(NautobotAppConfig):
         "device42_role_prepend": "",
         "device42_ignore_tag": "",
         "device42_hostname_mapping": [],
+        "diff_storage": "json",
         "dna_center_import_global": True,
         "dna_center_import_merakis": False,
         "dna_center_update_locations": True,
@@ -115,6 +116,8 @@ class NautobotSSOTAppConfig(NautobotAppConfig):
         "ipfabric_ssl_verify": True,
         "ipfabric_timeout": 15,
         "ipfabric_nautobot_host": "",
+        "metrics_cache_ttl": 10,
+        "metrics_histogram_window": 100,
         "servicenow_instance": "",
         "servicenow_password": "",
         "servicenow_username": "",
@@ -31,3 +31,43 @@ class SyncLogEntryStatusChoices(ChoiceSet):
         (STATUS_FAILURE, "failed"),
         (STATUS_ERROR, "errored"),
     )
+
+
+class DiffStorageChoices(ChoiceSet):
+    """Valid values for the `diff_storage` setting, i.e. how a Sync's diff is persisted."""
+
+    STORAGE_JSON = "json"
+    STORAGE_COMPRESSED = "compressed"
+    STORAGE_CHUNKED = "chunked"
+
+    CHOICES = (
+        (STORAGE_JSON, "single JSON field"),
+        (STORAGE_COMPRESSED, "single gzip-compressed field"),
+        (STORAGE_CHUNKED, "chunked rows"),
+    )
+
+
+class SyncAdapterSideChoices(ChoiceSet):
+    """Valid values for a SyncAdapterSnapshot.side field."""
+
+    SIDE_SOURCE = "source"
+    SIDE_TARGET = "target"
+
+    CHOICES = (
+        (SIDE_SOURCE, "source"),
+        (SIDE_TARGET, "target"),
+    )
+
+
+class SyncMetricKindChoices(ChoiceSet):
+    """Valid values for a SyncMetricWindow.kind field."""
+
+    KIND_DURATION = "duration"
+    KIND_MEMORY = "memory"
+    KIND_OPERATIONS = "operations"
+
+    CHOICES = (
+        (KIND_DURATION, "phase duration (seconds)"),
+        (KIND_MEMORY, "peak memory usage (bytes)"),
+        (KIND_OPERATIONS, "operation count"),
+    )
@@ -3,21 +3,31 @@
 # pylint: disable=protected-access
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
-from collections import defaultdict
-from typing import DefaultDict, Dict, FrozenSet, Hashable, Tuple, Type, get_args
+import copy
+import functools
+import operator
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, DefaultDict, Dict, FrozenSet, Hashable, List, Optional, Tuple, Type
 
 import pydantic
-from diffsync import Adapter
-from diffsync.exceptions import ObjectCrudException
+import structlog
+from diffsync import Adapter, DiffSyncModel
+from diffsync.diff import Diff
+from diffsync.enum import DiffSyncActions, DiffSyncFlags, DiffSyncStatus
+from diffsync.exceptions import ObjectAlreadyExists, ObjectCrudException, ObjectNotFound
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
+from django.db import DataError, IntegrityError, transaction
+from django.db.models import F, Model, Prefetch, ProtectedError, Q, RestrictedError
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
 from typing_extensions import get_type_hints
 
 from nautobot_ssot.contrib.types import (
-    CustomFieldAnnotation,
     CustomRelationshipAnnotation,
+    FieldKindEnum,
     RelationshipSideEnum,
 )
 
@@ -33,6 +43,35 @@ from nautobot_ssot.contrib.types import (
 # )
 ParameterSet = FrozenSet[Tuple[str, Hashable]]
 
+# Returned by parameter loaders when the parameter should be left at its default value, see
+# `NautobotAdapter._build_parameter_loader`.
+_SKIP_PARAMETER = object()
+
+
+@dataclass
+class BulkOperation:
+    """A create, update or delete of an ORM object, queued by a `NautobotModel` while its adapter is in bulk mode."""
+
+    action: str
+    diffsync_object: DiffSyncModel
+    obj: Optional[Model]
+    parameters: Dict
+    # Values of the concrete fields of an updated object before any parameters were applied to it.
+    initial_values: Dict = field(default_factory=dict)
+    # Values of the updated attributes of the diffsync object before the update, restored if the update fails.
+    initial_attrs: Dict = field(default_factory=dict)
+    # Relationship fields which can only be set once the object has been written to the database.
+    relationship_fields: Optional[Dict] = None
+
+    def changed_fields(self) -> List[str]:
+        """Return the names of the concrete fields of an updated object whose values have changed."""
+        return [
+            model_field.name
+            for model_field in self.obj._meta.concrete_fields
+            if not model_field.primary_key
+            and getattr(self.obj, model_field.attname) != self.initial_values.get(model_field.attname)
+        ]
+
 
 class NautobotAdapter(Adapter):
     """
@@ -41,35 +80,479 @@ class NautobotAdapter(Adapter):
     This adapter is able to infer how to load data from Nautobot based on how the models attached to it are defined.
     """
 
-    # This dictionary acts as an ORM cache.
-    _cache: DefaultDict[str, Dict[ParameterSet, Model]]
-    _cache_hits: DefaultDict[str, int] = defaultdict(int)
+    # The ORM cache, mapping `(model label, parameter set)` to the ORM object, in least recently used order.
+    _cache: "OrderedDict[Tuple[str, ParameterSet], Model]"
+    # Cache hits, misses and evictions by model label, see `orm_cache_statistics`.
+    _cache_hits: DefaultDict[str, int]
+    _cache_misses: DefaultDict[str, int]
+    _cache_evictions: DefaultDict[str, int]
+
+    # Maximum number of objects held in the ORM cache, the least recently used objects are evicted beyond it.
+    orm_cache_max_size = 10000
+    # Small lookup models to preload into the ORM cache at the start of `load`, with the fields they are looked up
+    # by, e.g. `{Status: ("name",), Role: ("name",)}`. See `warm_orm_cache`.
+    orm_cache_warm_up: Dict[Type[Model], Tuple[str, ...]] = {}
+
+    # Whether to load the objects referenced by the creates and updates of a sync in bulk before it starts, see
+    # `resolve_related_objects`, and how many of them to load per query.
+    resolve_related_objects_in_bulk = True
+    related_object_batch_size = 500
+
+    # When enabled, creates and updates are queued during the sync and written with `bulk_create`/`bulk_update` once
+    # the sync is otherwise complete. See the "Bulk Writes" section of the performance documentation for the caveats.
+    bulk_write = False
+    # Maximum number of objects written by a single `bulk_create`/`bulk_update` query.
+    bulk_write_batch_size = 250
+
+    # When enabled, deletes are deferred during the sync and executed with a single `filter(pk__in=...).delete()` per
+    # model once the sync is otherwise complete, children before their parents and in reverse `top_level` order.
+    bulk_delete = False
+    # Maximum number of objects deleted by a single query.
+    bulk_delete_batch_size = 1000
 
     def __init__(self, *args, job, sync=None, **kwargs):
         """Instantiate this class, but do not load data immediately from the local system."""
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
+        # Time taken (in seconds) to load each top level model, including its children.
+        self.load_statistics = {}
+        self._bulk_operations: List[BulkOperation] = []
+        # Deferred deletes by diffsync model name, see `queue_bulk_delete`.
+        self._bulk_deletes: DefaultDict[str, List[DiffSyncModel]] = defaultdict(list)
+        # Descendants of the objects with deferred deletes by type and unique ID, which DiffSync removes from the
+        # adapter together with them, see `queue_bulk_delete`.
+        self._bulk_delete_descendants: Dict[Tuple[str, str], List[DiffSyncModel]] = {}
+        # Specialized loader functions per diffsync model class and parameter name.
+        self._parameter_loaders: Dict[Type, Dict[str, Callable]] = {}
+        # Children field, diffsync class and parameter names of the child models per diffsync model class.
+        self._children_models: Dict[Type, List[Tuple[str, Type, List[str]]]] = {}
+        # Custom relationship associations by relationship label and side, see `_get_relationship_associations`.
+        self._relationship_associations: Dict[Tuple[str, RelationshipSideEnum], Dict[Hashable, List]] = {}
+        # Whether each diffsync model class can be loaded from `values_list` rows, see `_can_load_values`.
+        self._values_loadable: Dict[Type, bool] = {}
         self.invalidate_cache()
 
     def invalidate_cache(self, zero_out_hits=True):
         """Invalidates all the objects in the ORM cache."""
-        self._cache = defaultdict(dict)
+        self._cache = OrderedDict()
         if zero_out_hits:
             self._cache_hits = defaultdict(int)
+            self._cache_misses = defaultdict(int)
+            self._cache_evictions = defaultdict(int)
 
     def get_from_orm_cache(self, parameters: Dict, model_class: Type[Model]):
         """Retrieve an object from the ORM or the cache."""
-        parameter_set = frozenset(parameters.items())
-        content_type = ContentType.objects.get_for_model(model_class)
-        model_cache_key = f"{content_type.app_label}.{content_type.model}"
-        if cached_object := self._cache[model_cache_key].get(parameter_set):
-            self._cache_hits[model_cache_key] += 1
+        model_label = model_class._meta.label_lower
+        cache_key = (model_label, frozenset(parameters.items()))
+        cached_object = self._cache.get(cache_key)
+        if cached_object is not None:
+            self._cache.move_to_end(cache_key)
+            self._cache_hits[model_label] += 1
             return cached_object
+        self._cache_misses[model_label] += 1
         # As we are using `get` here, this will error if there is not exactly one object that corresponds to the
         # parameter set. We intentionally pass these errors through.
-        self._cache[model_cache_key][parameter_set] = model_class.objects.get(**dict(parameter_set))
-        return self._cache[model_cache_key][parameter_set]
+        database_object = model_class.objects.get(**parameters)
+        self._add_to_orm_cache(cache_key, database_object)
+        return database_object
+
+    def _add_to_orm_cache(self, cache_key, database_object):
+        """Add an object to the ORM cache, evicting the least recently used objects beyond its maximum size."""
+        self._cache[cache_key] = database_object
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.orm_cache_max_size:
+            (evicted_model_label, _), _ = self._cache.popitem(last=False)
+            self._cache_evictions[evicted_model_label] += 1
+
+    def _evict_from_orm_cache(self, database_object):
+        """Remove all entries for the given object from the ORM cache."""
+        model_label = database_object._meta.label_lower
+        for cache_key in [
+            cache_key
+            for cache_key, cached_object in self._cache.items()
+            if cache_key[0] == model_label and cached_object.pk == database_object.pk
+        ]:
+            del self._cache[cache_key]
+
+    def warm_orm_cache(self, model_class: Type[Model], lookup_fields=("name",), queryset=None):
+        """Preload all objects of a (small) model into the ORM cache with a single query.
+
+        Args:
+            model_class: The model whose objects to preload.
+            lookup_fields: The fields the objects are looked up by, e.g. `("name",)` to cache the objects for
+                `get_from_orm_cache({"name": ...}, model_class)`. Foreign keys may be given as `__` delimited lookups.
+            queryset: The queryset to load the objects from, all objects of the model by default.
+        """
+        if queryset is None:
+            queryset = model_class.objects.all()
+        model_label = model_class._meta.label_lower
+        for database_object in queryset:
+            parameters = {}
+            for field_name in lookup_fields:
+                if "__" in field_name:
+                    parameters[field_name] = self._handle_foreign_key(database_object, field_name)
+                else:
+                    parameters[field_name] = getattr(database_object, field_name)
+            self._add_to_orm_cache((model_label, frozenset(parameters.items())), database_object)
+
+    def orm_cache_statistics(self):
+        """Return the ORM cache hits, misses and evictions by model label.
+
+        Example:
+            {"extras.status": {"hit": 520, "miss": 3, "eviction": 0}}
+        """
+        return {
+            model_label: {
+                "hit": self._cache_hits[model_label],
+                "miss": self._cache_misses[model_label],
+                "eviction": self._cache_evictions[model_label],
+            }
+            for model_label in sorted({*self._cache_hits, *self._cache_misses, *self._cache_evictions})
+        }
+
+    def queue_bulk_operation(self, action, diffsync_object, obj, parameters):
+        """Queue the create or update of an ORM object until the bulk operations are flushed."""
+        initial_values = {}
+        initial_attrs = {}
+        if action == "update":
+            initial_values = {
+                model_field.attname: copy.deepcopy(getattr(obj, model_field.attname))
+                for model_field in obj._meta.concrete_fields
+            }
+            # The diffsync object is only updated once the operation has been queued.
+            initial_attrs = {name: copy.deepcopy(getattr(diffsync_object, name)) for name in parameters}
+        self._bulk_operations.append(
+            BulkOperation(action, diffsync_object, obj, parameters, initial_values, initial_attrs)
+        )
+
+    def queue_bulk_delete(self, diffsync_object):
+        """Defer the delete of the ORM object of a diffsync object until the bulk deletes are flushed."""
+        self._bulk_deletes[diffsync_object.get_type()].append(diffsync_object)
+        # DiffSync removes the children along with the object, keep them to restore them if the delete fails.
+        self._bulk_delete_descendants[(diffsync_object.get_type(), diffsync_object.get_unique_id())] = list(
+            self._iter_descendants(diffsync_object)
+        )
+
+    def _iter_descendants(self, diffsync_object):
+        """Yield the children of a diffsync object in this adapter, recursively, each before its own children."""
+        for child_type, child_field in diffsync_object._children.items():
+            for child_unique_id in getattr(diffsync_object, child_field):
+                try:
+                    child = self.get(child_type, child_unique_id)
+                except ObjectNotFound:
+                    continue
+                yield child
+                yield from self._iter_descendants(child)
+
+    def sync_from(self, source, diff_class=Diff, flags=DiffSyncFlags.NONE, callback=None, diff=None):
+        """Synchronize data from the given source, resolving the related objects of all changes in bulk beforehand."""
+        if diff is None:
+            diff = self.diff_from(source, diff_class=diff_class, flags=flags, callback=callback)
+        if self.resolve_related_objects_in_bulk:
+            self.resolve_related_objects(diff)
+        return super().sync_from(source, diff_class=diff_class, flags=flags, callback=callback, diff=diff)
+
+    def resolve_related_objects(self, diff):
+        """Load the objects referenced by the creates and updates of a diff into the ORM cache in bulk.
+
+        The foreign key and to-many parameters of all objects to create or update are collected per related model, and
+        the related objects are then loaded with one query per `related_object_batch_size` objects, rather than one
+        query per related object as the objects are created or updated.
+
+        Preloading stops once the ORM cache is full, as further objects would only evict the ones preloaded before them
+        (or the ones from `warm_orm_cache`) before they are used. The remaining related objects are looked up one by
+        one as the objects are created or updated.
+        """
+        related_parameters = defaultdict(set)
+        self._collect_related_parameters(diff.get_children(), related_parameters)
+        capacity = self.orm_cache_max_size - len(self._cache)
+        for related_model, parameter_sets in related_parameters.items():
+            model_label = related_model._meta.label_lower
+            parameter_sets_by_lookups = defaultdict(list)
+            for parameter_set in parameter_sets:
+                if (model_label, parameter_set) not in self._cache:
+                    lookups = tuple(sorted(lookup for lookup, _ in parameter_set))
+                    parameter_sets_by_lookups[lookups].append(parameter_set)
+            for lookups, uncached_parameter_sets in parameter_sets_by_lookups.items():
+                for start in range(0, len(uncached_parameter_sets), self.related_object_batch_size):
+                    if capacity <= 0:
+                        return
+                    batch = uncached_parameter_sets[start : start + min(self.related_object_batch_size, capacity)]
+                    capacity -= len(batch)
+                    self._resolve_parameter_sets(related_model, lookups, batch)
+
+    def _collect_related_parameters(self, diff_elements, related_parameters):
+        """Collect the parameter sets of the related objects of the given diff elements and their children."""
+        for element in diff_elements:
+            if element.action == DiffSyncActions.CREATE:
+                parameters = {**element.keys, **element.source_attrs}
+            elif element.action == DiffSyncActions.UPDATE:
+                parameters = element.get_attrs_diffs().get("+", {})
+            else:
+                parameters = {}
+            diffsync_model = getattr(self, element.type, None)
+            if parameters and hasattr(diffsync_model, "_get_field_plan"):
+                self._collect_model_related_parameters(diffsync_model, parameters, related_parameters)
+            self._collect_related_parameters(element.get_children(), related_parameters)
+
+    @staticmethod
+    def _collect_model_related_parameters(diffsync_model, parameters, related_parameters):
+        """Collect the parameter sets of the related objects referenced by the parameters of a single object."""
+        foreign_keys = defaultdict(dict)
+        for parameter_name, value in parameters.items():
+            try:
+                field_plan = diffsync_model._get_field_plan(parameter_name)
+            except (KeyError, FieldDoesNotExist):
+                continue
+            try:
+                if field_plan.kind == FieldKindEnum.FOREIGN_KEY:
+                    foreign_keys[field_plan.related_field][field_plan.lookup] = value
+                elif field_plan.kind == FieldKindEnum.TO_MANY and value:
+                    related_model = diffsync_model._model._meta.get_field(parameter_name).related_model
+                    related_parameters[related_model].update(frozenset(item.items()) for item in value)
+            except TypeError:
+                # Unhashable values can't be cached anyway.
+                continue
+        for related_field, lookups in foreign_keys.items():
+            related_model = diffsync_model._model._meta.get_field(related_field).related_model
+            # Generic foreign keys and foreign keys set to None don't need to be resolved.
+            if related_model is None or not any(lookups.values()):
+                continue
+            try:
+                related_parameters[related_model].add(frozenset(lookups.items()))
+            except TypeError:
+                continue
+
+    def _resolve_parameter_sets(self, related_model, lookups, parameter_sets):
+        """Load the objects matching any of the given parameter sets with one query and add them to the ORM cache."""
+        if len(lookups) == 1:
+            query = Q(**{f"{lookups[0]}__in": [dict(parameter_set)[lookups[0]] for parameter_set in parameter_sets]})
+        else:
+            query = functools.reduce(operator.or_, (Q(**dict(parameter_set)) for parameter_set in parameter_sets))
+        annotations = {f"_ssot_lookup_{index}": F(lookup) for index, lookup in enumerate(lookups)}
+        try:
+            # On Postgres, a failing query aborts the surrounding transaction unless it runs in a savepoint.
+            with transaction.atomic():
+                related_objects = list(related_model.objects.filter(query).annotate(**annotations))
+        except (DataError, FieldError, ValueError, ValidationError):
+            # E.g. a malformed identifier in one of the parameter sets. The objects will be looked up one by one as
+            # before, reporting the error where it belongs.
+            return
+        matches = defaultdict(list)
+        for related_object in related_objects:
+            values = (getattr(related_object, annotation) for annotation in annotations)
+            matches[frozenset(zip(lookups, values))].append(related_object)
+        model_label = related_model._meta.label_lower
+        for parameter_set in parameter_sets:
+            # Parameter sets matching no or multiple objects are left to `get_from_orm_cache` to raise the error.
+            if len(matches.get(parameter_set, [])) == 1:
+                self._add_to_orm_cache((model_label, parameter_set), matches[parameter_set][0])
+
+    def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
+        """Write the queued bulk operations and deletes once all the changes of the sync have been processed."""
+        self.flush_bulk_operations(logger)
+        self.flush_bulk_deletes(logger)
+        super().sync_complete(source, diff, flags=flags, logger=logger)
+
+    def flush_bulk_operations(self, logger=None):
+        """Validate and write all queued bulk operations to the database.
+
+        Operations are grouped per model and written in the order of `top_level`, with parents (as per `_children`)
+        written before their children, creates before updates. Each group is written with one bulk query per
+        `bulk_write_batch_size` objects. Models that aren't reachable from `top_level` are written last.
+
+        Operations that fail are reported through the DiffSync `logger` with a failure status, like failures to
+        create or update an object outside of bulk write mode.
+        """
+        operations, self._bulk_operations = self._bulk_operations, []
+        groups = defaultdict(list)
+        for operation in operations:
+            groups[(operation.diffsync_object.get_type(), operation.action)].append(operation)
+        model_names = [*self._get_model_names_in_order(), *(model_name for model_name, _ in groups)]
+        for model_name in dict.fromkeys(model_names):
+            for action in ("create", "update"):
+                self._write_bulk_group(groups.pop((model_name, action), []), logger)
+
+    def _write_bulk_group(self, operations, logger):
+        """Prepare and write the queued operations of a single model and action in batches."""
+        batch = []
+        for operation in operations:
+            if len(batch) >= self.bulk_write_batch_size:
+                self._write_bulk_batch(batch, logger)
+                batch = []
+            try:
+                self._prepare_bulk_operation(operation)
+            except ObjectCrudException as error:
+                if not batch:
+                    self._report_bulk_failure(operation, error, logger)
+                    continue
+                # The object may refer to an object of the same model from the current batch, e.g. its parent
+                # location, which hasn't been written yet.
+                self._write_bulk_batch(batch, logger)
+                batch = []
+                try:
+                    self._prepare_bulk_operation(operation)
+                except ObjectCrudException as retry_error:
+                    self._report_bulk_failure(operation, retry_error, logger)
+                    continue
+            batch.append(operation)
+        if batch:
+            self._write_bulk_batch(batch, logger)
+
+    def flush_bulk_deletes(self, logger=None):
+        """Delete the ORM objects of all deferred deletes with one query per model.
+
+        Models are deleted in the reverse order of `top_level`, with children (as per `_children`) deleted before their
+        parents. When the objects of a model can't be deleted together because some of them are protected by other
+        objects (through `on_delete=PROTECT` or `on_delete=RESTRICT`), they are deleted one by one instead and each
+        protected object is reported through the DiffSync `logger` with a failure status, like failures to delete an
+        object outside of bulk delete mode. Protected objects are added back to the adapter, together with those of
+        their children which still exist in the database.
+        """
+        deletes, self._bulk_deletes = self._bulk_deletes, defaultdict(list)
+        # Models that aren't reachable from `top_level` are deleted last.
+        for model_name in [*reversed(self._get_model_names_in_order()), *deletes]:
+            diffsync_objects = deletes.pop(model_name, [])
+            for start in range(0, len(diffsync_objects), self.bulk_delete_batch_size):
+                self._delete_bulk_batch(diffsync_objects[start : start + self.bulk_delete_batch_size], logger)
+        self._bulk_delete_descendants = {}
+
+    def _delete_bulk_batch(self, diffsync_objects, logger):
+        """Delete the ORM objects of a batch of diffsync objects of the same model."""
+        model_class = diffsync_objects[0]._model
+        try:
+            with transaction.atomic():
+                model_class.objects.filter(pk__in=[diffsync_object.pk for diffsync_object in diffsync_objects]).delete()
+            return
+        except (ProtectedError, RestrictedError):
+            pass
+        # Find the protected objects by deleting them one by one.
+        for diffsync_object in diffsync_objects:
+            try:
+                with transaction.atomic():
+                    model_class.objects.filter(pk=diffsync_object.pk).delete()
+            except (ProtectedError, RestrictedError):
+                operation = BulkOperation("delete", diffsync_object, None, diffsync_object.get_attrs())
+                self._report_bulk_failure(operation, "The object is referenced by another object", logger)
+
+    def _get_model_names_in_order(self):
+        """Return the names of all diffsync models of this adapter, each top level model followed by its children."""
+        model_names = []
+
+        def add_model_name(model_name):
+            if model_name in model_names:
+                return
+            model_names.append(model_name)
+            for child_model_name in getattr(self, model_name)._children.values():
+                add_model_name(child_model_name)
+
+        for model_name in self.top_level:
+            add_model_name(model_name)
+        return model_names
+
+    def _prepare_bulk_operation(self, operation):
+        """Apply the parameters of a queued operation to its ORM object and validate it."""
+        diffsync_class = type(operation.diffsync_object)
+        operation.relationship_fields = diffsync_class._set_fields_and_foreign_keys(
+            operation.obj, operation.parameters, self
+        )
+        try:
+            operation.obj.full_clean()
+        except ValidationError as error:
+            raise ObjectCrudException(
+                f"Validation failed for Django object:\n{error}\nParameters: {operation.parameters}"
+            ) from error
+
+    def _write_bulk_batch(self, batch, logger):
+        """Write a batch of prepared operations sharing the same action and model class."""
+        model_class = type(batch[0].obj)
+
+        def write(operations):
+            with transaction.atomic():
+                if operations[0].action == "create":
+                    model_class.objects.bulk_create([operation.obj for operation in operations])
+                    return
+                fields = {name for operation in operations for name in operation.changed_fields()}
+                if fields:
+                    model_class.objects.bulk_update([operation.obj for operation in operations], fields)
+
+        try:
+            write(batch)
+            written = batch
+        except IntegrityError:
+            # Find the offending objects by writing them one by one.
+            written = []
+            for operation in batch:
+                try:
+                    write([operation])
+                except IntegrityError as error:
+                    self._report_bulk_failure(operation, error, logger)
+                    continue
+                written.append(operation)
+
+        for operation in written:
+            try:
+                type(operation.diffsync_object)._set_relationship_fields(
+                    operation.relationship_fields, operation.obj, self
+                )
+            except ObjectCrudException as error:
+                self._report_bulk_failure(operation, error, logger)
+
+    def _report_bulk_failure(self, operation, error, logger):
+        """Report a failed bulk operation through the DiffSync logger and undo its change to the adapter."""
+        if logger is None:
+            logger = structlog.get_logger().new(src=None, dst=self, flags=None)
+        diffsync_object = operation.diffsync_object
+        logger.bind(
+            action=operation.action,
+            model=diffsync_object.get_type(),
+            unique_id=diffsync_object.get_unique_id(),
+            diffs={"-" if operation.action == "delete" else "+": operation.parameters},
+        ).warning(f"Bulk {operation.action} failed: {error}", status=DiffSyncStatus.FAILURE.value)
+        if operation.action == "create":
+            try:
+                self.remove(diffsync_object)
+            except ObjectNotFound:
+                pass
+        elif operation.action == "update":
+            for name, value in operation.initial_attrs.items():
+                setattr(diffsync_object, name, value)
+            # The ORM object holds the parameters that couldn't be written, don't hand it out from the cache anymore.
+            self._evict_from_orm_cache(operation.obj)
+        elif operation.action == "delete":
+            descendants = self._bulk_delete_descendants.get(
+                (diffsync_object.get_type(), diffsync_object.get_unique_id()), []
+            )
+            # Children deleted earlier in the flush, or along with other objects, are gone from the database.
+            restored_objects = [diffsync_object] + [
+                descendant for descendant in descendants if descendant._model.objects.filter(pk=descendant.pk).exists()
+            ]
+            for restored_object in restored_objects:
+                try:
+                    self.add(restored_object)
+                except ObjectAlreadyExists:
+                    pass
+            # Drop the deleted children from the restored objects.
+            for restored_object in restored_objects:
+                for child_type, child_field in restored_object._children.items():
+                    setattr(
+                        restored_object,
+                        child_field,
+                        [
+                            child_unique_id
+                            for child_unique_id in getattr(restored_object, child_field)
+                            if self._has_object(child_type, child_unique_id)
+                        ],
+                    )
+
+    def _has_object(self, model_name, unique_id):
+        """Determine whether the adapter holds the diffsync object of the given type and unique ID."""
+        try:
+            self.get(model_name, unique_id)
+        except ObjectNotFound:
+            return False
+        return True
 
     @staticmethod
     def _get_parameter_names(diffsync_model):
@@ -79,86 +562,163 @@ class NautobotAdapter(Adapter):
     def _load_objects(self, diffsync_model):
         """Given a diffsync model class, load a list of models from the database and return them."""
         parameter_names = self._get_parameter_names(diffsync_model)
-        for database_object in diffsync_model._get_queryset():
+        if self._can_load_values(diffsync_model, parameter_names):
+            # `prefetch_related` doesn't apply to `values_list` querysets, and joins are built from the lookups anyway.
+            queryset = diffsync_model._get_queryset().prefetch_related(None)
+            for pk, *values in queryset.values_list("pk", *parameter_names):
+                parameters = dict(zip(parameter_names, values))
+                parameters["pk"] = pk
+                self._add_loaded_object(diffsync_model, parameters)
+            return
+        queryset = diffsync_model._get_queryset().prefetch_related(*self._get_children_prefetches(diffsync_model))
+        for database_object in queryset:
             self._load_single_object(database_object, diffsync_model, parameter_names)
 
-    def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
-        type_hints = get_type_hints(diffsync_model, include_extras=True)
-        # Handle custom fields and custom relationships. See CustomFieldAnnotation and CustomRelationshipAnnotation
-        # docstrings for more details.
-        is_custom_field = False
-        custom_relationship_annotation = None
-        metadata_for_this_field = getattr(type_hints[parameter_name], "__metadata__", [])
-        for metadata in metadata_for_this_field:
-            if isinstance(metadata, CustomFieldAnnotation):
-                if metadata.name in database_object.cf:
-                    parameters[parameter_name] = database_object.cf[metadata.key]
-                is_custom_field = True
-                break
-            if isinstance(metadata, CustomRelationshipAnnotation):
-                custom_relationship_annotation = metadata
-                break
-        if is_custom_field:
-            return
+    def _get_children_prefetches(self, diffsync_model):
+        """Get the prefetches loading the children of a diffsync model, and recursively their children."""
+        prefetches = []
+        for children_field, diffsync_model_child, _ in self._get_children_models(diffsync_model):
+            queryset = diffsync_model_child._add_related_lookups(diffsync_model_child._model.objects.all())
+            queryset = queryset.prefetch_related(*self._get_children_prefetches(diffsync_model_child))
+            prefetches.append(Prefetch(children_field, queryset=queryset))
+        return prefetches
+
+    def _can_load_values(self, diffsync_model, parameter_names):
+        """Determine whether the diffsync model can be loaded from `values_list` rows rather than model instances.
+
+        This is the case if all of its parameters are concrete fields of the model, or forward foreign key paths
+        ending in a concrete field of the related model, and neither the model has children nor the adapter
+        customizes how the parameters are loaded, be it through `_load_single_object`, `_handle_single_parameter`,
+        `_handle_foreign_key` or `load_param_` methods.
+        """
+        if diffsync_model not in self._values_loadable:
+            self._values_loadable[diffsync_model] = (
+                not diffsync_model._children
+                and type(self)._load_single_object is NautobotAdapter._load_single_object
+                and type(self)._handle_single_parameter is NautobotAdapter._handle_single_parameter
+                and type(self)._handle_foreign_key is NautobotAdapter._handle_foreign_key
+                and all(self._is_values_lookup(diffsync_model, parameter_name) for parameter_name in parameter_names)
+            )
+        return self._values_loadable[diffsync_model]
 
-        # Handling of foreign keys where the local side is the many and the remote side the one.
-        # Note: This includes the side of a generic foreign key that has the foreign key, i.e.
-        # the 'many' side.
-        if "__" in parameter_name:
-            if custom_relationship_annotation:
-                parameters[parameter_name] = self._handle_custom_relationship_foreign_key(
-                    database_object, parameter_name, custom_relationship_annotation
-                )
-            else:
-                parameters[parameter_name] = self._handle_foreign_key(database_object, parameter_name)
-            return
+    def _is_values_lookup(self, diffsync_model, parameter_name):
+        """Determine whether a parameter can be loaded as a `values_list` lookup of the same name."""
+        if hasattr(self, f"load_param_{parameter_name}"):
+            return False
+        if diffsync_model._get_field_plan(parameter_name).kind not in (FieldKindEnum.NORMAL, FieldKindEnum.FOREIGN_KEY):
+            return False
+        model = diffsync_model._model
+        *related_fields, last_field = parameter_name.split("__")
+        try:
+            for related_field in related_fields:
+                django_field = model._meta.get_field(related_field)
+                # Only forward foreign keys, no reverse relations (which would multiply the rows) or generic
+                # foreign keys (which can't be joined).
+                if not (django_field.many_to_one or django_field.one_to_one) or not django_field.concrete:
+                    return False
+                model = django_field.related_model
+            django_field = model._meta.get_field(last_field)
+        except FieldDoesNotExist:
+            # Properties and other attributes which aren't database fields.
+            return False
+        # Relation fields would load the primary key rather than the related object.
+        return django_field.concrete and not django_field.is_relation
 
-        # Handling of one- and many-to custom relationship fields:
-        if custom_relationship_annotation:
-            parameters[parameter_name] = self._handle_custom_relationship_to_many_relationship(
-                database_object, diffsync_model, parameter_name, custom_relationship_annotation
-            )
-            return
+    def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
+        """Load a single parameter from a database object into `parameters`, using the loader built for the model."""
+        value = self._get_parameter_loader(parameter_name, diffsync_model)(database_object)
+        if value is not _SKIP_PARAMETER:
+            parameters[parameter_name] = value
+
+    def _get_parameter_loader(self, parameter_name, diffsync_model):
+        """Return the function loading the given parameter of the diffsync model, building it on first use."""
+        loaders = self._parameter_loaders.setdefault(diffsync_model, {})
+        if parameter_name not in loaders:
+            loaders[parameter_name] = self._build_parameter_loader(parameter_name, diffsync_model)
+        return loaders[parameter_name]
+
+    def _build_parameter_loader(self, parameter_name, diffsync_model):
+        """Build a function loading the given parameter from a database object.
+
+        This resolves how the parameter is loaded (see `FieldKindEnum`) once per model rather than for every loaded
+        object. The returned function takes the database object and returns the parameter value, or `_SKIP_PARAMETER`
+        if the parameter should be left at its default value.
+        """
+        field_plan = diffsync_model._get_field_plan(parameter_name)
+        annotation = field_plan.annotation
 
-        database_field = diffsync_model._model._meta.get_field(parameter_name)
+        if field_plan.kind == FieldKindEnum.CUSTOM_FIELD:
 
-        # Handling of one- and many-to-many non-custom relationship fields.
-        # Note: This includes the side of a generic foreign key that constitutes the foreign key,
-        # i.e. the 'one' side.
-        if database_field.many_to_many or database_field.one_to_many:
-            parameters[parameter_name] = self._handle_to_many_relationship(
+            def load_custom_field(database_object):
+                if annotation.name in database_object.cf:
+                    return database_object.cf[annotation.key]
+                return _SKIP_PARAMETER
+
+            return load_custom_field
+        if field_plan.kind == FieldKindEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY:
+            return lambda database_object: self._handle_custom_relationship_foreign_key(
+                database_object, parameter_name, annotation
+            )
+        if field_plan.kind == FieldKindEnum.FOREIGN_KEY:
+            return functools.partial(self._handle_foreign_key, parameter_name=parameter_name)
+        if field_plan.kind == FieldKindEnum.CUSTOM_RELATIONSHIP_TO_MANY:
+            return lambda database_object: self._handle_custom_relationship_to_many_relationship(
+                database_object, diffsync_model, parameter_name, annotation
+            )
+        if field_plan.kind == FieldKindEnum.TO_MANY:
+            return lambda database_object: self._handle_to_many_relationship(
                 database_object, diffsync_model, parameter_name
             )
-            return
-
-        # Handling of normal fields - as this is the default case, set the attribute directly.
         if hasattr(self, f"load_param_{parameter_name}"):
-            parameters[parameter_name] = getattr(self, f"load_param_{parameter_name}")(parameter_name, database_object)
-        else:
-            parameters[parameter_name] = getattr(database_object, parameter_name)
+            return functools.partial(getattr(self, f"load_param_{parameter_name}"), parameter_name)
+        return operator.attrgetter(parameter_name)
 
     def _load_single_object(self, database_object, diffsync_model, parameter_names):
         """Load a single diffsync object from a single database object."""
         parameters = {}
-        for parameter_name in parameter_names:
-            self._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+        if type(self)._handle_single_parameter is not NautobotAdapter._handle_single_parameter:
+            # Respect subclasses customizing the generic parameter handling.
+            for parameter_name in parameter_names:
+                self._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+        else:
+            for parameter_name in parameter_names:
+                value = self._get_parameter_loader(parameter_name, diffsync_model)(database_object)
+                if value is not _SKIP_PARAMETER:
+                    parameters[parameter_name] = value
         parameters["pk"] = database_object.pk
+        diffsync_model = self._add_loaded_object(diffsync_model, parameters)
+
+        self._handle_children(database_object, diffsync_model)
+        return diffsync_model
+
+    def _add_loaded_object(self, diffsync_model, parameters):
+        """Instantiate a diffsync object from the loaded parameters and add it to the adapter."""
         try:
             diffsync_model = diffsync_model(**parameters)
         except pydantic.ValidationError as error:
             raise ValueError(f"Parameters: {parameters}") from error
         self.add(diffsync_model)
-
-        self._handle_children(database_object, diffsync_model)
         return diffsync_model
 
-    def _handle_children(self, database_object, diffsync_model):
-        """Recurse through all the children for this model."""
-        for children_parameter, children_field in diffsync_model._children.items():
-            children = getattr(database_object, children_field).all()
-            diffsync_model_child = self._get_diffsync_class(model_name=children_parameter)
-            for child in children:
+    def _get_children_models(self, diffsync_model):
+        """Get the children field, diffsync class and parameter names of each child model of a diffsync model."""
+        if diffsync_model not in self._children_models:
+            children_models = []
+            for children_parameter, children_field in diffsync_model._children.items():
+                diffsync_model_child = self._get_diffsync_class(model_name=children_parameter)
                 parameter_names = self._get_parameter_names(diffsync_model_child)
+                children_models.append((children_field, diffsync_model_child, parameter_names))
+            self._children_models[diffsync_model] = children_models
+        return self._children_models[diffsync_model]
+
+    def _handle_children(self, database_object, diffsync_model):
+        """Recurse through all the children for this model.
+
+        The children of all objects loaded by `_load_objects` are prefetched with one query per child model (see
+        `_get_children_prefetches`), so this doesn't hit the database.
+        """
+        for children_field, diffsync_model_child, parameter_names in self._get_children_models(type(diffsync_model)):
+            for child in getattr(database_object, children_field).all():
                 child_diffsync_object = self._load_single_object(child, diffsync_model_child, parameter_names)
                 diffsync_model.add_child(child_diffsync_object)
 
@@ -167,12 +727,19 @@ class NautobotAdapter(Adapter):
         if not hasattr(self, "top_level") or not self.top_level:
             raise ValueError("'top_level' needs to be set on the class.")
 
+        self.load_statistics = {}
+        self._relationship_associations = {}
+        for model_class, lookup_fields in self.orm_cache_warm_up.items():
+            self.warm_orm_cache(model_class, lookup_fields)
         for model_name in self.top_level:
             diffsync_model = self._get_diffsync_class(model_name)
 
+            start_time = time.perf_counter()
             # This function directly mutates the diffsync store, i.e. it will create and load the objects
             # for this specific model class as well as its children without returning anything.
             self._load_objects(diffsync_model)
+            # The time spent loading children is included in that of their top level model.
+            self.load_statistics[model_name] = time.perf_counter() - start_time
 
     def _get_diffsync_class(self, model_name):
         """Given a model name, return the diffsync class."""
@@ -187,17 +754,13 @@ class NautobotAdapter(Adapter):
     def _handle_custom_relationship_to_many_relationship(
         self, database_object, diffsync_model, parameter_name, annotation
     ):
-        # Introspect type annotations to deduce which fields are of interest
+        # The field plan holds the typed dict describing which fields are of interest
         # for this many-to-many relationship.
-        diffsync_field_type = get_type_hints(diffsync_model)[parameter_name]
-        inner_type = get_args(diffsync_field_type)[0]
+        field_plan = diffsync_model._get_field_plan(parameter_name)
         related_objects_list = []
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
         relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
-        relationship_association_parameters = self._construct_relationship_association_parameters(
-            annotation, database_object
-        )
-        relationship_associations = RelationshipAssociation.objects.filter(**relationship_association_parameters)
+        relationship_associations = self._get_relationship_associations(annotation, database_object)
 
         field_name = ""
         field_name += "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
@@ -218,7 +781,9 @@ class NautobotAdapter(Adapter):
             related_object = getattr(
                 association, "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
             )
-            dictionary_representation = self._handle_typed_dict(inner_type, related_object)
+            dictionary_representation = self._handle_typed_dict(
+                field_plan.inner_type, related_object, field_plan.inner_fields
+            )
             # Only use those where there is a single field defined, all 'None's will not help us.
             if any(dictionary_representation.values()):
                 related_objects_list.append(dictionary_representation)
@@ -241,22 +806,47 @@ class NautobotAdapter(Adapter):
         return related_objects_list
 
     @classmethod
-    def _handle_typed_dict(cls, inner_type, related_object):
+    def _handle_typed_dict(cls, inner_type, related_object, field_names=None):
         """Handle a typed dict for many to many relationships.
 
         Args:
             inner_type: The typed dict.
             related_object: The related object
+            field_names: The names of the fields of the typed dict, if already known.
         Returns: The dictionary representation of `related_object` as described by `inner_type`.
         """
         dictionary_representation = {}
-        for field_name in get_type_hints(inner_type):
+        for field_name in field_names or get_type_hints(inner_type):
             if "__" in field_name:
                 dictionary_representation[field_name] = cls._handle_foreign_key(related_object, field_name)
                 continue
             dictionary_representation[field_name] = getattr(related_object, field_name)
         return dictionary_representation
 
+    def _get_relationship_associations(self, annotation, database_object):
+        """Get the associations of a database object on the annotated side of a custom relationship.
+
+        On first use, the associations of all objects for this relationship and side are loaded in a single query and
+        indexed by the ID of the object on that side, so that further lookups are served from memory.
+        """
+        key = (annotation.name, annotation.side)
+        if key not in self._relationship_associations:
+            relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
+            if annotation.side == RelationshipSideEnum.SOURCE:
+                own_side, other_side = "source", "destination"
+            else:
+                own_side, other_side = "destination", "source"
+            associations = defaultdict(list)
+            queryset = RelationshipAssociation.objects.filter(
+                relationship=relationship,
+                source_type=relationship.source_type,
+                destination_type=relationship.destination_type,
+            ).prefetch_related(other_side)
+            for association in queryset:
+                associations[getattr(association, f"{own_side}_id")].append(association)
+            self._relationship_associations[key] = associations
+        return self._relationship_associations[key].get(database_object.id, [])
+
     def _construct_relationship_association_parameters(self, annotation, database_object):
         relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
         relationship_association_parameters = {
@@ -320,13 +910,15 @@ class NautobotAdapter(Adapter):
         ]
         ```
         """
-        # Introspect type annotations to deduce which fields are of interest
+        # The field plan holds the typed dict describing which fields are of interest
         # for this many-to-many relationship.
-        inner_type = get_args(get_type_hints(diffsync_model)[parameter_name])[0]
+        field_plan = diffsync_model._get_field_plan(parameter_name)
         related_objects_list = []
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
         for related_object in getattr(database_object, parameter_name).all():
-            dictionary_representation = NautobotAdapter._handle_typed_dict(inner_type, related_object)
+            dictionary_representation = NautobotAdapter._handle_typed_dict(
+                field_plan.inner_type, related_object, field_plan.inner_fields
+            )
             # Only use those where there is a single field defined, all 'None's will not help us.
             if any(dictionary_representation.values()):
                 related_objects_list.append(dictionary_representation)
@@ -336,16 +928,12 @@ class NautobotAdapter(Adapter):
         self, database_object, parameter_name: str, annotation: CustomRelationshipAnnotation
     ):
         """Handle a single custom relationship foreign key field."""
-        relationship_association_parameters = self._construct_relationship_association_parameters(
-            annotation, database_object
-        )
-
-        relationship_association = RelationshipAssociation.objects.filter(**relationship_association_parameters)
-        amount_of_relationship_associations = relationship_association.count()
+        relationship_associations = self._get_relationship_associations(annotation, database_object)
+        amount_of_relationship_associations = len(relationship_associations)
         if amount_of_relationship_associations == 0:
             return None
         if amount_of_relationship_associations == 1:
-            association = relationship_association.first()
+            association = relationship_associations[0]
             related_object = getattr(
                 association, "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
             )
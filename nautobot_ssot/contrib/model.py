@@ -3,15 +3,16 @@
 # pylint: disable=protected-access
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
+import weakref
 from collections import defaultdict
-from typing import ClassVar, Optional
+from typing import ClassVar, Optional, get_args
 from uuid import UUID
 
 from diffsync import DiffSyncModel
 from diffsync.exceptions import ObjectCrudException, ObjectNotCreated, ObjectNotDeleted, ObjectNotUpdated
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import MultipleObjectsReturned, ValidationError
-from django.db.models import Model, ProtectedError
+from django.core.exceptions import FieldDoesNotExist, MultipleObjectsReturned, ValidationError
+from django.db.models import ManyToManyField, ManyToManyRel, ManyToOneRel, Model, Prefetch, ProtectedError
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
 from typing_extensions import get_type_hints
@@ -19,9 +20,78 @@ from typing_extensions import get_type_hints
 from nautobot_ssot.contrib.types import (
     CustomFieldAnnotation,
     CustomRelationshipAnnotation,
+    FieldKindEnum,
+    FieldPlan,
     RelationshipSideEnum,
 )
 
+# The field plans of each NautobotModel subclass by field name, see `NautobotModel._get_field_plan`.
+_field_plans = weakref.WeakKeyDictionary()
+
+
+def _plan_foreign_key_path(model, lookup):
+    """Split the related fields of a `__` delimited lookup into a path to join and a path to prefetch.
+
+    Forward foreign keys can be joined, whereas a generic foreign key along the way can only be prefetched.
+    Returns a tuple of the path to pass to `select_related` and the one to pass to `prefetch_related`, either of which
+    may be empty.
+    """
+    joined = []
+    for related_field in lookup.split("__")[:-1]:
+        try:
+            django_field = model._meta.get_field(related_field)
+        except FieldDoesNotExist:
+            break
+        if not django_field.is_relation or not (django_field.many_to_one or django_field.one_to_one):
+            break
+        if django_field.related_model is None:
+            # Generic foreign key
+            return "__".join(joined), "__".join(joined + [related_field])
+        if not django_field.concrete:
+            break
+        joined.append(related_field)
+        model = django_field.related_model
+    return "__".join(joined), ""
+
+
+def _is_concrete_field(model, lookup):
+    """Determine whether a `__` delimited lookup of forward foreign keys ends in a database field."""
+    *related_fields, last_field = lookup.split("__")
+    try:
+        for related_field in related_fields:
+            model = model._meta.get_field(related_field).related_model
+        return model._meta.get_field(last_field).concrete
+    except FieldDoesNotExist:
+        return False
+
+
+def _plan_to_many_prefetch(model, field_plan):
+    """Build the prefetch of a to-many field, only loading the fields of its typed dict."""
+    django_field = model._meta.get_field(field_plan.name)
+    # Other to-many fields, such as generic relations or tags, don't support custom prefetch querysets.
+    if not isinstance(django_field, (ManyToManyField, ManyToManyRel, ManyToOneRel)):
+        return field_plan.name
+    related_model = django_field.related_model
+    only_fields = ["pk"]
+    if isinstance(django_field, ManyToOneRel):
+        # The foreign key pointing back to the model is needed to match the prefetched objects to it.
+        only_fields.append(django_field.field.name)
+    select_related = set()
+    for inner_field in field_plan.inner_fields:
+        joined_path, prefetched_path = _plan_foreign_key_path(related_model, inner_field)
+        if joined_path:
+            select_related.add(joined_path)
+        joined_only = not prefetched_path and joined_path == inner_field.rpartition("__")[0]
+        if not joined_only or not _is_concrete_field(related_model, inner_field):
+            # The query can't be restricted to fields which aren't reached through joins, or aren't database fields.
+            only_fields = None
+        if only_fields is not None:
+            only_fields.append(inner_field)
+    queryset = related_model.objects.select_related(*sorted(select_related))
+    if only_fields is not None:
+        queryset = queryset.only(*only_fields)
+    return Prefetch(field_plan.name, queryset=queryset)
+
 
 class NautobotModel(DiffSyncModel):
     """
@@ -41,21 +111,96 @@ class NautobotModel(DiffSyncModel):
     @classmethod
     def _get_queryset(cls):
         """Get the queryset used to load the models data from Nautobot."""
-        available_fields = {field.name for field in cls._model._meta.get_fields()}
-        parameter_names = [
-            parameter for parameter in list(cls._identifiers) + list(cls._attributes) if parameter in available_fields
-        ]
-        # Here we identify any foreign keys (i.e. fields with '__' in them) so that we can load them directly in the
-        # first query if this function hasn't been overridden.
-        prefetch_related_parameters = [parameter.split("__")[0] for parameter in parameter_names if "__" in parameter]
-        qs = cls.get_queryset()
-        return qs.prefetch_related(*prefetch_related_parameters)
+        return cls._add_related_lookups(cls.get_queryset())
+
+    @classmethod
+    def _add_related_lookups(cls, queryset):
+        """Join or prefetch everything that loading the parameters of this model from the queryset will access.
+
+        Forward foreign key chains such as `location__parent__name` are joined with `select_related`, generic foreign
+        keys and to-many fields are prefetched. For regular to-many fields, the prefetch query only selects the fields
+        of the typed dict describing the related objects. This way, loading a model takes a fixed number of queries
+        rather than a number of queries per object.
+        """
+        select_related = set()
+        prefetch_related = {}
+        for parameter_name in list(cls._identifiers) + list(cls._attributes):
+            try:
+                field_plan = cls._get_field_plan(parameter_name)
+            except FieldDoesNotExist:
+                continue
+            if field_plan.kind == FieldKindEnum.FOREIGN_KEY:
+                joined_path, prefetched_path = _plan_foreign_key_path(cls._model, parameter_name)
+                if joined_path:
+                    select_related.add(joined_path)
+                if prefetched_path:
+                    prefetch_related.setdefault(prefetched_path, prefetched_path)
+            elif field_plan.kind == FieldKindEnum.TO_MANY:
+                prefetch_related[parameter_name] = _plan_to_many_prefetch(cls._model, field_plan)
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        return queryset.prefetch_related(*prefetch_related.values())
 
     @classmethod
     def get_queryset(cls):
         """Get the queryset used to load the models data from Nautobot."""
         return cls._model.objects.all()
 
+    @classmethod
+    def _get_field_plan(cls, name):
+        """Get the plan describing how the given field is loaded and written, building it on first use."""
+        plans = _field_plans.setdefault(cls, {})
+        if name not in plans:
+            plans[name] = cls._build_field_plan(name)
+        return plans[name]
+
+    @classmethod
+    def _build_field_plan(cls, name):
+        """Build the plan for the given field from the type hints of this class."""
+        custom_field_annotation = None
+        custom_relationship_annotation = None
+        for metadata in getattr(get_type_hints(cls, include_extras=True)[name], "__metadata__", []):
+            if isinstance(metadata, CustomFieldAnnotation):
+                custom_field_annotation = metadata
+                break
+            if isinstance(metadata, CustomRelationshipAnnotation):
+                custom_relationship_annotation = metadata
+                break
+        if custom_field_annotation:
+            return FieldPlan(name=name, kind=FieldKindEnum.CUSTOM_FIELD, annotation=custom_field_annotation)
+
+        if "__" in name:
+            related_field, lookup = name.split("__", maxsplit=1)
+            kind = FieldKindEnum.FOREIGN_KEY
+            if custom_relationship_annotation:
+                kind = FieldKindEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY
+            return FieldPlan(
+                name=name,
+                kind=kind,
+                related_field=related_field,
+                lookup=lookup,
+                annotation=custom_relationship_annotation,
+            )
+
+        if custom_relationship_annotation:
+            kind = FieldKindEnum.CUSTOM_RELATIONSHIP_TO_MANY
+        else:
+            django_field = cls._model._meta.get_field(name)
+            if not (django_field.many_to_many or django_field.one_to_many):
+                return FieldPlan(name=name, kind=FieldKindEnum.NORMAL)
+            kind = FieldKindEnum.TO_MANY
+
+        # To-many fields are annotated as a list of typed dicts which describe the related objects.
+        inner_type = next(iter(get_args(get_type_hints(cls)[name])), None)
+        inner_fields = tuple(get_type_hints(inner_type)) if inner_type else ()
+        return FieldPlan(
+            name=name,
+            kind=kind,
+            annotation=custom_relationship_annotation,
+            inner_type=inner_type,
+            inner_fields=inner_fields,
+        )
+
     @classmethod
     def _check_field(cls, name):
         """Check whether the given field name is defined on the diffsync (pydantic) model."""
@@ -73,13 +218,21 @@ class NautobotModel(DiffSyncModel):
         """Update the ORM object corresponding to this diffsync object."""
         try:
             obj = self.get_from_db()
-            self._update_obj_with_parameters(obj, attrs, self.adapter)
+            if getattr(self.adapter, "bulk_write", False):
+                # The object will be validated and saved when the adapter flushes its bulk operations.
+                self.adapter.queue_bulk_operation("update", self, obj, attrs)
+            else:
+                self._update_obj_with_parameters(obj, attrs, self.adapter)
         except ObjectCrudException as error:
             raise ObjectNotUpdated(error) from error
         return super().update(attrs)
 
     def delete(self):
         """Delete the ORM object corresponding to this diffsync object."""
+        if getattr(self.adapter, "bulk_delete", False):
+            # The object will be deleted when the adapter flushes its bulk deletes.
+            self.adapter.queue_bulk_delete(self)
+            return super().delete()
         try:
             obj = self.get_from_db()
         except ObjectCrudException as error:
@@ -101,6 +254,13 @@ class NautobotModel(DiffSyncModel):
         # This is in fact callable, because it is a model
         obj = cls._model()  # pylint: disable=not-callable
 
+        if getattr(adapter, "bulk_write", False):
+            # The object will be validated and saved when the adapter flushes its bulk operations.
+            diffsync_object = super().create(adapter, ids, attrs)
+            diffsync_object.pk = obj.pk
+            adapter.queue_bulk_operation("create", diffsync_object, obj, parameters)
+            return diffsync_object
+
         try:
             cls._update_obj_with_parameters(obj, parameters, adapter)
         except ObjectCrudException as error:
@@ -119,21 +279,14 @@ class NautobotModel(DiffSyncModel):
             This is mutated over the course of this function.
         :param adapter: The related diffsync adapter used for looking up things in the cache.
         """
-        # Use type hints at runtime to determine which fields are custom fields
-        type_hints = get_type_hints(cls, include_extras=True)
-
         cls._check_field(field)
+        field_plan = cls._get_field_plan(field)
 
         # Handle custom fields. See CustomFieldAnnotation docstring for more details.
-        custom_relationship_annotation = None
-        metadata_for_this_field = getattr(type_hints[field], "__metadata__", [])
-        for metadata in metadata_for_this_field:
-            if isinstance(metadata, CustomFieldAnnotation):
-                obj.cf[metadata.key] = value
-                return
-            if isinstance(metadata, CustomRelationshipAnnotation):
-                custom_relationship_annotation = metadata
-                break
+        if field_plan.kind == FieldKindEnum.CUSTOM_FIELD:
+            obj.cf[field_plan.annotation.key] = value
+            return
+        custom_relationship_annotation = field_plan.annotation
 
         # Prepare handling of foreign keys and custom relationship foreign keys.
         # Example: If field is `tenant__group__name`, then
@@ -144,8 +297,8 @@ class NautobotModel(DiffSyncModel):
         # `foreign_keys["tenant"]["_model_class"] = nautobot.tenancy.models.Tenant
         # For custom relationship foreign keys, we add the annotation instead:
         # `custom_relationship_foreign_keys["tenant"]["_annotation"] = CustomRelationshipAnnotation(...)
-        if "__" in field:
-            related_model, lookup = field.split("__", maxsplit=1)
+        if field_plan.kind in (FieldKindEnum.FOREIGN_KEY, FieldKindEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY):
+            related_model, lookup = field_plan.related_field, field_plan.lookup
             # Custom relationship foreign keys
             if custom_relationship_annotation:
                 relationship_fields["custom_relationship_foreign_keys"][related_model][lookup] = value
@@ -161,7 +314,7 @@ class NautobotModel(DiffSyncModel):
             return
 
         # Prepare handling of custom relationship many-to-many fields.
-        if custom_relationship_annotation:
+        if field_plan.kind == FieldKindEnum.CUSTOM_RELATIONSHIP_TO_MANY:
             relationship = adapter.get_from_orm_cache({"label": custom_relationship_annotation.name}, Relationship)
             if custom_relationship_annotation.side == RelationshipSideEnum.DESTINATION:
                 related_object_content_type = relationship.source_type
@@ -184,11 +337,10 @@ class NautobotModel(DiffSyncModel):
 
             return
 
-        django_field = cls._model._meta.get_field(field)
-
         # Prepare handling of many-to-many fields. If we are dealing with a many-to-many field,
         # we get all the related objects here to later set them once the object has been saved.
-        if django_field.many_to_many or django_field.one_to_many:
+        if field_plan.kind == FieldKindEnum.TO_MANY:
+            django_field = cls._model._meta.get_field(field)
             try:
                 relationship_fields["many_to_many_fields"][field] = [
                     adapter.get_from_orm_cache(parameters, django_field.related_model) for parameters in value
@@ -209,6 +361,24 @@ class NautobotModel(DiffSyncModel):
     @classmethod
     def _update_obj_with_parameters(cls, obj, parameters, adapter):
         """Update a given Nautobot ORM object with the given parameters."""
+        relationship_fields = cls._set_fields_and_foreign_keys(obj, parameters, adapter)
+
+        # Save the object to the database
+        try:
+            obj.validated_save()
+        except ValidationError as error:
+            raise ObjectCrudException(
+                f"Validated save failed for Django object:\n{error}\nParameters: {parameters}"
+            ) from error
+
+        cls._set_relationship_fields(relationship_fields, obj, adapter)
+
+    @classmethod
+    def _set_fields_and_foreign_keys(cls, obj, parameters, adapter):
+        """Set the fields and foreign keys of a Nautobot ORM object, without saving it.
+
+        Returns the relationship fields which can only be set once the object has been saved.
+        """
         relationship_fields = {
             # Example: {"group": {"name": "Group Name", "_model_class": TenantGroup}}
             "foreign_keys": defaultdict(dict),
@@ -224,15 +394,11 @@ class NautobotModel(DiffSyncModel):
 
         # Set foreign keys
         cls._lookup_and_set_foreign_keys(relationship_fields["foreign_keys"], obj, adapter)
+        return relationship_fields
 
-        # Save the object to the database
-        try:
-            obj.validated_save()
-        except ValidationError as error:
-            raise ObjectCrudException(
-                f"Validated save failed for Django object:\n{error}\nParameters: {parameters}"
-            ) from error
-
+    @classmethod
+    def _set_relationship_fields(cls, relationship_fields, obj, adapter):
+        """Set the relationship fields returned by `_set_fields_and_foreign_keys` on a saved Nautobot ORM object."""
         # Handle relationship association creation. This needs to be after object creation, because relationship
         # association objects rely on both sides already existing.
         cls._lookup_and_set_custom_relationship_foreign_keys(
@@ -257,43 +423,48 @@ class NautobotModel(DiffSyncModel):
                 "source_type": relationship.source_type,
                 "destination_type": relationship.destination_type,
             }
-            associations = []
             if annotation.side == RelationshipSideEnum.SOURCE:
-                parameters["source_id"] = obj.id
-                for object_to_relate in objects:
-                    association_parameters = parameters.copy()
-                    association_parameters["destination_id"] = object_to_relate.id
-                    try:
-                        association = adapter.get_from_orm_cache(association_parameters, RelationshipAssociation)
-                    except RelationshipAssociation.DoesNotExist:
-                        association = RelationshipAssociation(**parameters, destination_id=object_to_relate.id)
-                        association.validated_save()
-                    associations.append(association)
+                own_side, other_side = "source_id", "destination_id"
             else:
-                parameters["destination_id"] = obj.id
-                for object_to_relate in objects:
-                    association_parameters = parameters.copy()
-                    association_parameters["source_id"] = object_to_relate.id
-                    try:
-                        association = adapter.get_from_orm_cache(association_parameters, RelationshipAssociation)
-                    except RelationshipAssociation.DoesNotExist:
-                        association = RelationshipAssociation(**parameters, source_id=object_to_relate.id)
-                        association.validated_save()
-                    associations.append(association)
-            # Now we need to clean up any associations that we're not `get_or_create`'d in order to achieve
-            # declarativeness.
-            # TODO: This may benefit from an ORM cache with `filter` capabilities, but I guess the gain in most cases
-            # would be fairly minor.
-            for existing_association in RelationshipAssociation.objects.filter(**parameters):
-                if existing_association not in associations:
-                    existing_association.delete()
+                own_side, other_side = "destination_id", "source_id"
+            parameters[own_side] = obj.id
+            # Only create the missing associations and delete the superfluous ones, in order to achieve
+            # declarativeness without touching the associations that are already correct.
+            existing_associations = {
+                getattr(association, other_side): association
+                for association in RelationshipAssociation.objects.filter(**parameters)
+            }
+            desired_ids = {object_to_relate.id for object_to_relate in objects}
+            # Delete the superfluous associations first, as the new ones are validated against the existing ones,
+            # e.g. when replacing the single peer of a one-to-many relationship.
+            superfluous_association_ids = [
+                association.id
+                for related_id, association in existing_associations.items()
+                if related_id not in desired_ids
+            ]
+            if superfluous_association_ids:
+                RelationshipAssociation.objects.filter(id__in=superfluous_association_ids).delete()
+            new_associations = []
+            for related_id in desired_ids - existing_associations.keys():
+                association_parameters = {**parameters, other_side: related_id}
+                association = RelationshipAssociation(**association_parameters)
+                try:
+                    association.full_clean()
+                except ValidationError as error:
+                    raise ObjectCrudException(
+                        f"Validation failed for relationship association:\n{error}\n"
+                        f"Parameters: {association_parameters}"
+                    ) from error
+                new_associations.append(association)
+            RelationshipAssociation.objects.bulk_create(new_associations)
 
     @classmethod
     def _set_many_to_many_fields(cls, many_to_many_fields, obj):
         """
         Given a dictionary, set many-to-many relationships on an object.
 
-        This will always use `set`, thereby replacing any elements that are already part of the relationship.
+        This replaces any elements that are already part of the relationship. Only the differences between the current
+        and the desired related objects are applied, through the related manager so that signals are still sent.
 
         Example dictionary:
         {
@@ -303,7 +474,18 @@ class NautobotModel(DiffSyncModel):
         """
         for field_name, related_objects in many_to_many_fields.items():
             many_to_many_field = getattr(obj, field_name)
-            many_to_many_field.set(related_objects)
+            if not hasattr(many_to_many_field, "remove"):
+                # Reverse foreign keys which aren't nullable can't have objects removed, leave these to `set`.
+                many_to_many_field.set(related_objects)
+                continue
+            current_objects = {related_object.pk: related_object for related_object in many_to_many_field.all()}
+            desired_objects = {related_object.pk: related_object for related_object in related_objects}
+            removed_objects = [current_objects[pk] for pk in current_objects.keys() - desired_objects.keys()]
+            added_objects = [desired_objects[pk] for pk in desired_objects.keys() - current_objects.keys()]
+            if removed_objects:
+                many_to_many_field.remove(*removed_objects)
+            if added_objects:
+                many_to_many_field.add(*added_objects)
 
     @classmethod
     def _lookup_and_set_custom_relationship_foreign_keys(cls, custom_relationship_foreign_keys, obj, adapter):
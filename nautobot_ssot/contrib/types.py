@@ -5,7 +5,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional, Tuple, Union
 
 
 class RelationshipSideEnum(Enum):
@@ -89,3 +89,34 @@ class CustomFieldAnnotation:
                 self.key = self.name
             else:
                 raise ValueError("The 'key' field on CustomFieldAnnotation needs to be set.")
+
+
+class FieldKindEnum(Enum):
+    """The different ways in which a field of a `NautobotModel` maps to its ORM model."""
+
+    NORMAL = "NORMAL"
+    FOREIGN_KEY = "FOREIGN_KEY"
+    TO_MANY = "TO_MANY"
+    CUSTOM_FIELD = "CUSTOM_FIELD"
+    CUSTOM_RELATIONSHIP_FOREIGN_KEY = "CUSTOM_RELATIONSHIP_FOREIGN_KEY"
+    CUSTOM_RELATIONSHIP_TO_MANY = "CUSTOM_RELATIONSHIP_TO_MANY"
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """Describe how a single field of a `NautobotModel` is loaded from and written to its ORM model.
+
+    Field plans are derived from the type hints of the model once per field, so that loading and writing objects
+    doesn't have to resolve the type hints over and over again. See `NautobotModel._get_field_plan`.
+    """
+
+    name: str
+    kind: FieldKindEnum
+    # For (custom relationship) foreign keys, i.e. `tenant__group__name`, the part before the first `__` ("tenant")
+    # and the remaining lookups on the related object ("group__name").
+    related_field: Optional[str] = None
+    lookup: Optional[str] = None
+    annotation: Optional[Union[CustomFieldAnnotation, CustomRelationshipAnnotation]] = None
+    # For to-many fields, the typed dict describing the related objects and the names of its fields.
+    inner_type: Optional[Any] = None
+    inner_fields: Tuple[str, ...] = ()
@@ -110,5 +110,21 @@ class ServiceNowDataTarget(DataTarget, Job):  # pylint: disable=abstract-method,
             pass
         return obj
 
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up the Nautobot objects for the DiffSync models that are uniquely identified by their name alone."""
+        model_class = {"company": Manufacturer, "device": Device, "location": Location}.get(model_name)
+        if not model_class:
+            return super().lookup_objects(model_name, unique_ids)
+        objects = {}
+        ambiguous_names = set()
+        for obj in model_class.objects.filter(name__in=unique_ids):
+            if obj.name in objects:
+                ambiguous_names.add(obj.name)
+            objects[obj.name] = obj
+        # Leave names matching multiple objects to `lookup_object`, to be handled the same way as before.
+        for name in ambiguous_names:
+            del objects[name]
+        return objects
+
 
 jobs = [ServiceNowDataTarget]
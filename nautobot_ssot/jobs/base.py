@@ -1,23 +1,46 @@
 """Base Job classes for sync workers."""
 
+import gc
+import json
+import threading
+import time
 import tracemalloc
-from collections import namedtuple
-from datetime import datetime
-from typing import Iterable, Optional
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
 
 import structlog
 
 # pylint-django doesn't understand classproperty, and complains unnecessarily. We disable this specific warning:
 # pylint: disable=no-self-argument
 from diffsync.enum import DiffSyncFlags
+from diffsync.exceptions import ObjectNotFound
+from django import forms
+from django.conf import settings
+from django.db import connections
 from django.db.utils import OperationalError
 from django.templatetags.static import static
 from django.utils import timezone
 from django.utils.functional import classproperty
-from nautobot.extras.jobs import BooleanVar, DryRunVar, Job
-
-from nautobot_ssot.choices import SyncLogEntryActionChoices
-from nautobot_ssot.models import BaseModel, Sync, SyncLogEntry
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.jobs import BooleanVar, DryRunVar, Job, StringVar
+from nautobot.extras.models import JobResult
+
+from nautobot_ssot.choices import DiffStorageChoices, SyncAdapterSideChoices, SyncLogEntryActionChoices
+from nautobot_ssot.contrib.model import NautobotModel
+from nautobot_ssot.models import (
+    BaseModel,
+    Sync,
+    SyncAdapterSnapshot,
+    SyncDiffChunk,
+    SyncLogEntry,
+    SyncMemorySnapshot,
+    SyncMetricWindow,
+)
+from nautobot_ssot.profiling import SamplingProfiler
+
+PLUGIN_SETTINGS = settings.PLUGINS_CONFIG.get("nautobot_ssot", {})
 
 DataMapping = namedtuple("DataMapping", ["source_name", "source_url", "target_name", "target_url"])
 """Entry in the list returned by a job's data_mappings() API.
@@ -33,6 +56,61 @@ and the other system acting as data source/target.
 """
 
 
+class SyncLogEntryBuffer:
+    """Collect SyncLogEntry instances in memory and write them to the database in batches.
+
+    The buffer is flushed whenever it holds `max_size` entries or its oldest entry is older than `max_age` seconds,
+    as well as whenever `flush()` is called explicitly. Adding entries is thread-safe.
+
+    Entries may be added along with a `(model_name, unique_id)` key identifying their synced object, which is then
+    only resolved when the buffer is flushed, through the `resolve_synced_objects` callable. It is given a list of
+    `(entry, key)` tuples for all entries being flushed. While `defer_resolution` is set, e.g. while the objects are
+    queued for bulk writes rather than written, keyed entries are held back until a flush after it has been unset.
+    """
+
+    def __init__(self, max_size=1000, max_age=10.0, resolve_synced_objects=None):
+        """Initialize an empty buffer."""
+        self.max_size = max_size
+        self.max_age = max_age
+        self.resolve_synced_objects = resolve_synced_objects
+        self.defer_resolution = False
+        self._entries = []
+        self._deferred_entries = []
+        self._oldest_entry_time = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries not yet written to the database."""
+        return len(self._entries) + len(self._deferred_entries)
+
+    def add(self, entry: SyncLogEntry, synced_object_key=None):
+        """Add an unsaved SyncLogEntry to the buffer, flushing the buffer if either threshold is reached."""
+        with self._lock:
+            if not self._entries:
+                self._oldest_entry_time = time.monotonic()
+            self._entries.append((entry, synced_object_key))
+            if len(self._entries) >= self.max_size or time.monotonic() - self._oldest_entry_time >= self.max_age:
+                self._flush()
+
+    def flush(self):
+        """Write all buffered entries to the database."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        entries, self._entries = self._entries, []
+        if self.defer_resolution:
+            self._deferred_entries.extend((entry, key) for entry, key in entries if key is not None)
+            entries = [(entry, key) for entry, key in entries if key is None]
+        elif self._deferred_entries:
+            entries, self._deferred_entries = self._deferred_entries + entries, []
+        if not entries:
+            return
+        if self.resolve_synced_objects is not None:
+            self.resolve_synced_objects([(entry, key) for entry, key in entries if key is not None])
+        SyncLogEntry.objects.bulk_create([entry for entry, _ in entries], batch_size=self.max_size)
+
+
 class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
     """Common base class for data synchronization jobs.
 
@@ -43,6 +121,12 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
       - `dryrun_default` - defaults to True if unspecified
       - `data_source` and `data_target` as labels (by default, will use the `name` and/or "Nautobot" as appropriate)
       - `data_source_icon` and `data_target_icon`
+      - `parallel_loading` - if True, load the source and target adapters concurrently (defaults to False)
+      - `diff_storage` - how to persist the diff, one of `DiffStorageChoices` (defaults to the `diff_storage` setting)
+      - `incremental_sync` - if True, only load records changed since the last successful sync (defaults to False)
+      - `save_adapter_snapshots` - if True, persist the loaded data of both adapters (implied by `incremental_sync`)
+      - `distribute_partitions` - if True, sync the partitions returned by `get_partitions` in separate child jobs
+        that may run on different workers (defaults to False)
     """
 
     dryrun = DryRunVar(
@@ -50,6 +134,32 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         default=True,
     )
     memory_profiling = BooleanVar(description="Perform a memory profiling analysis.", default=False)
+    cpu_profiling = BooleanVar(description="Perform a sampling CPU profiling analysis.", default=False)
+    # Set by the coordinating job for each of its child jobs, see `distribute_partitions`.
+    sync_partition = StringVar(required=False, default="", widget=forms.HiddenInput())
+    parent_sync = StringVar(required=False, default="", widget=forms.HiddenInput())
+
+    # While the job is running, SyncLogEntry records are buffered and written in batches of (at most) this many entries,
+    # or once the oldest buffered entry is older than `sync_log_flush_interval` seconds.
+    sync_log_batch_size = 1000
+    sync_log_flush_interval = 10.0
+
+    # With `memory_profiling` enabled, how many of the top allocation sites are recorded for each phase.
+    memory_profiling_top_allocations = 25
+
+    # With `distribute_partitions` enabled, how often (in seconds) the coordinating job checks whether its child jobs
+    # have finished, and how long it waits for them at most.
+    distributed_poll_interval = 10
+    distributed_timeout = 6 * 60 * 60
+    # How long (in seconds) the coordinating job waits while none of its unfinished child jobs are running, e.g.
+    # because all workers are busy, before giving up.
+    distributed_start_timeout = 10 * 60
+
+    # With `cpu_profiling` enabled, seconds between two samples of the call stack.
+    cpu_profiling_interval = 0.01
+
+    # Maximum number of top-level DiffSync objects per SyncDiffChunk when using chunked diff storage.
+    diff_chunk_size = 500
 
     def load_source_adapter(self):
         """Method to instantiate and load the SOURCE adapter into `self.source_adapter`.
@@ -79,16 +189,190 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             self.sync.diff = {}
             self.sync.summary = self.diff.summary()
             self.sync.save()
-            try:
-                self.sync.diff = self.diff.dict()
-                self.sync.save()
-            except OperationalError:
-                self.logger.warning("Unable to save JSON diff to the database; likely the diff is too large.")
-                self.sync.refresh_from_db()
+            if self.diff_storage == DiffStorageChoices.STORAGE_CHUNKED:
+                chunk_count = SyncDiffChunk.save_diff(
+                    self.sync,
+                    self.diff,
+                    chunk_size=self.diff_chunk_size,
+                    # With partitioned syncs, the chunks of earlier partitions are already stored.
+                    start_index=self.sync.diff_chunks.count(),
+                )
+                self.logger.debug("Saved diff to the database in %s chunks.", chunk_count)
+            else:
+                try:
+                    if self.diff_storage == DiffStorageChoices.STORAGE_COMPRESSED:
+                        self.sync.diff_compressed = Sync.compress_diff(self.diff.dict())
+                    else:
+                        self.sync.diff = self.diff.dict()
+                    self.sync.save()
+                except OperationalError:
+                    self.logger.warning("Unable to save JSON diff to the database; likely the diff is too large.")
+                    self.sync.refresh_from_db()
             self.logger.info(self.diff.summary())
         else:
             self.logger.warning("Not both adapters were properly initialized prior to diff calculation.")
 
+    def get_partitions(self):
+        """Return the partitions to sync one after the other, or None (the default) to sync all data at once.
+
+        Override this to bound the memory usage of syncs too large to be held in memory at once. Each partition (e.g. a
+        Location, Namespace or network view) is made available as `self.current_partition` while `sync_data` loads,
+        diffs and syncs it, so `load_source_adapter` and `load_target_adapter` (or the adapters themselves) need to
+        load only the records belonging to it. As both adapters are loaded for the same partition, records deleted
+        within a partition are detected as usual. The adapters are released between partitions.
+
+        With `distribute_partitions` enabled, the partitions are passed to the child jobs as JSON, so they need to be
+        JSON-serializable values such as the names or primary keys of Locations rather than model instances.
+
+        Returns:
+            Optional[Iterable]: The partitions, or None.
+        """
+        return None
+
+    def sync_partitions(self, partitions, memory_profiling):
+        """Call `sync_data` once for each of the given partitions, accumulating the results into `self.sync`.
+
+        Durations and the diff summary are combined across partitions, memory usage is the maximum of all partitions.
+        The diff of each partition is always stored in chunks as soon as it is calculated, so that it doesn't need to be
+        held in memory until all partitions are synced.
+        """
+        if self.incremental_sync or self.save_adapter_snapshots:
+            raise ValueError("Partitioned syncs do not support `incremental_sync` or `save_adapter_snapshots`.")
+        if self.diff_storage != DiffStorageChoices.STORAGE_CHUNKED:
+            self.logger.info("Storing the diff of the partitioned sync in chunks rather than as %s.", self.diff_storage)
+            self.diff_storage = DiffStorageChoices.STORAGE_CHUNKED
+
+        partitions = list(partitions)
+        totals = defaultdict(timedelta)
+        memory = defaultdict(int)
+        summary = defaultdict(int)
+        for number, partition in enumerate(partitions, start=1):
+            self.logger.info("Syncing partition %s (%s of %s)...", partition, number, len(partitions))
+            self.current_partition = partition
+            self.sync_data(memory_profiling)
+
+            for field in ("source_load_time", "target_load_time", "diff_time", "sync_time"):
+                if getattr(self.sync, field) is not None:
+                    totals[field] += getattr(self.sync, field)
+            for field in (
+                f"{phase}_memory_{kind}"
+                for phase in ("source_load", "target_load", "diff", "sync")
+                for kind in ("final", "peak")
+            ):
+                memory[field] = max(memory[field], getattr(self.sync, field) or 0)
+            for operation, count in (self.sync.summary or {}).items():
+                summary[operation] += count
+
+            # The synced objects of the buffered log entries are resolved through the adapters of this partition.
+            self.flush_sync_log()
+            # Release the data of this partition before loading the next one.
+            self.source_adapter = None
+            self.target_adapter = None
+            self.diff = None
+            gc.collect()
+        self.current_partition = None
+
+        for field, total in totals.items():
+            setattr(self.sync, field, total)
+        if memory_profiling:
+            for field, value in memory.items():
+                setattr(self.sync, field, value)
+        self.sync.summary = dict(summary)
+        self.sync.save()
+        self.logger.info("Synced %s partitions: %s", len(partitions), self.sync.summary)
+
+    def sync_distributed_partitions(self, partitions):
+        """Enqueue a child job for each of the given partitions, wait for them and merge their results into `self.sync`.
+
+        Each child job is a run of this same job, with the same variables, which syncs a single partition in a child
+        Sync of `self.sync`. The child jobs are picked up by any available Celery workers, so they can run in parallel.
+        The results of the child jobs that succeeded are merged, even if others failed or didn't finish in time, in
+        which case an exception is raised afterwards.
+        """
+        if self.incremental_sync or self.save_adapter_snapshots:
+            raise ValueError("Partitioned syncs do not support `incremental_sync` or `save_adapter_snapshots`.")
+
+        job_kwargs = {
+            key: value
+            for key, value in (self.job_result.task_kwargs or {}).items()
+            if key not in ("sync_partition", "parent_sync")
+        }
+        child_results = [
+            JobResult.enqueue_job(
+                self.job_result.job_model,
+                self.job_result.user,
+                **job_kwargs,
+                sync_partition=json.dumps(partition),
+                parent_sync=str(self.sync.pk),
+            )
+            for partition in partitions
+        ]
+        self.logger.info("Enqueued %s child jobs, waiting for them to finish...", len(child_results))
+
+        deadline = time.monotonic() + self.distributed_timeout
+        pending = {child_result.pk: JobResultStatusChoices.STATUS_PENDING for child_result in child_results}
+        last_progress = time.monotonic()
+        error = None
+        while pending and time.monotonic() < deadline:
+            time.sleep(self.distributed_poll_interval)
+            statuses = dict(
+                JobResult.objects.filter(pk__in=pending)
+                .exclude(status__in=JobResultStatusChoices.READY_STATES)
+                .values_list("pk", "status")
+            )
+            if len(statuses) < len(pending) or any(
+                status != JobResultStatusChoices.STATUS_PENDING for status in statuses.values()
+            ):
+                last_progress = time.monotonic()
+            elif time.monotonic() - last_progress >= self.distributed_start_timeout:
+                error = TimeoutError(
+                    f"None of the {len(statuses)} unfinished child jobs started within "
+                    f"{self.distributed_start_timeout} seconds, make sure that enough workers are available for them."
+                )
+                break
+            pending = statuses
+
+        self.merge_child_syncs()
+        if error is None and pending:
+            error = TimeoutError(f"{len(pending)} child jobs did not finish within {self.distributed_timeout} seconds.")
+        failed = JobResult.objects.filter(
+            pk__in=[child_result.pk for child_result in child_results], status__in=JobResultStatusChoices.READY_STATES
+        ).exclude(status=JobResultStatusChoices.STATUS_SUCCESS)
+        if error is None and failed.exists():
+            error = RuntimeError(f"{failed.count()} of {len(child_results)} child jobs failed.")
+        if error is not None:
+            raise error
+
+    def merge_child_syncs(self):
+        """Combine the results of the child Syncs of `self.sync` whose jobs succeeded into it.
+
+        Diff summaries and model statistics are summed. As the children run in parallel, durations and memory usage
+        are the maximum of all children.
+        """
+        summary = defaultdict(int)
+        children = self.sync.children.filter(job_result__status=JobResultStatusChoices.STATUS_SUCCESS)
+        for child in children.defer("diff", "diff_compressed"):
+            for operation, count in (child.summary or {}).items():
+                summary[operation] += count
+            for field in ("source_load_time", "target_load_time", "diff_time", "sync_time") + tuple(
+                f"{phase}_memory_{kind}"
+                for phase in ("source_load", "target_load", "diff", "sync")
+                for kind in ("final", "peak")
+            ):
+                value = getattr(child, field)
+                if value is not None and (getattr(self.sync, field) is None or value > getattr(self.sync, field)):
+                    setattr(self.sync, field, value)
+            for phase, phase_statistics in child.model_statistics.items():
+                for model_name, model_statistics in phase_statistics.items():
+                    for action, statistics in model_statistics.items():
+                        self.record_model_statistic(
+                            phase, model_name, action, count=statistics["count"], seconds=statistics.get("seconds")
+                        )
+        self.sync.summary = dict(summary)
+        self.sync.model_statistics = self.model_statistics
+        self.sync.save()
+        self.logger.info("Merged the results of %s child syncs: %s", children.count(), self.sync.summary)
+
     def execute_sync(self):
         """Method to synchronize the difference from `self.diff`, from SOURCE to TARGET adapter.
 
@@ -132,15 +416,30 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
                     )
                 size /= 1024
 
-        def record_memory_trace(step: str):
-            """Helper function to record memory usage and reset tracemalloc stats."""
+        def record_memory_trace(*steps: str):
+            """Helper function to record memory usage and top allocation sites, and reset tracemalloc stats."""
             memory_final, memory_peak = tracemalloc.get_traced_memory()
-            setattr(self.sync, f"{step}_memory_final", memory_final)
-            setattr(self.sync, f"{step}_memory_peak", memory_peak)
+            if tracemalloc.is_tracing():
+                snapshot = tracemalloc.take_snapshot().filter_traces(
+                    (
+                        tracemalloc.Filter(False, tracemalloc.__file__),
+                        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                        tracemalloc.Filter(False, "<unknown>"),
+                    )
+                )
+                SyncMemorySnapshot.from_tracemalloc(
+                    self.sync,
+                    steps[0] if len(steps) == 1 else "load",
+                    snapshot,
+                    limit=self.memory_profiling_top_allocations,
+                )
+            for step in steps:
+                setattr(self.sync, f"{step}_memory_final", memory_final)
+                setattr(self.sync, f"{step}_memory_peak", memory_peak)
             self.sync.save()
             self.logger.info(
                 "Traced memory for %s (Final, Peak): %s, %s",
-                step,
+                " and ".join(steps),
                 format_size(memory_final),
                 format_size(memory_peak),
             )
@@ -154,54 +453,339 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         start_time = datetime.now()
 
-        self.logger.info("Loading current data from source adapter...")
-        self.load_source_adapter()
-        load_source_adapter_time = datetime.now()
-        self.sync.source_load_time = load_source_adapter_time - start_time
-        self.sync.save()
-        self.logger.info(
-            "Source Load Time from %s: %s",
-            self.source_adapter,
-            self.sync.source_load_time,
-        )
-        if memory_profiling:
-            record_memory_trace("source_load")
+        if self.parallel_loading:
+            self.set_profiling_phase("load")
+            self.logger.info("Loading current data from source and target adapters concurrently...")
+            self.sync.source_load_time, self.sync.target_load_time = self._load_adapters_concurrently()
+            load_target_adapter_time = datetime.now()
+            self.sync.save()
+            self.logger.info(
+                "Source Load Time from %s: %s",
+                self.source_adapter,
+                self.sync.source_load_time,
+            )
+            self.logger.info(
+                "Target Load Time from %s: %s",
+                self.target_adapter,
+                self.sync.target_load_time,
+            )
+            self.flush_sync_log()
+            if memory_profiling:
+                # Both loads share a single tracemalloc trace, so the numbers can't be attributed to either side.
+                record_memory_trace("source_load", "target_load")
+        else:
+            self.set_profiling_phase("source_load")
+            self.logger.info("Loading current data from source adapter...")
+            self.load_source_adapter()
+            load_source_adapter_time = datetime.now()
+            self.sync.source_load_time = load_source_adapter_time - start_time
+            self.sync.save()
+            self.logger.info(
+                "Source Load Time from %s: %s",
+                self.source_adapter,
+                self.sync.source_load_time,
+            )
+            self.flush_sync_log()
+            if memory_profiling:
+                record_memory_trace("source_load")
 
-        self.logger.info("Loading current data from target adapter...")
-        self.load_target_adapter()
-        load_target_adapter_time = datetime.now()
-        self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
+            self.set_profiling_phase("target_load")
+            self.logger.info("Loading current data from target adapter...")
+            self.load_target_adapter()
+            load_target_adapter_time = datetime.now()
+            self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
+            self.sync.save()
+            self.logger.info(
+                "Target Load Time from %s: %s",
+                self.target_adapter,
+                self.sync.target_load_time,
+            )
+            self.flush_sync_log()
+            if memory_profiling:
+                record_memory_trace("target_load")
+
+        if self.incremental_sync:
+            self._complete_incremental_load()
+        if self.incremental_sync or self.save_adapter_snapshots:
+            self.snapshot_adapters()
+        self._record_load_statistics()
+        self.sync.model_statistics = self.model_statistics
         self.sync.save()
-        self.logger.info(
-            "Target Load Time from %s: %s",
-            self.target_adapter,
-            self.sync.target_load_time,
-        )
-        if memory_profiling:
-            record_memory_trace("target_load")
 
+        self.set_profiling_phase("diff")
         self.logger.info("Calculating diffs...")
         self.calculate_diff()
         calculate_diff_time = datetime.now()
         self.sync.diff_time = calculate_diff_time - load_target_adapter_time
         self.sync.save()
         self.logger.info("Diff Calculation Time: %s", self.sync.diff_time)
+        self.flush_sync_log()
         if memory_profiling:
             record_memory_trace("diff")
 
         if self.sync.dry_run:
             self.logger.info("As `dryrun` is set, skipping the actual data sync.")
         else:
+            self.set_profiling_phase("sync")
             self.logger.info("Syncing from %s to %s...", self.source_adapter, self.target_adapter)
-            self.execute_sync()
+            self._last_sync_event_time = time.perf_counter()
+            # Objects queued for bulk writes only exist in the database once the sync is complete.
+            defer_resolution = self._sync_log_buffer is not None and any(
+                getattr(adapter, "bulk_write", False) for adapter in (self.source_adapter, self.target_adapter)
+            )
+            if defer_resolution:
+                self._sync_log_buffer.defer_resolution = True
+            try:
+                self.execute_sync()
+            finally:
+                self._last_sync_event_time = None
+                if defer_resolution:
+                    self._sync_log_buffer.defer_resolution = False
             execute_sync_time = datetime.now()
             self.sync.sync_time = execute_sync_time - calculate_diff_time
+            self.sync.model_statistics = self.model_statistics
             self.sync.save()
             self.logger.info("Sync complete")
             self.logger.info("Sync Time: %s", self.sync.sync_time)
+            self.flush_sync_log()
             if memory_profiling:
                 record_memory_trace("sync")
 
+        if self._record_orm_cache_statistics():
+            self.sync.model_statistics = self.model_statistics
+            self.sync.save()
+
+    def set_profiling_phase(self, phase):
+        """Attribute the subsequent CPU profiling samples to the given phase, if `cpu_profiling` is enabled."""
+        if self._cpu_profiler is not None:
+            self._cpu_profiler.phase = phase
+
+    def _save_cpu_profiles(self):
+        """Stop the CPU profiler and attach the samples of each phase to the job result as collapsed stack files."""
+        self._cpu_profiler.stop()
+        for phase in self._cpu_profiler.phases:
+            filename = f"cpu_profile_{phase or 'setup'}.collapsed"
+            try:
+                self.create_file(filename, self._cpu_profiler.collapsed_stacks(phase))
+            except ValueError as error:
+                self.logger.warning("Unable to save CPU profile %s: %s", filename, error)
+            else:
+                self.logger.info("Saved CPU profile for %s as %s.", phase or "setup", filename)
+        self._cpu_profiler = None
+
+    def record_model_statistic(self, phase, model_name, action, count=1, seconds=None):
+        """Add an object count and (optionally) the time taken to `self.model_statistics`.
+
+        Args:
+            phase (str): One of "source_load", "target_load", "sync", "source_orm_cache" and "target_orm_cache".
+            model_name (str): The DiffSync model name.
+            action (str): E.g. "load" or a `SyncLogEntryActionChoices` value.
+            count (int): Number of objects processed.
+            seconds (float): Time taken to process them, if known.
+        """
+        statistics = self.model_statistics.setdefault(phase, {}).setdefault(model_name, {}).setdefault(action, {})
+        statistics["count"] = statistics.get("count", 0) + count
+        if seconds is not None:
+            statistics["seconds"] = (statistics.get("seconds") or 0.0) + seconds
+        else:
+            statistics.setdefault("seconds", None)
+
+    def _record_load_statistics(self):
+        """Record the number of loaded objects per model, and the time it took where the adapter measured it.
+
+        Adapters may provide per-model load times (in seconds) as a `{model_name: seconds}` dictionary in their
+        `load_statistics` attribute, as `NautobotAdapter` does.
+        """
+        for side, adapter in self._adapters_by_side():
+            load_statistics = getattr(adapter, "load_statistics", None) or {}
+            for model_name in adapter.store.get_all_model_names():
+                self.record_model_statistic(
+                    f"{side}_load",
+                    model_name,
+                    "load",
+                    count=len(adapter.get_all(model_name)),
+                    seconds=load_statistics.get(model_name),
+                )
+
+    def _record_orm_cache_statistics(self):
+        """Record the ORM cache hits, misses and evictions per model of adapters providing them, like `NautobotAdapter`.
+
+        Returns:
+            bool: Whether any statistics were recorded.
+        """
+        recorded = False
+        for side, adapter in self._adapters_by_side():
+            if not hasattr(adapter, "orm_cache_statistics"):
+                continue
+            for model_label, statistics in adapter.orm_cache_statistics().items():
+                for action, count in statistics.items():
+                    self.record_model_statistic(f"{side}_orm_cache", model_label, action, count=count)
+                    recorded = True
+        return recorded
+
+    def _get_incremental_baseline(self) -> Optional[Sync]:
+        """Return the most recent successful Sync of this job that has adapter snapshots, if any."""
+        if not self.job_result or not self.job_result.job_model:
+            return None
+        return (
+            Sync.objects.defer("diff", "diff_compressed")
+            .filter(
+                job_result__job_model=self.job_result.job_model,
+                job_result__status=JobResultStatusChoices.STATUS_SUCCESS,
+                adapter_snapshot__isnull=False,
+            )
+            .exclude(pk=self.sync.pk)
+            .order_by("-start_time")
+            .first()
+        )
+
+    def _delete_stale_adapter_snapshots(self):
+        """Delete the adapter snapshots of this job's Syncs that are older than its most recent successful snapshot.
+
+        The snapshots of the most recent successful Sync are kept as the incremental baseline, as are the snapshots of
+        any later (e.g. failed) Syncs, which may still be needed to retry them.
+        """
+        latest_sync = self.incremental_baseline or self._get_incremental_baseline()
+        if latest_sync is None:
+            return
+        deleted, _ = SyncAdapterSnapshot.objects.filter(
+            sync__job_result__job_model=self.job_result.job_model, sync__start_time__lt=latest_sync.start_time
+        ).delete()
+        if deleted:
+            self.logger.info("Deleted %s adapter snapshots older than those of %s.", deleted, latest_sync)
+
+    def _complete_incremental_load(self):
+        """Fill in the records that weren't reloaded from the snapshots of the incremental baseline.
+
+        Only adapters with `supports_incremental_load = True` are considered to have loaded just the records that
+        changed since `self.changed_since`. Such adapters may list records deleted since then as
+        `(model_name, unique_id)` tuples in their `incremental_deletions` attribute.
+        """
+        if not self.changed_since:
+            return
+        for side, adapter in self._adapters_by_side():
+            if not getattr(adapter, "supports_incremental_load", False):
+                continue
+            try:
+                snapshot = self.incremental_baseline.adapter_snapshots.get(side=side)
+            except SyncAdapterSnapshot.DoesNotExist:
+                self.logger.warning(
+                    "No %s snapshot found for %s, the %s data may be incomplete.",
+                    side,
+                    self.incremental_baseline,
+                    side,
+                )
+            else:
+                count = self._merge_adapter_snapshot(
+                    adapter, snapshot.get_data()["objects"], set(getattr(adapter, "incremental_deletions", ()))
+                )
+                self.logger.info("Restored %s unchanged records into %s from %s.", count, adapter, snapshot)
+
+    def _adapters_by_side(self):
+        """Yield `(side, adapter)` tuples for the loaded adapters of this job."""
+        for side, adapter in (
+            (SyncAdapterSideChoices.SIDE_SOURCE, self.source_adapter),
+            (SyncAdapterSideChoices.SIDE_TARGET, self.target_adapter),
+        ):
+            if adapter is not None:
+                yield side, adapter
+
+    def snapshot_adapters(self):
+        """Persist the data currently loaded into the source and target adapters as `SyncAdapterSnapshot` records."""
+        for side, adapter in self._adapters_by_side():
+            snapshot = SyncAdapterSnapshot.save_adapter(self.sync, side, adapter)
+            self.logger.debug("Saved %s.", snapshot)
+
+    @staticmethod
+    def load_adapter_from_snapshot(adapter, sync, side=SyncAdapterSideChoices.SIDE_SOURCE):
+        """Populate the given adapter from the snapshot of a previous Sync rather than from the system it represents.
+
+        This may be used from `load_source_adapter`/`load_target_adapter` to warm-start a job, e.g. to recalculate the
+        diff against a cached source or to retry a failed `execute_sync` without loading the remote system again:
+
+            def load_source_adapter(self):
+                self.source_adapter = self.load_adapter_from_snapshot(MySourceAdapter(job=self), previous_sync)
+
+        Args:
+            adapter (diffsync.Adapter): The (empty) adapter to populate.
+            sync (Sync): The Sync whose snapshot to use; it must have been run with adapter snapshots enabled.
+            side (str): Which adapter of that Sync to use, as a `SyncAdapterSideChoices` value.
+
+        Returns:
+            diffsync.Adapter: The populated adapter.
+        """
+        return sync.adapter_snapshots.get(side=side).load_into(adapter)
+
+    @staticmethod
+    def _merge_adapter_snapshot(adapter, snapshot_data, deletions):
+        """Add the objects from the snapshot that aren't already loaded into the adapter.
+
+        For objects present in both, the children of the snapshotted object are added to those of the loaded object, so
+        that unchanged children of a changed parent aren't lost.
+
+        Returns:
+            int: The number of objects added from the snapshot.
+        """
+        count = 0
+        for model_name, objects in snapshot_data.items():
+            model_class = getattr(adapter, model_name)
+            for data in objects:
+                snapshot_object = model_class(**data)
+                unique_id = snapshot_object.get_unique_id()
+                if (model_name, unique_id) in deletions:
+                    continue
+                try:
+                    diffsync_object = adapter.get(model_name, unique_id)
+                except ObjectNotFound:
+                    diffsync_object = snapshot_object
+                    for child_field in diffsync_object._children.values():  # pylint: disable=protected-access
+                        setattr(diffsync_object, child_field, [])
+                    adapter.add(diffsync_object)
+                    count += 1
+                for child_type, child_field in diffsync_object._children.items():  # pylint: disable=protected-access
+                    children = getattr(diffsync_object, child_field)
+                    for child_id in getattr(snapshot_object, child_field):
+                        if child_id not in children and (child_type, child_id) not in deletions:
+                            children.append(child_id)
+        return count
+
+    @staticmethod
+    def _timed_load(load_method):
+        """Call the given adapter load method and return how long it took."""
+        start_time = datetime.now()
+        load_method()
+        return datetime.now() - start_time
+
+    def _timed_load_in_worker_thread(self, load_method):
+        """Wrap `_timed_load` for execution outside the main thread.
+
+        Django opens one database connection per thread, so the connections opened by the worker thread need to be
+        closed explicitly once it is done - otherwise they would leak until the database server times them out.
+        """
+        if self._cpu_profiler is not None:
+            self._cpu_profiler.add_thread()
+        try:
+            return self._timed_load(load_method)
+        finally:
+            if self._cpu_profiler is not None:
+                self._cpu_profiler.remove_thread()
+            connections.close_all()
+
+    def _load_adapters_concurrently(self):
+        """Load the source adapter in a worker thread while loading the target adapter in the current thread.
+
+        The overall load time thus becomes the maximum rather than the sum of the two load times. Any exception raised
+        while loading the source adapter is re-raised here once the target adapter has finished loading.
+
+        Returns:
+            tuple: The source load time and the target load time, as `timedelta` objects.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ssot-source-load") as executor:
+            source_future = executor.submit(self._timed_load_in_worker_thread, self.load_source_adapter)
+            target_load_time = self._timed_load(self.load_target_adapter)
+            source_load_time = source_future.result()
+        return source_load_time, target_load_time
+
     def lookup_object(  # pylint: disable=unused-argument
         self,
         model_name,
@@ -220,6 +804,75 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """
         return None
 
+    def lookup_objects(self, model_name, unique_ids) -> Dict[str, BaseModel]:
+        """Look up the Nautobot records, if any, identified by the given model name and set of unique IDs.
+
+        Bulk variant of `lookup_object`, used to resolve the objects for all SyncLogEntry records of a given model
+        with as few database queries as possible. Unique IDs missing from the returned dictionary are looked up
+        individually through `lookup_object` instead.
+
+        The default implementation looks up the given unique IDs in the source and target adapters, and retrieves the
+        records of all `nautobot_ssot.contrib.NautobotModel` instances found there by primary key in a single query.
+        Override this with a natural-key based lookup (e.g. `name__in=unique_ids`) if your adapters don't use these
+        models.
+
+        Args:
+            model_name (str): DiffSyncModel class name or similar class/model label.
+            unique_ids (set): DiffSyncModel unique_ids or similar unique identifiers.
+
+        Returns:
+            Dict[str, BaseModel]: Nautobot model instances by unique ID.
+        """
+        pks_by_model_class = defaultdict(dict)
+        for adapter in (self.source_adapter, self.target_adapter):
+            if adapter is None:
+                continue
+            for unique_id in unique_ids:
+                try:
+                    diffsync_object = adapter.get(model_name, unique_id)
+                except ObjectNotFound:
+                    continue
+                if not isinstance(diffsync_object, NautobotModel) or diffsync_object.pk is None:
+                    continue
+                model_class = diffsync_object._model  # pylint: disable=protected-access
+                pks_by_model_class[model_class][diffsync_object.pk] = unique_id
+
+        objects = {}
+        for model_class, unique_ids_by_pk in pks_by_model_class.items():
+            for pk, obj in model_class.objects.in_bulk(list(unique_ids_by_pk)).items():
+                objects[unique_ids_by_pk[pk]] = obj
+        return objects
+
+    def _resolve_synced_objects(self, entries):
+        """Link SyncLogEntry records created from DiffSync log events to the Nautobot records they describe.
+
+        This runs when the entries are written to the database, so that the objects were already created, updated or
+        deleted by the sync. Each model triggers a single `lookup_objects` call covering the unique IDs of all given
+        entries, `lookup_object` is then called once for each unique ID it didn't return.
+
+        Args:
+            entries (list): `(entry, (model_name, unique_id))` tuples.
+        """
+        unique_ids_by_model = defaultdict(set)
+        for _, (model_name, unique_id) in entries:
+            unique_ids_by_model[model_name].add(unique_id)
+
+        synced_objects = {}
+        for model_name, unique_ids in unique_ids_by_model.items():
+            found_objects = self.lookup_objects(model_name, unique_ids)
+            for unique_id in unique_ids:
+                synced_object = found_objects.get(unique_id)
+                if synced_object is None:
+                    synced_object = self.lookup_object(model_name, unique_id)  # pylint: disable=assignment-from-none
+                # Misses are kept as None, so that they are only looked up once.
+                synced_objects[model_name, unique_id] = synced_object
+
+        for entry, key in entries:
+            synced_object = synced_objects[key]
+            if synced_object is not None:
+                entry.synced_object = synced_object
+                entry.object_repr = repr(synced_object)
+
     @classmethod
     def data_mappings(cls) -> Iterable[DataMapping]:
         """List the data mappings involved in this sync job."""
@@ -242,12 +895,20 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         diff=None,
         synced_object=None,
         object_repr="",
+        synced_object_key=None,
     ):
-        """Log a action message as a SyncLogEntry."""
+        """Log a action message as a SyncLogEntry.
+
+        While the job is running, the entry is buffered and written to the database in a batch together with other
+        entries; see `flush_sync_log`. Otherwise, it is written to the database immediately.
+
+        Rather than a `synced_object`, a `(model_name, unique_id)` tuple may be passed as `synced_object_key`, to look
+        up the synced object through `lookup_objects`/`lookup_object` when the entry is written to the database.
+        """
         if synced_object and not object_repr:
             object_repr = repr(synced_object)
 
-        SyncLogEntry.objects.create(
+        entry = SyncLogEntry(
             sync=self.sync,
             action=action,
             status=status,
@@ -256,24 +917,42 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             synced_object=synced_object,
             object_repr=object_repr,
         )
+        if self._sync_log_buffer is not None:
+            self._sync_log_buffer.add(entry, synced_object_key)
+        else:
+            if synced_object_key is not None:
+                self._resolve_synced_objects([(entry, synced_object_key)])
+            entry.save()
+
+    def flush_sync_log(self):
+        """Write any buffered SyncLogEntry records to the database."""
+        if self._sync_log_buffer is not None:
+            self._sync_log_buffer.flush()
 
     def _structlog_to_sync_log_entry(self, _logger, _log_method, event_dict):
         """Capture certain structlog messages from DiffSync into the Nautobot database."""
         if all(key in event_dict for key in ("src", "dst", "action", "model", "unique_id", "diffs", "status")):
+            if self._last_sync_event_time is not None:
+                # DiffSync logs each element right after processing it, so the time since the previous element was
+                # logged is the time spent creating/updating/deleting this one.
+                self.record_model_statistic(
+                    "sync",
+                    event_dict["model"],
+                    event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                    seconds=time.perf_counter() - self._last_sync_event_time,
+                )
             # The DiffSync log gives us a model name (string) and unique_id (string).
-            # Try to look up the actual Nautobot object that this describes.
-            synced_object = self.lookup_object(  # pylint: disable=assignment-from-none
-                event_dict["model"], event_dict["unique_id"]
-            )
-            object_repr = repr(synced_object) if synced_object else f"{event_dict['model']} {event_dict['unique_id']}"
+            # The actual Nautobot object that this describes is looked up when the log entry is written.
             self.sync_log(
                 action=event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
                 diff=event_dict["diffs"] if event_dict["action"] else None,
                 status=event_dict["status"],
                 message=event_dict["event"],
-                synced_object=synced_object,
-                object_repr=object_repr,
+                object_repr=f"{event_dict['model']} {event_dict['unique_id']}",
+                synced_object_key=(event_dict["model"], event_dict["unique_id"]),
             )
+            if self._last_sync_event_time is not None:
+                self._last_sync_event_time = time.perf_counter()
 
         return event_dict
 
@@ -289,6 +968,13 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         if hasattr(cls, "memory_profiling"):
             got_vars["memory_profiling"] = cls.memory_profiling
+
+        if hasattr(cls, "cpu_profiling"):
+            got_vars["cpu_profiling"] = cls.cpu_profiling
+
+        for name in ("sync_partition", "parent_sync"):
+            if hasattr(cls, name):
+                got_vars[name] = getattr(cls, name)
         return got_vars
 
     def __init__(self):
@@ -298,6 +984,18 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         self.diff = None
         self.source_adapter = None
         self.target_adapter = None
+        self._sync_log_buffer = None
+        self._cpu_profiler = None
+        # While `sync_partitions` runs, the partition currently being synced, see `get_partitions`.
+        self.current_partition = None
+        # Per-model object counts and durations of this sync, see `record_model_statistic`.
+        self.model_statistics = {}
+        # While executing the sync, when the previous element was logged by DiffSync.
+        self._last_sync_event_time = None
+        # With incremental sync enabled, the previous Sync whose adapter snapshots fill in unchanged records.
+        self.incremental_baseline = None
+        # Watermark for adapters supporting incremental loads: records not changed since then don't need to be loaded.
+        self.changed_since = None
         # Default diffsync flags. You can overwrite them at any time.
         self.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE | DiffSyncFlags.LOG_UNCHANGED_RECORDS
 
@@ -319,6 +1017,31 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """The system or data source being modified by this sync."""
         return getattr(cls.Meta, "data_target", cls.name)
 
+    @classproperty
+    def parallel_loading(cls):
+        """Whether the source and target adapters are loaded concurrently rather than one after the other."""
+        return getattr(cls.Meta, "parallel_loading", False)
+
+    @classproperty
+    def diff_storage(cls):
+        """How the diff of each Sync is persisted to the database, as a `DiffStorageChoices` value."""
+        return getattr(cls.Meta, "diff_storage", PLUGIN_SETTINGS.get("diff_storage", DiffStorageChoices.STORAGE_JSON))
+
+    @classproperty
+    def incremental_sync(cls):
+        """Whether adapters may load only the records changed since the last successful sync; see `changed_since`."""
+        return getattr(cls.Meta, "incremental_sync", False)
+
+    @classproperty
+    def distribute_partitions(cls):
+        """Whether the partitions returned by `get_partitions` are synced by child jobs rather than one by one."""
+        return getattr(cls.Meta, "distribute_partitions", False)
+
+    @classproperty
+    def save_adapter_snapshots(cls):
+        """Whether the data loaded into the adapters is persisted for reuse, e.g. by `load_adapter_from_snapshot`."""
+        return getattr(cls.Meta, "save_adapter_snapshots", False)
+
     @classproperty
     def data_source_icon(cls):
         """Icon corresponding to the data_source."""
@@ -329,8 +1052,12 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """Icon corresponding to the data_target."""
         return getattr(cls.Meta, "data_target_icon", None)
 
-    def run(self, dryrun, memory_profiling, *args, **kwargs):  # pylint:disable=arguments-differ
+    def run(  # pylint:disable=arguments-differ
+        self, dryrun, memory_profiling, *args, cpu_profiling=False, sync_partition="", parent_sync="", **kwargs
+    ):
         """Job entry point from Nautobot - do not override!"""
+        if sync_partition:
+            self.current_partition = json.loads(sync_partition)
         self.sync = Sync.objects.create(
             source=self.data_source,
             target=self.data_target,
@@ -338,8 +1065,20 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             job_result=self.job_result,
             start_time=timezone.now(),
             diff={},
+            parent_id=parent_sync or None,
+            partition=str(self.current_partition) if sync_partition else "",
         )
 
+        if self.incremental_sync and not sync_partition:
+            self.incremental_baseline = self._get_incremental_baseline()
+            if self.incremental_baseline:
+                self.changed_since = self.incremental_baseline.start_time
+                self.logger.info("Incremental sync, loading records changed since %s.", self.changed_since)
+            else:
+                self.logger.info("No previous successful sync found, loading all records.")
+        if (self.incremental_sync or self.save_adapter_snapshots) and not sync_partition:
+            self._delete_stale_adapter_snapshots()
+
         # Add _structlog_to_sync_log_entry as a processor for structlog calls from DiffSync
         structlog.configure(
             processors=[
@@ -351,7 +1090,32 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
-        self.sync_data(memory_profiling)
+        self._sync_log_buffer = SyncLogEntryBuffer(
+            max_size=self.sync_log_batch_size,
+            max_age=self.sync_log_flush_interval,
+            resolve_synced_objects=self._resolve_synced_objects,
+        )
+        if cpu_profiling:
+            self._cpu_profiler = SamplingProfiler(interval=self.cpu_profiling_interval)
+            self._cpu_profiler.start()
+        try:
+            partitions = None if sync_partition else self.get_partitions()
+            if partitions is None:
+                self.sync_data(memory_profiling)
+            elif self.distribute_partitions:
+                self.sync_distributed_partitions(partitions)
+            else:
+                self.sync_partitions(partitions, memory_profiling)
+        finally:
+            # Make sure that no log entries are lost, even if the sync failed partway through.
+            self.flush_sync_log()
+            self._sync_log_buffer = None
+            if self._cpu_profiler is not None:
+                self._save_cpu_profiles()
+
+        # Child syncs only cover part of the data, so only their parent is recorded.
+        if self.job_result and self.job_result.job_model and not parent_sync:
+            SyncMetricWindow.record_sync(self.sync, window_size=PLUGIN_SETTINGS.get("metrics_histogram_window", 100))
 
 
 # pylint: disable=abstract-method
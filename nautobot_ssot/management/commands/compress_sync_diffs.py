@@ -0,0 +1,36 @@
+"""Django Management command to move existing Sync diffs into the compressed diff field."""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from nautobot_ssot.models import Sync
+
+
+class Command(BaseCommand):
+    """MGMT command to compress the diffs of existing Sync records to save database space."""
+
+    help = (
+        "Move the diffs of existing Sync records from the `diff` JSON field into the gzip-compressed "
+        "`diff_compressed` field."
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument(
+            "-b",
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of Sync records to compress per database transaction.",
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        batch_size = options["batch_size"]
+        syncs = Sync.objects.filter(diff_compressed__isnull=True).exclude(diff={}).only("pk", "diff")
+        pks = list(syncs.values_list("pk", flat=True))
+        for start in range(0, len(pks), batch_size):
+            with transaction.atomic():
+                for sync in syncs.filter(pk__in=pks[start : start + batch_size]).iterator():
+                    sync.diff_compressed = Sync.compress_diff(sync.diff)
+                    sync.diff = {}
+                    sync.save(update_fields=["diff", "diff_compressed"])
+        self.stdout.write(f"Compressed the diffs of {len(pks)} Sync records.")
@@ -0,0 +1,45 @@
+"""Django Management command to diff the adapter snapshots of two Sync records."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_ssot.choices import SyncAdapterSideChoices
+from nautobot_ssot.models import SyncAdapterSnapshot
+
+
+class Command(BaseCommand):
+    """MGMT command to show how the data loaded into an adapter changed between two Syncs, without loading it again."""
+
+    help = (
+        "Calculate the diff between the adapter snapshots of two Sync records, showing the changes from the first "
+        "Sync to the second one. Both Syncs must have been run with adapter snapshots enabled."
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument("from_sync", help="Primary key of the earlier Sync.")
+        parser.add_argument("to_sync", help="Primary key of the later Sync.")
+        parser.add_argument(
+            "-s",
+            "--side",
+            choices=SyncAdapterSideChoices.values(),
+            default=SyncAdapterSideChoices.SIDE_SOURCE,
+            help="Which adapter snapshot of the Syncs to compare.",
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        adapters = []
+        for sync_pk in (options["from_sync"], options["to_sync"]):
+            try:
+                snapshot = SyncAdapterSnapshot.objects.get(sync__pk=sync_pk, side=options["side"])
+            except SyncAdapterSnapshot.DoesNotExist as error:
+                raise CommandError(f"No {options['side']} adapter snapshot found for Sync {sync_pk}.") from error
+            try:
+                adapters.append(snapshot.to_adapter())
+            except ValueError as error:
+                raise CommandError(str(error)) from error
+
+        from_adapter, to_adapter = adapters
+        diff = from_adapter.diff_from(to_adapter)
+        summary = diff.summary()
+        self.stdout.write(", ".join(f"{count} {action}" for action, count in summary.items()))
+        if diff.has_diffs():
+            self.stdout.write(diff.str())
@@ -1,16 +1,109 @@
 """Nautobot SSoT framework level metrics."""
 
+import threading
+import time
+from collections import namedtuple
+
 from django.conf import settings
+from django.db.models import Count, OuterRef, Subquery
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models.jobs import Job
-from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.core import GaugeHistogramMetricFamily, GaugeMetricFamily
 
+from nautobot_ssot.choices import SyncMetricKindChoices
 from nautobot_ssot.jobs import get_data_jobs
-from nautobot_ssot.jobs.base import DataSource, DataTarget
-from nautobot_ssot.models import Sync
+from nautobot_ssot.models import Sync, SyncMetricWindow
 
 PLUGIN_SETTINGS = settings.PLUGINS_CONFIG.get("nautobot_ssot", {})
 
+DURATION_FIELDS = ("source_load_time", "target_load_time", "diff_time", "sync_time")
+MEMORY_FIELDS = (
+    "source_load_memory_final",
+    "source_load_memory_peak",
+    "target_load_memory_final",
+    "target_load_memory_peak",
+    "diff_memory_final",
+    "diff_memory_peak",
+    "sync_memory_final",
+    "sync_memory_peak",
+)
+
+# Upper bounds of the histogram buckets for each kind of SyncMetricWindow.
+HISTOGRAM_BUCKETS = {
+    SyncMetricKindChoices.KIND_DURATION: (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200),
+    SyncMetricKindChoices.KIND_MEMORY: tuple(2**exponent for exponent in range(24, 35)),  # 16 MiB to 16 GiB
+    SyncMetricKindChoices.KIND_OPERATIONS: (0, 1, 10, 100, 1000, 10000, 100000),
+}
+
+JobSyncs = namedtuple("JobSyncs", ["job_label", "last_sync", "last_memory_profiled_sync"])
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(key, function):
+    """Return the result of `function()`, caching it for `metrics_cache_ttl` seconds.
+
+    Every collector is called on each Prometheus scrape, so this keeps frequent scrapes from querying the database
+    more than once per TTL.
+    """
+    ttl = PLUGIN_SETTINGS.get("metrics_cache_ttl", 10)
+    with _cache_lock:
+        if ttl and key in _cache and time.monotonic() - _cache[key][0] < ttl:
+            return _cache[key][1]
+    value = function()
+    with _cache_lock:
+        _cache[key] = (time.monotonic(), value)
+    return value
+
+
+def _query_job_syncs():
+    """Return a `JobSyncs` tuple for each Job that has at least one Sync, using two queries in total."""
+    job_syncs = Sync.objects.filter(job_result__job_model_id=OuterRef("pk")).order_by("-start_time").values("pk")
+    jobs = list(
+        Job.objects.annotate(
+            last_sync_pk=Subquery(job_syncs[:1]),
+            last_memory_profiled_sync_pk=Subquery(job_syncs.filter(source_load_memory_final__isnull=False)[:1]),
+        ).filter(last_sync_pk__isnull=False)
+    )
+    sync_pks = {job.last_sync_pk for job in jobs} | {job.last_memory_profiled_sync_pk for job in jobs}
+    syncs = Sync.objects.defer("diff", "diff_compressed").select_related("job_result").in_bulk(sync_pks - {None})
+    return [
+        JobSyncs(".".join(job.natural_key()), syncs[job.last_sync_pk], syncs.get(job.last_memory_profiled_sync_pk))
+        for job in jobs
+    ]
+
+
+def get_job_syncs():
+    """Return the (cached) latest Syncs of each Job as a list of `JobSyncs` tuples.
+
+    The `job_label` of each tuple is the dotted natural key of the Job. Only SSoT jobs create Sync records, so every
+    Job with a Sync is an SSoT job.
+    """
+    return _cached("job_syncs", _query_job_syncs)
+
+
+def _query_sync_counts():
+    """Return a dictionary mapping each JobResult status to the number of Syncs with that status."""
+    return dict(Sync.objects.order_by().values_list("job_result__status").annotate(count=Count("pk")))
+
+
+def _query_metric_windows():
+    """Return `(job_label, kind, name, values)` tuples for all SyncMetricWindow records."""
+    return [
+        (".".join(window.job.natural_key()), window.kind, window.name, window.values)
+        for window in SyncMetricWindow.objects.select_related("job")
+    ]
+
+
+def _histogram_buckets(values, upper_bounds):
+    """Return the cumulative `(upper_bound, count)` buckets of the values, as expected by GaugeHistogramMetricFamily."""
+    buckets = [
+        (str(float(upper_bound)), sum(1 for value in values if value <= upper_bound)) for upper_bound in upper_bounds
+    ]
+    buckets.append(("+Inf", len(values)))
+    return buckets
+
 
 def metric_ssot_jobs():
     """Extracts duration of latest SSoT Job run.
@@ -24,45 +117,16 @@ def metric_ssot_jobs():
         labels=["phase", "job"],
     )
 
-    for job in Job.objects.all():
-        # Skip any jobs that aren't SSoT jobs
-        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
-            continue
-
-        last_job_sync = Sync.objects.filter(job_result__job_model_id=job.id).last()
-        if not last_job_sync:
-            continue
-
-        if last_job_sync.source_load_time:
-            ssot_job_durations.add_metric(
-                labels=["source_load_time", ".".join(job.natural_key())],
-                value=((last_job_sync.source_load_time.seconds * 100000) + last_job_sync.source_load_time.microseconds)
-                / 1000,
-            )
-
-        if last_job_sync.target_load_time:
-            ssot_job_durations.add_metric(
-                labels=["target_load_time", ".".join(job.natural_key())],
-                value=((last_job_sync.target_load_time.seconds * 1000000) + last_job_sync.target_load_time.microseconds)
-                / 1000,
-            )
-
-        if last_job_sync.diff_time:
-            ssot_job_durations.add_metric(
-                labels=["diff_time", ".".join(job.natural_key())],
-                value=((last_job_sync.diff_time.seconds * 1000000) + last_job_sync.diff_time.microseconds) / 1000,
-            )
-
-        if last_job_sync.sync_time:
-            ssot_job_durations.add_metric(
-                labels=["sync_time", ".".join(job.natural_key())],
-                value=((last_job_sync.sync_time.seconds * 1000000) + last_job_sync.sync_time.microseconds) / 1000,
-            )
+    for job, last_job_sync, _ in get_job_syncs():
+        for field in DURATION_FIELDS:
+            duration = getattr(last_job_sync, field)
+            if duration:
+                # Note that, for historical reasons, these values are in milliseconds.
+                ssot_job_durations.add_metric(labels=[field, job], value=duration.total_seconds() * 1000)
 
         if last_job_sync.duration:
             ssot_job_durations.add_metric(
-                labels=["sync_duration", ".".join(job.natural_key())],
-                value=((last_job_sync.duration.seconds * 1000000) + last_job_sync.duration.microseconds) / 1000,
+                labels=["sync_duration", job], value=last_job_sync.duration.total_seconds() * 1000
             )
 
     yield ssot_job_durations
@@ -76,12 +140,11 @@ def metric_syncs():
     """
     sync_gauge = GaugeMetricFamily("nautobot_ssot_sync_total", "Nautobot SSoT Sync Totals", labels=["sync_type"])
 
-    sync_gauge.add_metric(labels=["total_syncs"], value=Sync.objects.all().count())
+    sync_counts = _cached("sync_counts", _query_sync_counts)
+    sync_gauge.add_metric(labels=["total_syncs"], value=sum(sync_counts.values()))
 
-    for status_type in [x[1].lower() for x in JobResultStatusChoices]:
-        sync_gauge.add_metric(
-            labels=[f"{status_type}_syncs"], value=Sync.objects.filter(job_result__status=status_type).count()
-        )
+    for status, label in JobResultStatusChoices:
+        sync_gauge.add_metric(labels=[f"{label.lower()}_syncs"], value=sync_counts.get(status, 0))
 
     yield sync_gauge
 
@@ -96,18 +159,10 @@ def metric_sync_operations():
         "nautobot_ssot_operation_total", "Nautobot SSoT operations by Job", labels=["job", "operation"]
     )
 
-    for job in Job.objects.all():
-        # Skip any jobs that aren't SSoT jobs
-        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
-            continue
-
-        last_job_sync = Sync.objects.filter(job_result__job_model_id=job.id).last()
-        if last_job_sync and last_job_sync.summary:
+    for job, last_job_sync, _ in get_job_syncs():
+        if last_job_sync.summary:
             for operation, value in last_job_sync.summary.items():
-                sync_ops.add_metric(
-                    labels=[".".join(job.natural_key()), operation],
-                    value=value,
-                )
+                sync_ops.add_metric(labels=[job, operation], value=value)
     data_sources, data_targets = get_data_jobs()
     if len(data_sources + data_targets) == 0:
         sync_ops.add_metric(labels=["", ""], value=0)
@@ -125,23 +180,96 @@ def metric_memory_usage():
         "nautobot_ssot_sync_memory_usage_bytes", "Nautobot SSoT Sync Memory Usage", labels=["phase", "job"]
     )
 
-    for job in Job.objects.all():
-        # Skip any jobs that aren't SSoT jobs
-        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
+    for job, _, last_memory_profiled_sync in get_job_syncs():
+        if not last_memory_profiled_sync:
             continue
-        last_job_sync = Sync.objects.filter(
-            job_result__job_model_id=job.id, source_load_memory_final__isnull=False
-        ).last()
-        if last_job_sync and last_job_sync.summary:
-            for operation, value in last_job_sync.summary.items():
-                memory_gauge.add_metric(
-                    labels=[operation, ".".join(job.natural_key())],
-                    value=value,
-                )
-        else:
-            memory_gauge.add_metric(labels=["", ""], value=0)
+        for field in MEMORY_FIELDS:
+            value = getattr(last_memory_profiled_sync, field)
+            if value is not None:
+                memory_gauge.add_metric(labels=[field, job], value=value)
+    if not memory_gauge.samples:
+        memory_gauge.add_metric(labels=["", ""], value=0)
 
     yield memory_gauge
 
 
-metrics = [metric_ssot_jobs, metric_syncs, metric_sync_operations, metric_memory_usage]
+def metric_model_statistics():
+    """Extracts the per-model object counts, durations and throughput of each Job's last Sync.
+
+    Yields:
+        GaugeMetricFamily: Prometheus Metrics
+    """
+    labels = ["job", "phase", "model", "action"]
+    model_objects = GaugeMetricFamily(
+        "nautobot_ssot_model_objects_total", "Nautobot SSoT objects processed per model", labels=labels
+    )
+    model_durations = GaugeMetricFamily(
+        "nautobot_ssot_model_duration_seconds", "Nautobot SSoT time spent per model in seconds", labels=labels
+    )
+    model_throughput = GaugeMetricFamily(
+        "nautobot_ssot_model_throughput_objects_per_second",
+        "Nautobot SSoT objects processed per model per second",
+        labels=labels,
+    )
+
+    for job, last_job_sync, _ in get_job_syncs():
+        for row in last_job_sync.model_statistics_rows:
+            row_labels = [job, row["phase"], row["model"], row["action"]]
+            model_objects.add_metric(labels=row_labels, value=row["count"])
+            if row["seconds"] is not None:
+                model_durations.add_metric(labels=row_labels, value=row["seconds"])
+            if row["rate"] is not None:
+                model_throughput.add_metric(labels=row_labels, value=row["rate"])
+
+    yield model_objects
+    yield model_durations
+    yield model_throughput
+
+
+def metric_sync_histograms():
+    """Histograms of the phase durations, peak memory usage and operation counts over each Job's recent Syncs.
+
+    As the values of old Syncs leave the window, the bucket counts and sums may decrease, which is why these are
+    exported as gauge histograms rather than (cumulative) histograms.
+
+    Yields:
+        GaugeHistogramMetricFamily: Prometheus Metrics
+    """
+    histograms = {
+        SyncMetricKindChoices.KIND_DURATION: GaugeHistogramMetricFamily(
+            "nautobot_ssot_sync_phase_duration_seconds",
+            "Nautobot SSoT Sync Phase Duration in seconds over recent Syncs",
+            labels=["job", "phase"],
+        ),
+        SyncMetricKindChoices.KIND_MEMORY: GaugeHistogramMetricFamily(
+            "nautobot_ssot_sync_memory_peak_bytes",
+            "Nautobot SSoT Sync Peak Memory Usage in bytes over recent Syncs",
+            labels=["job", "phase"],
+        ),
+        SyncMetricKindChoices.KIND_OPERATIONS: GaugeHistogramMetricFamily(
+            "nautobot_ssot_sync_operations",
+            "Nautobot SSoT Sync operations over recent Syncs",
+            labels=["job", "operation"],
+        ),
+    }
+
+    for job_label, kind, name, values in _cached("metric_windows", _query_metric_windows):
+        if kind not in histograms or not values:
+            continue
+        histograms[kind].add_metric(
+            labels=[job_label, name],
+            buckets=_histogram_buckets(values, HISTOGRAM_BUCKETS[kind]),
+            gsum_value=sum(values),
+        )
+
+    yield from histograms.values()
+
+
+metrics = [
+    metric_ssot_jobs,
+    metric_syncs,
+    metric_sync_operations,
+    metric_memory_usage,
+    metric_model_statistics,
+    metric_sync_histograms,
+]
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.25 on 2026-10-18 10:02
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import nautobot_ssot.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0012_alter_synclogentry_timestamp"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncDiffChunk",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("index", models.PositiveIntegerField()),
+                ("model_type", models.CharField(max_length=255)),
+                ("diff", models.JSONField(encoder=nautobot_ssot.models.DiffJSONEncoder)),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="diff_chunks",
+                        related_query_name="diff_chunk",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "index"],
+                "unique_together": {("sync", "index")},
+            },
+        ),
+    ]
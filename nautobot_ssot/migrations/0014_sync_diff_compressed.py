@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0013_syncdiffchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="diff_compressed",
+            field=models.BinaryField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.25 on 2026-10-18 11:27
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0014_sync_diff_compressed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncAdapterSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("side", models.CharField(max_length=32)),
+                ("adapter", models.CharField(help_text="Class name of the snapshotted adapter", max_length=255)),
+                ("data", models.BinaryField(editable=False)),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="adapter_snapshots",
+                        related_query_name="adapter_snapshot",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "side"],
+                "unique_together": {("sync", "side")},
+            },
+        ),
+    ]
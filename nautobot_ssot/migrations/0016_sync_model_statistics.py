@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0015_syncadaptersnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="model_statistics",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:48
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0102_set_null_objectchange_contenttype"),
+        ("nautobot_ssot", "0016_sync_model_statistics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncMetricWindow",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("kind", models.CharField(max_length=32)),
+                ("name", models.CharField(max_length=64)),
+                ("values", models.JSONField(default=list, help_text="Values of the most recent Syncs, oldest first")),
+                (
+                    "job",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="extras.job"),
+                ),
+            ],
+            options={
+                "ordering": ["job", "kind", "name"],
+                "unique_together": {("job", "kind", "name")},
+            },
+        ),
+    ]
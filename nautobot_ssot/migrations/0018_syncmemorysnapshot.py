@@ -0,0 +1,48 @@
+# Generated by Django 3.2.25 on 2026-10-18 13:34
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0017_syncmetricwindow"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncMemorySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("phase", models.CharField(max_length=32)),
+                ("timestamp", models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                (
+                    "top_allocations",
+                    models.JSONField(
+                        default=list,
+                        help_text="Allocation sites holding the most memory, as file/line/size/count dictionaries",
+                    ),
+                ),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="memory_snapshots",
+                        related_query_name="memory_snapshot",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "timestamp"],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0018_syncmemorysnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="children",
+                to="nautobot_ssot.sync",
+            ),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="partition",
+            field=models.CharField(blank=True, help_text="Partition synced by this child Sync", max_length=255),
+        ),
+    ]
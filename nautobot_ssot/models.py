@@ -15,28 +15,42 @@ The interaction between these models and Nautobot's native JobResult model deser
     which have a different set of content requirements, but is used for high-level status reporting.
 
 JobResult 1<->1 Sync 1-->n SyncLogEntry
+                   Sync 1-->n SyncDiffChunk
+                   Sync 1-->n SyncAdapterSnapshot
+                   Sync 1-->n SyncMemorySnapshot
+Job 1-->n SyncMetricWindow
 """
 
+import gzip
+import json
 from datetime import timedelta
+from itertools import islice
 
+from diffsync import Adapter
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils.formats import date_format
+from django.utils.module_loading import import_string
 from django.utils.timezone import now
 from nautobot.core.models import BaseModel
 from nautobot.extras.choices import JobResultStatusChoices
-from nautobot.extras.models import JobResult
+from nautobot.extras.models import Job, JobResult
 from nautobot.extras.utils import extras_features
 
 from nautobot_ssot.integrations.infoblox.models import SSOTInfobloxConfig
 from nautobot_ssot.integrations.itential.models import AutomationGatewayModel
 from nautobot_ssot.integrations.servicenow.models import SSOTServiceNowConfig
 
-from .choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from .choices import (
+    SyncAdapterSideChoices,
+    SyncLogEntryActionChoices,
+    SyncLogEntryStatusChoices,
+    SyncMetricKindChoices,
+)
 
 
 class DiffJSONEncoder(DjangoJSONEncoder):
@@ -49,6 +63,16 @@ class DiffJSONEncoder(DjangoJSONEncoder):
         return super().default(o)
 
 
+def compress_json(data):
+    """Encode JSON-serializable data (as per DiffJSONEncoder) into gzip-compressed bytes."""
+    return gzip.compress(json.dumps(data, cls=DiffJSONEncoder).encode("utf-8"))
+
+
+def decompress_json(data):
+    """Decode the gzip-compressed bytes created by `compress_json`."""
+    return json.loads(gzip.decompress(data))
+
+
 @extras_features(
     "custom_links",
 )
@@ -80,9 +104,16 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         default=False, help_text="Report what data would be synced but do not make any changes"
     )
     diff = models.JSONField(blank=True, encoder=DiffJSONEncoder)
+    # Alternative to `diff`, holding the gzip-compressed JSON representation of the diff. See `decoded_diff`.
+    diff_compressed = models.BinaryField(blank=True, null=True, editable=False)
     summary = models.JSONField(blank=True, null=True)
+    # Object counts and durations per phase, DiffSync model and action, see `model_statistics_rows`.
+    model_statistics = models.JSONField(blank=True, default=dict, editable=False)
 
     job_result = models.ForeignKey(to=JobResult, on_delete=models.CASCADE, blank=True, null=True)
+    # For syncs whose partitions are distributed across workers, the Sync of the coordinating job.
+    parent = models.ForeignKey(to="self", on_delete=models.SET_NULL, blank=True, null=True, related_name="children")
+    partition = models.CharField(max_length=255, blank=True, help_text="Partition synced by this child Sync")
 
     class Meta:
         """Metaclass attributes of Sync model."""
@@ -101,7 +132,7 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     def annotated_queryset(cls):
         """Construct an efficient queryset for this model and related data."""
         return (
-            cls.objects.defer("diff")
+            cls.objects.defer("diff", "diff_compressed")
             .select_related("job_result")
             .prefetch_related("logs")
             .annotate(
@@ -129,6 +160,54 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         if self.job_result and self.job_result.date_done:
             return self.job_result.date_done - self.start_time
 
+    @staticmethod
+    def compress_diff(diff):
+        """Encode a diff dictionary into the gzip-compressed JSON representation stored in `diff_compressed`."""
+        return compress_json(diff)
+
+    @property
+    def decoded_diff(self):
+        """The diff dictionary of this Sync, transparently decompressing `diff_compressed` if it is set."""
+        if self.diff_compressed:
+            return decompress_json(self.diff_compressed)
+        return self.diff
+
+    @property
+    def model_statistics_rows(self):
+        """The `model_statistics` of this Sync as a flat list of dictionaries, including the throughput.
+
+        `model_statistics` is a nested dictionary of the form `{phase: {model_name: {action: {"count": int, "seconds":
+        float or None}}}}`, where the phase is one of "source_load", "target_load" and "sync".
+        """
+        rows = []
+        for phase, phase_statistics in self.model_statistics.items():
+            for model_name, model_statistics in phase_statistics.items():
+                for action, statistics in model_statistics.items():
+                    seconds = statistics.get("seconds")
+                    rows.append(
+                        {
+                            "phase": phase,
+                            "model": model_name,
+                            "action": action,
+                            "count": statistics["count"],
+                            "seconds": seconds,
+                            "rate": statistics["count"] / seconds if seconds else None,
+                        }
+                    )
+        return rows
+
+    @property
+    def cpu_profile_files(self):
+        """The collapsed stack files saved by the `cpu_profiling` option of this Sync, as FileProxy records."""
+        if not self.job_result:
+            return []
+        return self.job_result.files.filter(name__startswith="cpu_profile_").order_by("uploaded_at")
+
+    @property
+    def has_chunked_diff(self):
+        """Whether the diff of this Sync is stored as SyncDiffChunk records rather than in the `diff` field."""
+        return self.diff_chunks.exists()
+
     def get_source_url(self):
         """Get the absolute url of the source worker associated with this instance."""
         if self.source == "Nautobot" or not self.job_result:
@@ -148,6 +227,171 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         )
 
 
+class SyncDiffChunk(BaseModel):
+    """A slice of the diff of a single Sync, holding the diffs of up to a fixed number of top-level DiffSync objects.
+
+    Storing the diff in chunks avoids the size limits (and memory footprint) of serializing the diff into the single
+    `Sync.diff` JSON field, and allows the diff to be read back one chunk at a time.
+    """
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="diff_chunks", related_query_name="diff_chunk"
+    )
+    index = models.PositiveIntegerField()
+    model_type = models.CharField(max_length=255)
+    diff = models.JSONField(encoder=DiffJSONEncoder)
+
+    class Meta:
+        """Metaclass attributes of SyncDiffChunk."""
+
+        ordering = ["sync", "index"]
+        unique_together = [["sync", "index"]]
+
+    def __str__(self):
+        """String representation of a SyncDiffChunk instance."""
+        return f"{self.sync} diff chunk {self.index} ({self.model_type})"
+
+    @classmethod
+    def save_diff(cls, sync, diff, chunk_size=500, batch_size=10, start_index=0):
+        """Stream a DiffSync `Diff` into SyncDiffChunk records without building the complete diff dictionary.
+
+        Mirrors `Diff.dict()`, in that only top-level elements with any diffs (including in their children) are stored.
+
+        Args:
+            sync (Sync): The Sync the diff belongs to.
+            diff (diffsync.diff.Diff): The diff to store.
+            chunk_size (int): Maximum number of top-level elements per chunk.
+            batch_size (int): Number of chunks to write to the database per INSERT.
+            start_index (int): Index of the first chunk, for appending to the chunks already stored for this Sync.
+
+        Returns:
+            int: The number of chunks created.
+        """
+        chunks = cls._iter_chunks(sync, diff, chunk_size, start_index)
+        count = 0
+        while batch := list(islice(chunks, batch_size)):
+            cls.objects.bulk_create(batch)
+            count += len(batch)
+        return count
+
+    @classmethod
+    def _iter_chunks(cls, sync, diff, chunk_size, start_index):
+        index = start_index
+        model_type = None
+        elements = {}
+        for element in diff.get_children():
+            if not element.has_diffs(include_children=True):
+                continue
+            if elements and (element.type != model_type or len(elements) >= chunk_size):
+                yield cls(sync=sync, index=index, model_type=model_type, diff=elements)
+                index += 1
+                elements = {}
+            model_type = element.type
+            elements[element.name] = element.dict()
+        if elements:
+            yield cls(sync=sync, index=index, model_type=model_type, diff=elements)
+
+    @staticmethod
+    def merge(chunks):
+        """Combine the given chunks into a single diff dictionary, as returned by `Diff.dict()`."""
+        diff = {}
+        for chunk in chunks:
+            diff.setdefault(chunk.model_type, {}).update(chunk.diff)
+        return diff
+
+
+class SyncAdapterSnapshot(BaseModel):
+    """The data loaded into the source or target DiffSync adapter of a Sync, for reuse by later Syncs.
+
+    The data is stored as gzip-compressed JSON of the following form:
+
+        {
+            "top_level": ["model_name", ...],
+            "models": {"model_name": "import.path.of.DiffSyncModelClass", ...},
+            "objects": {"model_name": [model_dict, ...], ...},
+        }
+    """
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="adapter_snapshots", related_query_name="adapter_snapshot"
+    )
+    side = models.CharField(max_length=32, choices=SyncAdapterSideChoices)
+    adapter = models.CharField(max_length=255, help_text="Class name of the snapshotted adapter")
+    data = models.BinaryField(editable=False)
+
+    class Meta:
+        """Metaclass attributes of SyncAdapterSnapshot."""
+
+        ordering = ["sync", "side"]
+        unique_together = [["sync", "side"]]
+
+    def __str__(self):
+        """String representation of a SyncAdapterSnapshot instance."""
+        return f"{self.sync} {self.side} snapshot ({self.adapter})"
+
+    @classmethod
+    def save_adapter(cls, sync, side, adapter):
+        """Create or replace the snapshot of the given side of the given Sync from a loaded DiffSync adapter."""
+        model_names = adapter.store.get_all_model_names()
+        data = {
+            "top_level": list(adapter.top_level),
+            "models": {
+                model_name: f"{getattr(adapter, model_name).__module__}.{getattr(adapter, model_name).__qualname__}"
+                for model_name in model_names
+            },
+            "objects": {
+                model_name: [diffsync_object.dict() for diffsync_object in adapter.get_all(model_name)]
+                for model_name in model_names
+            },
+        }
+        snapshot, _ = cls.objects.update_or_create(
+            sync=sync,
+            side=side,
+            defaults={"adapter": adapter.__class__.__name__, "data": compress_json(data)},
+        )
+        return snapshot
+
+    def get_data(self):
+        """Return the decoded snapshot data."""
+        return decompress_json(self.data)
+
+    def load_into(self, adapter):
+        """Load the snapshotted objects into the given (empty) adapter instead of calling its `load` method.
+
+        Args:
+            adapter (diffsync.Adapter): An instance of the snapshotted adapter class, or any adapter class providing
+                the same DiffSync models.
+
+        Returns:
+            diffsync.Adapter: The adapter that was passed in.
+        """
+        for model_name, objects in self.get_data()["objects"].items():
+            model_class = getattr(adapter, model_name)
+            for values in objects:
+                adapter.add(model_class(**values))
+        return adapter
+
+    def to_adapter(self):
+        """Construct a standalone adapter holding the snapshotted objects, e.g. for diffing two snapshots offline.
+
+        As the original adapter class may require arguments such as API clients for instantiation, a plain
+        `diffsync.Adapter` subclass with the same DiffSync models and `top_level` is used instead.
+        """
+        data = self.get_data()
+        attributes = {"top_level": data["top_level"]}
+        for model_name, model_path in data["models"].items():
+            try:
+                attributes[model_name] = import_string(model_path)
+            except ImportError as error:
+                raise ValueError(f"Unable to import DiffSync model '{model_path}' of {self}.") from error
+        adapter = type(self.adapter, (Adapter,), attributes)(name=str(self))
+        for model_name, objects in data["objects"].items():
+            model_class = attributes[model_name]
+            for values in objects:
+                adapter.add(model_class(**values))
+        return adapter
+
+
 class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     """Record of a single event during a data sync operation.
 
@@ -164,7 +408,8 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     """
 
     sync = models.ForeignKey(to=Sync, on_delete=models.CASCADE, related_name="logs", related_query_name="log")
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Not `auto_now_add`, as entries may be written to the database in batches some time after the event occurred.
+    timestamp = models.DateTimeField(default=now, editable=False)
 
     action = models.CharField(max_length=32, choices=SyncLogEntryActionChoices)
     status = models.CharField(max_length=32, choices=SyncLogEntryStatusChoices)
@@ -215,10 +460,132 @@ class SSOTConfig(models.Model):  # pylint: disable=nb-incorrect-base-class
         default_permissions = ("view",)
 
 
+class SyncMemorySnapshot(BaseModel):
+    """The top memory allocation sites traced by the `memory_profiling` option at the end of one phase of a Sync."""
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="memory_snapshots", related_query_name="memory_snapshot"
+    )
+    phase = models.CharField(max_length=32)
+    timestamp = models.DateTimeField(default=now, editable=False)
+    top_allocations = models.JSONField(
+        default=list, help_text="Allocation sites holding the most memory, as file/line/size/count dictionaries"
+    )
+
+    class Meta:
+        """Metaclass attributes of SyncMemorySnapshot."""
+
+        ordering = ["sync", "timestamp"]
+
+    def __str__(self):
+        """String representation of a SyncMemorySnapshot instance."""
+        return f"{self.sync} {self.phase} memory snapshot"
+
+    @classmethod
+    def from_tracemalloc(cls, sync, phase, snapshot, limit=25):
+        """Create a SyncMemorySnapshot from the top allocation sites of a `tracemalloc` snapshot, grouped by line.
+
+        As the traces are cleared at the end of each phase, the snapshot only holds the allocations made during `phase`
+        that were still held at its end.
+
+        Args:
+            sync (Sync): The Sync being profiled.
+            phase (str): The phase at the end of which `snapshot` was taken.
+            snapshot (tracemalloc.Snapshot): Snapshot of the traced allocations.
+            limit (int): Number of allocation sites to keep.
+        """
+        top_allocations = [
+            {
+                "file": statistic.traceback[0].filename,
+                "line": statistic.traceback[0].lineno,
+                "size": statistic.size,
+                "count": statistic.count,
+            }
+            for statistic in snapshot.statistics("lineno")[:limit]
+        ]
+        return cls.objects.create(sync=sync, phase=phase, top_allocations=top_allocations)
+
+
+class SyncMetricWindow(BaseModel):
+    """The values of one metric across the most recent Syncs of a Job, from which the histogram metrics are built.
+
+    These are maintained incrementally as each Sync finishes, so that exporting the metrics doesn't require aggregating
+    over the Sync table.
+    """
+
+    # Sync fields recorded for each kind of metric. Operation counts are taken from the keys of Sync.summary instead.
+    FIELDS = {
+        SyncMetricKindChoices.KIND_DURATION: ("source_load_time", "target_load_time", "diff_time", "sync_time"),
+        SyncMetricKindChoices.KIND_MEMORY: (
+            "source_load_memory_peak",
+            "target_load_memory_peak",
+            "diff_memory_peak",
+            "sync_memory_peak",
+        ),
+    }
+
+    job = models.ForeignKey(to=Job, on_delete=models.CASCADE, related_name="+")
+    kind = models.CharField(max_length=32, choices=SyncMetricKindChoices)
+    name = models.CharField(max_length=64)
+    values = models.JSONField(default=list, help_text="Values of the most recent Syncs, oldest first")
+
+    class Meta:
+        """Metaclass attributes of SyncMetricWindow."""
+
+        ordering = ["job", "kind", "name"]
+        unique_together = [["job", "kind", "name"]]
+
+    def __str__(self):
+        """String representation of a SyncMetricWindow instance."""
+        return f"{self.job} {self.kind} {self.name}"
+
+    @staticmethod
+    def get_sync_values(sync):
+        """Return the `(kind, name, value)` tuples to record for the given Sync."""
+        sync_values = []
+        for field in SyncMetricWindow.FIELDS[SyncMetricKindChoices.KIND_DURATION]:
+            if getattr(sync, field) is not None:
+                sync_values.append((SyncMetricKindChoices.KIND_DURATION, field, getattr(sync, field).total_seconds()))
+        for field in SyncMetricWindow.FIELDS[SyncMetricKindChoices.KIND_MEMORY]:
+            if getattr(sync, field) is not None:
+                sync_values.append((SyncMetricKindChoices.KIND_MEMORY, field, getattr(sync, field)))
+        for operation, count in (sync.summary or {}).items():
+            sync_values.append((SyncMetricKindChoices.KIND_OPERATIONS, operation, count))
+        return sync_values
+
+    @classmethod
+    def record_sync(cls, sync, window_size=100):
+        """Append the values of a finished Sync to the windows of its Job, dropping those of the oldest Syncs.
+
+        Args:
+            sync (Sync): The finished Sync, which must belong to a JobResult with a Job.
+            window_size (int): Maximum number of values to keep per window.
+        """
+        sync_values = cls.get_sync_values(sync)
+        with transaction.atomic():
+            windows = {
+                (window.kind, window.name): window
+                for window in cls.objects.select_for_update().filter(job=sync.job_result.job_model)
+            }
+            new_windows = []
+            for kind, name, value in sync_values:
+                window = windows.get((kind, name))
+                if window is None:
+                    new_windows.append(cls(job=sync.job_result.job_model, kind=kind, name=name, values=[value]))
+                else:
+                    window.values = (window.values + [value])[-window_size:]
+                    window.save(update_fields=["values"])
+            cls.objects.bulk_create(new_windows, ignore_conflicts=True)
+
+
 __all__ = (
     "SSOTInfobloxConfig",
     "AutomationGatewayModel",
     "SSOTServiceNowConfig",
     "Sync",
+    "SyncAdapterSnapshot",
+    "SyncDiffChunk",
     "SyncLogEntry",
+    "SyncMemorySnapshot",
+    "SyncMetricWindow",
 )
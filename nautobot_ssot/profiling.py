@@ -0,0 +1,82 @@
+"""Sampling CPU profiler for SSoT jobs."""
+
+import sys
+import threading
+from collections import Counter, defaultdict
+
+
+class SamplingProfiler:
+    """Statistical profiler that periodically records the call stacks of the profiled threads.
+
+    Unlike deterministic profilers such as cProfile, the profiled code isn't instrumented at all; a background thread
+    merely inspects the stacks of the profiled threads every `interval` seconds. This keeps the overhead low enough for
+    production syncs, at the expense of precision for very short function calls.
+
+    Samples are grouped by `phase`, which the profiled code can change at any time. For each phase, the samples can be
+    exported in the "collapsed stack" format understood by flame graph tools such as `flamegraph.pl` and speedscope.
+    """
+
+    def __init__(self, interval=0.01, max_depth=128):
+        """Initialize the profiler.
+
+        Args:
+            interval (float): Seconds between two samples.
+            max_depth (int): Maximum number of (innermost) frames recorded per stack.
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.phase = None
+        self.samples = defaultdict(Counter)
+        self._thread_ids = set()
+        self._stop_event = threading.Event()
+        self._sampler_thread = None
+
+    def add_thread(self, thread_id=None):
+        """Include the given thread, or the current thread by default, in the samples."""
+        self._thread_ids.add(thread_id or threading.get_ident())
+
+    def remove_thread(self, thread_id=None):
+        """Stop including the given thread, or the current thread by default, in the samples."""
+        self._thread_ids.discard(thread_id or threading.get_ident())
+
+    def start(self):
+        """Start sampling the current thread (and any threads added later) in the background."""
+        self.add_thread()
+        self._stop_event.clear()
+        self._sampler_thread = threading.Thread(target=self._run, name="ssot-cpu-profiler", daemon=True)
+        self._sampler_thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the background thread to finish."""
+        self._stop_event.set()
+        if self._sampler_thread is not None:
+            self._sampler_thread.join()
+            self._sampler_thread = None
+
+    def _run(self):
+        """Take a sample every `interval` seconds until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Record the current call stack of each profiled thread."""
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        samples = self.samples[self.phase]
+        for thread_id in tuple(self._thread_ids):
+            frame = frames.get(thread_id)
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                samples[tuple(reversed(stack))] += 1
+
+    @property
+    def phases(self):
+        """The phases for which samples were recorded, in the order they were first sampled."""
+        return [phase for phase, samples in self.samples.items() if samples]
+
+    def collapsed_stacks(self, phase):
+        """Return the samples of the given phase in collapsed stack format, one `frame;frame;frame count` per line."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples[phase].most_common())
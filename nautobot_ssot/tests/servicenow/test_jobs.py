@@ -148,3 +148,19 @@ class ServiceNowDataTargetJobTestCase(TestCase):
         self.assertIsNone(job.lookup_object("device", "no-such-device"))
         self.assertIsNone(job.lookup_object("interface", "no-such-device__no-such-interface"))
         self.assertIsNone(job.lookup_object("nosuchmodel", ""))
+
+    def test_lookup_objects(self):
+        """Validate the lookup_objects() API."""
+        status_active = Status.objects.get(name="Active")
+        reg_loctype = LocationType.objects.update_or_create(name="Region")[0]
+        region = Location.objects.create(name="My Region", location_type=reg_loctype, status=status_active)
+        manufacturer, _ = Manufacturer.objects.get_or_create(name="Cisco")
+
+        job = ServiceNowDataTarget()
+
+        self.assertEqual(
+            job.lookup_objects("location", {"My Region", "no such region"}),
+            {"My Region": region},
+        )
+        self.assertEqual(job.lookup_objects("company", {"Cisco"}), {"Cisco": manufacturer})
+        self.assertEqual(job.lookup_objects("interface", {"mydevice__eth0"}), {})
@@ -0,0 +1,49 @@
+"""Base classes for adapter snapshot testing."""
+
+from typing import List
+
+from diffsync import Adapter, DiffSyncModel
+
+
+class InterfaceModel(DiffSyncModel):
+    """Simple DiffSync model for testing adapter snapshots."""
+
+    _modelname = "interface"
+    _identifiers = ("device_name", "name")
+    _attributes = ("description",)
+
+    device_name: str
+    name: str
+    description: str = ""
+
+
+class DeviceModel(DiffSyncModel):
+    """Simple DiffSync model with children for testing adapter snapshots."""
+
+    _modelname = "device"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+    _children = {"interface": "interfaces"}
+
+    name: str
+    description: str = ""
+    interfaces: List[str] = []
+
+
+class SnapshotAdapter(Adapter):
+    """Simple DiffSync adapter for testing adapter snapshots."""
+
+    device = DeviceModel
+    interface = InterfaceModel
+    top_level = ("device",)
+
+    supports_incremental_load = True
+
+    def add_device(self, name, description="", interfaces=()):
+        """Add a device and its interfaces to the adapter."""
+        device = self.device(name=name, description=description)
+        self.add(device)
+        for interface_name in interfaces:
+            interface = self.interface(device_name=name, name=interface_name)
+            self.add(interface)
+            device.add_child(interface)
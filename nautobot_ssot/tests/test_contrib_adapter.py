@@ -1,13 +1,15 @@
 """Tests for contrib.NautobotAdapter."""
 
-from typing import List
+from typing import List, Optional
 from unittest import skip
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from diffsync import ObjectNotFound
+from diffsync.enum import DiffSyncFlags
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import connection
+from django.db import DataError, connection
+from django.db.models import QuerySet, RestrictedError
 from django.test.utils import CaptureQueriesContext
 from nautobot.circuits import models as circuits_models
 from nautobot.core.testing import TestCase
@@ -207,6 +209,104 @@ class NautobotAdapterTests(TestCase):
 
         self.assertEqual(new_tenant_name, diffsync_tenant.name)
 
+    def test_parameter_loaders(self):
+        """Test that parameter loaders are built once per model and respect 'load_param_' methods."""
+
+        class Adapter(TestAdapter):
+            """Test adapter overriding the loading of a parameter."""
+
+            def load_param_description(self, parameter_name, database_object):
+                """Load the description in upper case."""
+                return getattr(database_object, parameter_name).upper()
+
+        # pylint: disable=protected-access
+        self.tenant.description = "Test description"
+        self.tenant.save()
+        tenancy_models.Tenant.objects.create(name="Second tenant", tenant_group=self.tenant_group)
+        adapter = Adapter(job=MagicMock())
+        with patch.object(adapter, "_build_parameter_loader", wraps=adapter._build_parameter_loader) as build_loader:
+            adapter.load()
+        # One loader per parameter of the tenant group and tenant models, no matter how many objects are loaded.
+        self.assertEqual(6, build_loader.call_count)
+        self.assertEqual("TEST DESCRIPTION", adapter.get(NautobotTenant, self.tenant_name).description)
+
+    def test_values_loading(self):
+        """Test that models with only plain fields and foreign key paths are loaded from a single values query."""
+
+        class TenantModel(NautobotModel):
+            """Test model without any to-many fields."""
+
+            _model = tenancy_models.Tenant
+            _modelname = "tenant"
+            _identifiers = ("name",)
+            _attributes = ("tenant_group__name", "tenant_group__parent__name")
+
+            name: str
+            tenant_group__name: Optional[str] = None
+            tenant_group__parent__name: Optional[str] = None
+
+        class Adapter(NautobotAdapter):
+            """Test adapter."""
+
+            top_level = ("tenant",)
+            tenant = TenantModel
+
+        adapter = Adapter(job=MagicMock())
+        with self.assertNumQueries(1):
+            adapter.load()
+        diffsync_tenant = adapter.get(TenantModel, self.tenant_name)
+        self.assertEqual(self.tenant.pk, diffsync_tenant.pk)
+        self.assertEqual(self.tenant_group_name, diffsync_tenant.tenant_group__name)
+        self.assertIsNone(diffsync_tenant.tenant_group__parent__name)
+        # Models with children or to-many fields still need model instances.
+        can_load_values = TestAdapter(job=MagicMock())._can_load_values  # pylint: disable=protected-access
+        self.assertFalse(can_load_values(NautobotTenant, ["name", "tags"]))
+
+        class ForeignKeyAdapter(Adapter):
+            """Test adapter customizing the loading of foreign keys."""
+
+            @staticmethod
+            def _handle_foreign_key(database_object, parameter_name):
+                return "custom"
+
+        adapter = ForeignKeyAdapter(job=MagicMock())
+        adapter.load()
+        self.assertEqual("custom", adapter.get(TenantModel, self.tenant_name).tenant_group__name)
+
+    def test_load_queries(self):
+        """Test that the number of queries to load a model and its children doesn't depend on the number of objects."""
+        with CaptureQueriesContext(connection) as ctx:
+            TestAdapter(job=MagicMock()).load()
+        queries_with_one_tenant = len(ctx.captured_queries)
+        for i in range(5):
+            tenant = tenancy_models.Tenant.objects.create(name=f"Tenant {i}", tenant_group=self.tenant_group)
+            tenant.tags.set(extras_models.Tag.objects.filter(name__in=["space", "earth"]))
+        with CaptureQueriesContext(connection) as ctx:
+            adapter = TestAdapter(job=MagicMock())
+            adapter.load()
+        self.assertEqual(queries_with_one_tenant, len(ctx.captured_queries))
+        self.assertEqual(6, len(adapter.get_all(NautobotTenant)))
+        self.assertEqual(2, len(adapter.get(NautobotTenant, "Tenant 0").tags))
+
+    def test_children_models(self):
+        """Test that the child models are resolved once per load rather than once per parent or child."""
+        # pylint: disable=protected-access
+        for i in range(3):
+            group = tenancy_models.TenantGroup.objects.create(name=f"Group {i}")
+            tenancy_models.Tenant.objects.create(name=f"Tenant {i}", tenant_group=group)
+        adapter = TestAdapter(job=MagicMock())
+        with patch.object(adapter, "_get_parameter_names", wraps=adapter._get_parameter_names) as get_names:
+            adapter.load()
+        # Once for the top level tenant group model and once for its tenant children.
+        self.assertEqual(2, get_names.call_count)
+        self.assertEqual(4, len(adapter.get_all(NautobotTenant)))
+
+    def test_queryset_related_lookups(self):
+        """Test that forward foreign keys are joined and to-many fields are prefetched."""
+        queryset = NautobotTenant._get_queryset()  # pylint: disable=protected-access
+        self.assertEqual({"tenant_group": {}}, queryset.query.select_related)
+        self.assertEqual(("tags",), queryset._prefetch_related_lookups)  # pylint: disable=protected-access
+
 
 class CustomRelationShipTestAdapterSource(NautobotAdapter):
     """Adapter for testing custom relationship support."""
@@ -258,6 +358,23 @@ class AdapterCustomRelationshipTest(TestCase):
             self.fail(message)
         self.assertEqual(tenant_name, self.tenant.name, msg=message)
 
+    def test_load_queries(self):
+        """Test that the associations of all objects are loaded at once rather than per object."""
+        with CaptureQueriesContext(connection) as ctx:
+            CustomRelationShipTestAdapterDestination(job=MagicMock()).load()
+        queries_with_one_provider = len(ctx.captured_queries)
+        for i in range(3):
+            extras_models.RelationshipAssociation.objects.create(
+                relationship=self.relationship,
+                source=circuits_models.Provider.objects.create(name=f"Provider {i}"),
+                destination=tenancy_models.Tenant.objects.create(name=f"Tenant {i}"),
+            )
+        with CaptureQueriesContext(connection) as ctx:
+            adapter = CustomRelationShipTestAdapterDestination(job=MagicMock())
+            adapter.load()
+        self.assertEqual(queries_with_one_provider, len(ctx.captured_queries))
+        self.assertEqual([{"name": "Tenant 0"}], adapter.get(ProviderModelCustomRelationship, "Provider 0").tenants)
+
 
 class CacheTests(TestCase):
     """Tests caching functionality between the nautobot adapter and model base classes."""
@@ -300,6 +417,276 @@ class CacheTests(TestCase):
             self.assertEqual(6, len(tenant_group_queries))
 
 
+class BulkWriteTests(TestCase):
+    """Tests for the bulk write mode of the Nautobot adapter."""
+
+    class BulkTestAdapter(TestAdapter):
+        """Test adapter writing in bulk."""
+
+        bulk_write = True
+
+    def setUp(self):
+        self.source = TestAdapter(job=MagicMock())
+        tenant_group = NautobotTenantGroup(name="Bulk group", description="Bulk group description")
+        self.source.add(tenant_group)
+        for name, tenant_group_name in (("Bulk tenant", "Bulk group"), ("Orphan tenant", "Missing group")):
+            tenant = NautobotTenant(name=name, tenant_group__name=tenant_group_name)
+            self.source.add(tenant)
+            tenant_group.add_child(tenant)
+
+    def test_bulk_create(self):
+        """Test that parents and children are created in bulk, with failures reported and dropped."""
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        target.sync_from(self.source, flags=DiffSyncFlags.SKIP_UNMATCHED_DST)
+
+        tenant = tenancy_models.Tenant.objects.get(name="Bulk tenant")
+        self.assertEqual("Bulk group", tenant.tenant_group.name)
+        self.assertFalse(tenancy_models.Tenant.objects.filter(name="Orphan tenant").exists())
+        with self.assertRaises(ObjectNotFound):
+            target.get(NautobotTenant, "Orphan tenant")
+
+    def test_bulk_create_grouped_per_model(self):
+        """Test that the interleaved creates of parents and children are written with one query per model."""
+        # Postgres uses '"' while MySQL uses '`'
+        backend = settings.DATABASES["default"]["ENGINE"]
+        *_, suffix = backend.split(".")
+        if suffix == "postgresql":
+            quote = '"'
+        elif suffix == "mysql":
+            quote = "`"
+        else:
+            self.fail(f"Unexpected database backend {settings.DATABASES['default']['ENGINE']}.")
+
+        source = TestAdapter(job=MagicMock())
+        for i in range(3):
+            tenant_group = NautobotTenantGroup(name=f"Group {i}", description="")
+            source.add(tenant_group)
+            for j in range(2):
+                tenant = NautobotTenant(name=f"Tenant {i}-{j}", tenant_group__name=f"Group {i}")
+                source.add(tenant)
+                tenant_group.add_child(tenant)
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        with CaptureQueriesContext(connection) as ctx:
+            target.sync_from(source, flags=DiffSyncFlags.SKIP_UNMATCHED_DST)
+        for table in ("tenancy_tenantgroup", "tenancy_tenant"):
+            inserts = [query for query in ctx.captured_queries if f"INSERT INTO {quote}{table}{quote}" in query["sql"]]
+            self.assertEqual(1, len(inserts), table)
+        self.assertEqual(6, tenancy_models.Tenant.objects.filter(name__startswith="Tenant ").count())
+
+    def test_bulk_update(self):
+        """Test that updates are written in bulk, with failed updates reverted in the adapter."""
+        tenant_group = tenancy_models.TenantGroup.objects.create(
+            name="Bulk group", description="Bulk group description"
+        )
+        for name in ("Bulk tenant", "Orphan tenant"):
+            tenancy_models.Tenant.objects.create(name=name, description="Old description", tenant_group=tenant_group)
+        self.source.get(NautobotTenant, "Bulk tenant").description = "New description"
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        target.sync_from(self.source, flags=DiffSyncFlags.SKIP_UNMATCHED_DST)
+        self.assertEqual("New description", tenancy_models.Tenant.objects.get(name="Bulk tenant").description)
+        # The update of "Orphan tenant" fails, as its new tenant group doesn't exist.
+        self.assertEqual("Bulk group", tenancy_models.Tenant.objects.get(name="Orphan tenant").tenant_group.name)
+        self.assertEqual("Bulk group", target.get(NautobotTenant, "Orphan tenant").tenant_group__name)
+        # The ORM object holding the failed update isn't handed out by the ORM cache anymore.
+        orphan_tenant_pk = tenancy_models.Tenant.objects.get(name="Orphan tenant").pk
+        orphan_tenant = target.get_from_orm_cache({"pk": orphan_tenant_pk}, tenancy_models.Tenant)
+        self.assertEqual(tenant_group.pk, orphan_tenant.tenant_group_id)
+
+
+class BulkDeleteTests(TestCase):
+    """Tests for the bulk delete mode of the Nautobot adapter."""
+
+    class BulkTestAdapter(TestAdapter):
+        """Test adapter deleting in bulk."""
+
+        bulk_delete = True
+
+    def setUp(self):
+        tenant_group = tenancy_models.TenantGroup.objects.create(name="Bulk group")
+        for i in range(3):
+            tenancy_models.Tenant.objects.create(name=f"Bulk tenant {i}", tenant_group=tenant_group)
+
+    def test_bulk_delete(self):
+        """Test that children and parents are deleted with a single query per model."""
+        # Postgres uses '"' while MySQL uses '`'
+        backend = settings.DATABASES["default"]["ENGINE"]
+        *_, suffix = backend.split(".")
+        if suffix == "postgresql":
+            query_prefix = 'DELETE FROM "tenancy_tenant"'
+        elif suffix == "mysql":
+            query_prefix = "DELETE FROM `tenancy_tenant`"
+        else:
+            self.fail(f"Unexpected database backend {settings.DATABASES['default']['ENGINE']}.")
+
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        with CaptureQueriesContext(connection) as ctx:
+            target.sync_from(TestAdapter(job=MagicMock()), flags=DiffSyncFlags.NONE)
+        tenant_deletes = [query for query in ctx.captured_queries if query["sql"].startswith(query_prefix)]
+        self.assertEqual(1, len(tenant_deletes))
+        self.assertFalse(tenancy_models.Tenant.objects.filter(name__startswith="Bulk tenant").exists())
+        self.assertFalse(tenancy_models.TenantGroup.objects.filter(name="Bulk group").exists())
+
+    def test_bulk_delete_protected(self):
+        """Test that protected objects are reported and kept, while the others are still deleted."""
+        location_type = dcim_models.LocationType.objects.create(name="Bulk location type")
+        dcim_models.Location.objects.create(
+            name="Bulk location",
+            location_type=location_type,
+            status=extras_models.Status.objects.get(name="Active"),
+            tenant=tenancy_models.Tenant.objects.get(name="Bulk tenant 0"),
+        )
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        target.sync_from(TestAdapter(job=MagicMock()), flags=DiffSyncFlags.NONE)
+        self.assertEqual(["Bulk tenant 0"], list(tenancy_models.Tenant.objects.values_list("name", flat=True)))
+        self.assertEqual("Bulk tenant 0", target.get(NautobotTenant, "Bulk tenant 0").name)
+
+    def test_bulk_delete_restricted(self):
+        """Test that restricted objects are reported and kept like protected ones."""
+        delete = QuerySet.delete
+
+        def restricted_delete(queryset):
+            if queryset.model is tenancy_models.Tenant and queryset.filter(name="Bulk tenant 0").exists():
+                raise RestrictedError("Restricted", set())
+            return delete(queryset)
+
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        with patch.object(QuerySet, "delete", autospec=True, side_effect=restricted_delete):
+            target.sync_from(TestAdapter(job=MagicMock()), flags=DiffSyncFlags.NONE)
+        self.assertEqual(["Bulk tenant 0"], list(tenancy_models.Tenant.objects.values_list("name", flat=True)))
+        self.assertEqual("Bulk tenant 0", target.get(NautobotTenant, "Bulk tenant 0").name)
+
+    def test_bulk_delete_restricted_parent(self):
+        """Test that a parent which can't be deleted is added back to the adapter with its remaining children."""
+        delete = QuerySet.delete
+
+        def restricted_delete(queryset):
+            if queryset.model is tenancy_models.TenantGroup:
+                raise RestrictedError("Restricted", set())
+            return delete(queryset)
+
+        target = self.BulkTestAdapter(job=MagicMock())
+        target.load()
+        with patch.object(QuerySet, "delete", autospec=True, side_effect=restricted_delete):
+            target.sync_from(TestAdapter(job=MagicMock()), flags=DiffSyncFlags.NONE)
+        tenant_group = target.get(NautobotTenantGroup, "Bulk group")
+        self.assertTrue(tenancy_models.TenantGroup.objects.filter(name="Bulk group").exists())
+        remaining_tenants = sorted(tenancy_models.Tenant.objects.values_list("name", flat=True))
+        self.assertEqual(remaining_tenants, sorted(tenant.name for tenant in target.get_all(NautobotTenant)))
+        self.assertEqual(len(remaining_tenants), len(tenant_group.tenants))
+
+
+class OrmCacheTests(TestCase):
+    """Tests for the ORM cache of the Nautobot adapter."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        for i in range(3):
+            tenancy_models.TenantGroup.objects.create(name=f"Group {i}")
+
+    def test_eviction(self):
+        """Test that the least recently used objects are evicted beyond the maximum size."""
+        adapter = TestAdapter(job=None)
+        adapter.orm_cache_max_size = 2
+        for name in ("Group 0", "Group 1", "Group 0", "Group 2"):
+            adapter.get_from_orm_cache({"name": name}, tenancy_models.TenantGroup)
+        self.assertEqual(2, len(adapter._cache))
+        self.assertEqual({"tenancy.tenantgroup": {"hit": 1, "miss": 3, "eviction": 1}}, adapter.orm_cache_statistics())
+        # "Group 1" was the least recently used object.
+        with self.assertNumQueries(1):
+            adapter.get_from_orm_cache({"name": "Group 1"}, tenancy_models.TenantGroup)
+
+    def test_warm_up(self):
+        """Test that warming up the cache preloads all objects with a single query."""
+        adapter = TestAdapter(job=None)
+        with self.assertNumQueries(1):
+            adapter.warm_orm_cache(tenancy_models.TenantGroup)
+        with self.assertNumQueries(0):
+            for i in range(3):
+                adapter.get_from_orm_cache({"name": f"Group {i}"}, tenancy_models.TenantGroup)
+        self.assertEqual(3, adapter._cache_hits["tenancy.tenantgroup"])
+
+    def test_statistics_per_adapter(self):
+        """Test that the cache statistics aren't shared between adapters."""
+        adapter = TestAdapter(job=None)
+        adapter.get_from_orm_cache({"name": "Group 0"}, tenancy_models.TenantGroup)
+        adapter.get_from_orm_cache({"name": "Group 0"}, tenancy_models.TenantGroup)
+        self.assertEqual({}, TestAdapter(job=None).orm_cache_statistics())
+
+
+class ResolveRelatedObjectsTests(TestCase):
+    """Tests for resolving the related objects of a diff in bulk."""
+
+    def test_resolve_related_objects(self):
+        """Test that the foreign keys of all created objects are resolved with a single query."""
+        source = TestAdapter(job=MagicMock())
+        for i in range(3):
+            tenancy_models.TenantGroup.objects.create(name=f"Group {i}")
+            tenant_group = NautobotTenantGroup(name=f"Group {i}", description="")
+            tenant = NautobotTenant(name=f"Tenant {i}", tenant_group__name=f"Group {i}")
+            source.add(tenant_group)
+            source.add(tenant)
+            tenant_group.add_child(tenant)
+        target = TestAdapter(job=MagicMock())
+        target.load()
+        diff = target.diff_from(source)
+        self.assertEqual(3, diff.summary()["create"])
+
+        with self.assertNumQueries(1):
+            target.resolve_related_objects(diff)
+        with self.assertNumQueries(0):
+            for i in range(3):
+                target.get_from_orm_cache({"name": f"Group {i}"}, tenancy_models.TenantGroup)
+
+        target.sync_from(source, diff=diff)
+        self.assertEqual(3, tenancy_models.Tenant.objects.filter(name__startswith="Tenant ").count())
+
+    def test_resolve_related_objects_data_error(self):
+        """Test that related objects are looked up one by one if the batched lookup fails in the database."""
+        source = TestAdapter(job=MagicMock())
+        tenancy_models.TenantGroup.objects.create(name="Group 0")
+        tenant_group = NautobotTenantGroup(name="Group 0", description="")
+        tenant = NautobotTenant(name="Tenant 0", tenant_group__name="Group 0")
+        source.add(tenant_group)
+        source.add(tenant)
+        tenant_group.add_child(tenant)
+        target = TestAdapter(job=MagicMock())
+        target.load()
+        diff = target.diff_from(source)
+
+        with patch.object(tenancy_models.TenantGroup.objects, "filter", side_effect=DataError("Malformed")):
+            target.resolve_related_objects(diff)
+        self.assertEqual({}, target.orm_cache_statistics())
+        target.sync_from(source, diff=diff)
+        self.assertTrue(tenancy_models.Tenant.objects.filter(name="Tenant 0").exists())
+
+    def test_resolve_related_objects_cache_full(self):
+        """Test that no more related objects are resolved than fit into the ORM cache."""
+        source = TestAdapter(job=MagicMock())
+        for i in range(3):
+            tenancy_models.TenantGroup.objects.create(name=f"Group {i}")
+            tenant_group = NautobotTenantGroup(name=f"Group {i}", description="")
+            tenant = NautobotTenant(name=f"Tenant {i}", tenant_group__name=f"Group {i}")
+            source.add(tenant_group)
+            source.add(tenant)
+            tenant_group.add_child(tenant)
+        target = TestAdapter(job=MagicMock())
+        target.orm_cache_max_size = 2
+        target.load()
+        diff = target.diff_from(source)
+
+        with self.assertNumQueries(1):
+            target.resolve_related_objects(diff)
+        self.assertEqual(2, len(target._cache))  # pylint: disable=protected-access
+        self.assertEqual({}, target.orm_cache_statistics())
+
+
 class TestNestedRelationships(TestCase):
     """Tests for nested relationships."""
 
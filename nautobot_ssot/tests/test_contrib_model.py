@@ -1,9 +1,11 @@
 """Tests for contrib.NautobotModel."""
 
 from typing import List, Optional
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from diffsync.exceptions import ObjectNotUpdated
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from nautobot.circuits import models as circuits_models
 from nautobot.core.testing import TestCase
 from nautobot.dcim import models as dcim_models
@@ -13,6 +15,7 @@ from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.tenancy import models as tenancy_models
 
 from nautobot_ssot.contrib import NautobotAdapter, NautobotModel
+from nautobot_ssot.contrib.types import FieldKindEnum
 from nautobot_ssot.tests.contrib_base_classes import (
     NautobotTenant,
     ProviderModelCustomRelationship,
@@ -82,6 +85,48 @@ class BaseModelCustomRelationshipOneToManyTest(TestCase):
         self.assertEqual(extras_models.RelationshipAssociation.objects.count(), 1)
         self.assertEqual(extras_models.RelationshipAssociation.objects.first().destination, self.tenant_two)
 
+    def test_custom_relationship_update_to_many_keeps_associations(self):
+        """Test that associations which are still desired aren't recreated when updating a to-many relationship."""
+        diffsync_provider = ProviderModelCustomRelationship(
+            name=self.provider_one.name,
+            pk=self.provider_one.pk,
+        )
+        diffsync_provider.adapter = CustomRelationShipTestAdapterSource(job=MagicMock())
+        diffsync_provider.update({"tenants": [{"name": self.tenant_one.name}]})
+        association = extras_models.RelationshipAssociation.objects.get()
+        diffsync_provider.update({"tenants": [{"name": self.tenant_one.name}, {"name": self.tenant_two.name}]})
+        self.assertEqual(extras_models.RelationshipAssociation.objects.count(), 2)
+        self.assertTrue(extras_models.RelationshipAssociation.objects.filter(pk=association.pk).exists())
+
+    def test_custom_relationship_to_many_invalid_association(self):
+        """Test that an invalid association fails the update with its parameters rather than a ValidationError."""
+        diffsync_provider = ProviderModelCustomRelationship(
+            name=self.provider_one.name,
+            pk=self.provider_one.pk,
+        )
+        diffsync_provider.adapter = CustomRelationShipTestAdapterSource(job=MagicMock())
+        with patch.object(
+            extras_models.RelationshipAssociation, "full_clean", side_effect=ValidationError("Invalid association")
+        ):
+            with self.assertRaises(ObjectNotUpdated) as context:
+                diffsync_provider.update({"tenants": [{"name": self.tenant_one.name}]})
+        self.assertIn("Invalid association", str(context.exception))
+        self.assertIn(str(self.tenant_one.pk), str(context.exception))
+        self.assertEqual(extras_models.RelationshipAssociation.objects.count(), 0)
+
+    def test_custom_relationship_to_many_replace_single_peer(self):
+        """Test that the peer of a one-to-one relationship can be replaced through a to-many field."""
+        self.relationship.type = RelationshipTypeChoices.TYPE_ONE_TO_ONE
+        self.relationship.validated_save()
+        diffsync_provider = ProviderModelCustomRelationship(
+            name=self.provider_one.name,
+            pk=self.provider_one.pk,
+        )
+        diffsync_provider.adapter = CustomRelationShipTestAdapterSource(job=MagicMock())
+        diffsync_provider.update({"tenants": [{"name": self.tenant_one.name}]})
+        diffsync_provider.update({"tenants": [{"name": self.tenant_two.name}]})
+        self.assertEqual(extras_models.RelationshipAssociation.objects.get().destination, self.tenant_two)
+
 
 class BaseModelCustomRelationshipTestWithDeviceData(TestCaseWithDeviceData):
     """Tests for NautobotModel with custom relationships and including device data."""
@@ -193,6 +238,19 @@ class BaseModelManyToManyTest(TestCase):
             "Removing an object from a many-to-many relationship through 'NautobotModel' does not work.",
         )
 
+    def test_many_to_many_unchanged(self):
+        """Test that nothing is added to or removed from an unchanged many-to-many relationship."""
+        tenant = tenancy_models.Tenant.objects.create(name=self.tenant_name)
+        tenant.tags.set(self.tags)
+
+        tags_manager_class = type(tenant.tags)
+        with patch.object(tags_manager_class, "add") as add, patch.object(tags_manager_class, "remove") as remove:
+            NautobotTenant._set_many_to_many_fields(  # pylint: disable=protected-access
+                {"tags": list(reversed(self.tags))}, tenant
+            )
+        add.assert_not_called()
+        remove.assert_not_called()
+
     def test_many_to_many_null(self):
         """Test whether removing all elements from a many-to-many relationship works."""
         tenant = tenancy_models.Tenant.objects.create(name=self.tenant_name)
@@ -287,3 +345,29 @@ class AnnotationsSubclassingTest(TestCase):
                 self.fail("Don't use `Klass.__annotations__`, prefer `typing.get_type_hints`.")
             else:
                 raise error
+
+
+class FieldPlanTest(TestCase):
+    """Test that the field plans of models are derived from their type hints once."""
+
+    # pylint: disable=protected-access
+
+    def test_field_plans(self):
+        """Test the field plans of the different kinds of fields."""
+        foreign_key_plan = NautobotTenant._get_field_plan("tenant_group__name")
+        self.assertEqual(FieldKindEnum.FOREIGN_KEY, foreign_key_plan.kind)
+        self.assertEqual(("tenant_group", "name"), (foreign_key_plan.related_field, foreign_key_plan.lookup))
+        to_many_plan = NautobotTenant._get_field_plan("tags")
+        self.assertEqual(FieldKindEnum.TO_MANY, to_many_plan.kind)
+        self.assertEqual(TagDict, to_many_plan.inner_type)
+        self.assertEqual(("name",), to_many_plan.inner_fields)
+        self.assertEqual(FieldKindEnum.NORMAL, NautobotTenant._get_field_plan("description").kind)
+        custom_relationship_plan = ProviderModelCustomRelationship._get_field_plan("tenants")
+        self.assertEqual(FieldKindEnum.CUSTOM_RELATIONSHIP_TO_MANY, custom_relationship_plan.kind)
+
+    def test_field_plans_cached(self):
+        """Test that type hints aren't resolved again once a field plan has been built."""
+        NautobotTenant._get_field_plan("name")
+        with patch("nautobot_ssot.contrib.model.get_type_hints") as get_type_hints:
+            NautobotTenant._get_field_plan("name")
+        get_type_hints.assert_not_called()
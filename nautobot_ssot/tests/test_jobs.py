@@ -1,16 +1,32 @@
 """Test the Job classes in nautobot_ssot."""
 
+import datetime
+import json
 import os.path
+import threading
+import time
+import tracemalloc
 from unittest.mock import Mock, call, patch
 
 from django.db.utils import IntegrityError, OperationalError
 from django.test import override_settings
+from django.utils import timezone
 from nautobot.core.testing import TransactionTestCase
-from nautobot.extras.models import JobResult
-
-from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
-from nautobot_ssot.models import SyncLogEntry
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import Job, JobResult
+from nautobot.tenancy.models import Tenant
+
+from nautobot_ssot.choices import (
+    DiffStorageChoices,
+    SyncAdapterSideChoices,
+    SyncLogEntryActionChoices,
+    SyncLogEntryStatusChoices,
+)
+from nautobot_ssot.jobs.base import SyncLogEntryBuffer
+from nautobot_ssot.models import Sync, SyncAdapterSnapshot, SyncDiffChunk, SyncLogEntry
+from nautobot_ssot.tests.contrib_base_classes import NautobotTenant
 from nautobot_ssot.tests.jobs import DataSource, DataSyncBaseJob, DataTarget
+from nautobot_ssot.tests.snapshot_base_classes import SnapshotAdapter
 
 
 @override_settings(JOBS_ROOT=os.path.join(os.path.dirname(__file__), "jobs"))
@@ -58,6 +74,355 @@ class BaseJobTestCase(TransactionTestCase):
 
         self.assertEqual(2, SyncLogEntry.objects.count())
 
+    def test_sync_log_buffered_during_run(self):
+        """Test that sync_log() entries are buffered while the job runs and written at the end of each phase."""
+        counts_during_load = []
+
+        def load_source_adapter():
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            )
+            counts_during_load.append(SyncLogEntry.objects.count())
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual([0], counts_during_load)
+        self.assertEqual(1, SyncLogEntry.objects.count())
+
+    def test_sync_log_flushed_on_failure(self):
+        """Test that buffered sync_log() entries are written to the database even if the job fails partway."""
+
+        def load_target_adapter():
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_DELETE,
+                status=SyncLogEntryStatusChoices.STATUS_ERROR,
+            )
+            raise RuntimeError("Target unavailable")
+
+        self.job.load_target_adapter = load_target_adapter
+        with self.assertRaises(RuntimeError):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual(1, SyncLogEntry.objects.count())
+
+    def _synced_object_entries(self, *keys):
+        return [(SyncLogEntry(object_repr=" ".join(key)), key) for key in keys]
+
+    def test_resolve_synced_objects_bulk(self):
+        """Test that the synced objects of a model are looked up with a single query for all log entries."""
+        tenants = [Tenant.objects.create(name=f"Tenant {i}") for i in range(3)]
+        diffsync_tenants = {tenant.name: NautobotTenant(name=tenant.name, pk=tenant.pk) for tenant in tenants}
+        self.job.target_adapter = Mock()
+        self.job.target_adapter.get.side_effect = lambda model_name, unique_id: diffsync_tenants[unique_id]
+        self.job.lookup_object = Mock(return_value=None)
+        entries = self._synced_object_entries(*(("tenant", tenant.name) for tenant in tenants))
+        with self.assertNumQueries(1):
+            self.job._resolve_synced_objects(entries)
+        self.assertEqual(tenants, [entry.synced_object for entry, _ in entries])
+        self.assertEqual([repr(tenant) for tenant in tenants], [entry.object_repr for entry, _ in entries])
+        self.job.lookup_object.assert_not_called()
+        # Only the logged objects are looked up in the adapter, rather than scanning all of its objects.
+        self.job.target_adapter.get_all.assert_not_called()
+
+    def test_resolve_synced_objects_fallback(self):
+        """Test that objects not found by lookup_objects() are looked up once each through lookup_object()."""
+        self.job.lookup_object = Mock(return_value=None)
+        entries = self._synced_object_entries(("tenant", "No such tenant"), ("tenant", "No such tenant"))
+        self.job._resolve_synced_objects(entries)
+        self.assertEqual([None, None], [entry.synced_object for entry, _ in entries])
+        self.assertEqual("tenant No such tenant", entries[0][0].object_repr)
+        self.job.lookup_object.assert_called_once_with("tenant", "No such tenant")
+
+    def test_run_incremental_sync_saves_snapshots(self):
+        """Test that snapshots of both adapters are saved when incremental sync is enabled."""
+
+        def load_source_adapter():
+            self.job.source_adapter = SnapshotAdapter()
+            self.job.source_adapter.add_device("sw01", interfaces=["eth0"])
+
+        def load_target_adapter():
+            self.job.target_adapter = SnapshotAdapter()
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.load_target_adapter = load_target_adapter
+        with patch.object(self.job_class, "incremental_sync", True):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertIsNone(self.job.changed_since)
+        source_snapshot = self.job.sync.adapter_snapshots.get(side=SyncAdapterSideChoices.SIDE_SOURCE)
+        self.assertEqual("SnapshotAdapter", source_snapshot.adapter)
+        self.assertEqual(
+            {
+                "device": [{"name": "sw01", "description": "", "interfaces": ["sw01__eth0"]}],
+                "interface": [{"device_name": "sw01", "name": "eth0", "description": ""}],
+            },
+            source_snapshot.get_data()["objects"],
+        )
+        target_snapshot = self.job.sync.adapter_snapshots.get(side=SyncAdapterSideChoices.SIDE_TARGET)
+        self.assertEqual({}, target_snapshot.get_data()["objects"])
+
+    def test_load_adapter_from_snapshot(self):
+        """Test that an adapter can be warm-started from the snapshot of a previous sync."""
+
+        def load_source_adapter():
+            self.job.source_adapter = SnapshotAdapter()
+            self.job.source_adapter.add_device("sw01", interfaces=["eth0"])
+
+        def load_target_adapter():
+            self.job.target_adapter = SnapshotAdapter()
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.load_target_adapter = load_target_adapter
+        with patch.object(self.job_class, "save_adapter_snapshots", True):
+            self.job.run(dryrun=True, memory_profiling=False)
+
+        adapter = self.job.load_adapter_from_snapshot(SnapshotAdapter(), self.job.sync)
+        self.assertEqual(["sw01__eth0"], adapter.get("device", "sw01").interfaces)
+        self.assertEqual("eth0", adapter.get("interface", "sw01__eth0").name)
+        self.assertEqual(
+            self.job.source_adapter.diff_to(SnapshotAdapter()).summary(),
+            adapter.diff_to(SnapshotAdapter()).summary(),
+        )
+
+    def test_run_cpu_profiling(self):
+        """Test that the cpu_profiling option attaches a collapsed stack file per phase to the job result."""
+
+        def load_source_adapter():
+            end = time.monotonic() + 0.1
+            while time.monotonic() < end:
+                pass
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.cpu_profiling_interval = 0.001
+        self.job.run(dryrun=True, memory_profiling=False, cpu_profiling=True)
+        files = {file.name: file for file in self.job.sync.cpu_profile_files}
+        self.assertIn("cpu_profile_source_load.collapsed", files)
+        with files["cpu_profile_source_load.collapsed"].file.open() as profile:
+            self.assertIn(b"load_source_adapter", profile.read())
+
+    def test_run_partitioned(self):
+        """Test that partitions are loaded, diffed and synced one at a time and their results combined."""
+        loaded_partitions = []
+
+        def load_source_adapter():
+            loaded_partitions.append(self.job.current_partition)
+            self.job.source_adapter = SnapshotAdapter()
+            self.job.source_adapter.add_device(f"{self.job.current_partition}-sw01", interfaces=["eth0"])
+
+        def load_target_adapter():
+            # Each partition is loaded with fresh adapters, so only this partition's data is present.
+            self.assertIsNone(self.job.target_adapter)
+            self.job.target_adapter = SnapshotAdapter()
+            self.job.target_adapter.add_device(f"{self.job.current_partition}-sw02")
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.load_target_adapter = load_target_adapter
+        self.job.get_partitions = lambda: ["ams", "fra"]
+        self.job.run(dryrun=True, memory_profiling=False)
+
+        self.assertEqual(["ams", "fra"], loaded_partitions)
+        self.assertIsNone(self.job.current_partition)
+        self.assertIsNone(self.job.source_adapter)
+        self.job.sync.refresh_from_db()
+        self.assertEqual(4, self.job.sync.summary["create"])
+        self.assertEqual(2, self.job.sync.summary["delete"])
+        diff = SyncDiffChunk.merge(self.job.sync.diff_chunks.all())
+        self.assertEqual({"ams-sw01", "ams-sw02", "fra-sw01", "fra-sw02"}, set(diff["device"]))
+
+    def test_run_partitioned_incremental_sync(self):
+        """Test that partitioned syncs refuse to run with incremental syncs."""
+        self.job.get_partitions = lambda: ["ams"]
+        with patch.object(self.job_class, "incremental_sync", True):
+            with self.assertRaises(ValueError):
+                self.job.run(dryrun=True, memory_profiling=False)
+
+    def test_run_distributed_partitions(self):
+        """Test that distributed partitions are synced by child jobs whose results are merged into the parent Sync."""
+
+        def enqueue_job(job_model, user, **job_kwargs):
+            self.assertEqual(True, job_kwargs["dryrun"])
+            child_result = JobResult.objects.create(
+                name="fake child job",
+                task_name="fake job",
+                worker="default",
+                status=JobResultStatusChoices.STATUS_SUCCESS,
+            )
+            Sync.objects.create(
+                source="source",
+                target="target",
+                job_result=child_result,
+                parent_id=job_kwargs["parent_sync"],
+                partition=json.loads(job_kwargs["sync_partition"]),
+                diff={},
+                summary={"create": 1, "delete": 2},
+                diff_time=datetime.timedelta(seconds=len(job_kwargs["sync_partition"])),
+            )
+            return child_result
+
+        self.job.job_result.task_kwargs = {"dryrun": True, "memory_profiling": False}
+        self.job.get_partitions = lambda: ["ams", "fra01"]
+        self.job.distributed_poll_interval = 0
+        with patch.object(self.job_class, "distribute_partitions", True), patch.object(
+            JobResult, "enqueue_job", side_effect=enqueue_job
+        ):
+            self.job.run(dryrun=True, memory_profiling=False)
+
+        self.job.sync.refresh_from_db()
+        self.assertEqual(["ams", "fra01"], sorted(self.job.sync.children.values_list("partition", flat=True)))
+        self.assertEqual({"create": 2, "delete": 4}, self.job.sync.summary)
+        self.assertEqual(datetime.timedelta(seconds=7), self.job.sync.diff_time)
+
+    def test_run_distributed_partitions_not_started(self):
+        """Test that the coordinating job fails fast when its child jobs stay pending."""
+
+        def enqueue_job(job_model, user, **job_kwargs):
+            return JobResult.objects.create(
+                name="fake child job",
+                task_name="fake job",
+                worker="default",
+                status=JobResultStatusChoices.STATUS_PENDING,
+            )
+
+        self.job.job_result.task_kwargs = {"dryrun": True, "memory_profiling": False}
+        self.job.get_partitions = lambda: ["ams", "fra01"]
+        self.job.distributed_poll_interval = 0
+        self.job.distributed_start_timeout = 0
+        with patch.object(self.job_class, "distribute_partitions", True), patch.object(
+            JobResult, "enqueue_job", side_effect=enqueue_job
+        ):
+            with self.assertRaises(TimeoutError):
+                self.job.run(dryrun=True, memory_profiling=False)
+
+    def test_run_distributed_partitions_failed(self):
+        """Test that the results of the succeeded child jobs are merged before reporting the failed ones."""
+
+        def enqueue_job(job_model, user, **job_kwargs):
+            partition = json.loads(job_kwargs["sync_partition"])
+            child_result = JobResult.objects.create(
+                name="fake child job",
+                task_name="fake job",
+                worker="default",
+                status=JobResultStatusChoices.STATUS_SUCCESS
+                if partition == "ams"
+                else JobResultStatusChoices.STATUS_FAILURE,
+            )
+            Sync.objects.create(
+                source="source",
+                target="target",
+                job_result=child_result,
+                parent_id=job_kwargs["parent_sync"],
+                partition=partition,
+                diff={},
+                summary={"create": 1, "delete": 2},
+            )
+            return child_result
+
+        self.job.job_result.task_kwargs = {"dryrun": True, "memory_profiling": False}
+        self.job.get_partitions = lambda: ["ams", "fra01"]
+        self.job.distributed_poll_interval = 0
+        with patch.object(self.job_class, "distribute_partitions", True), patch.object(
+            JobResult, "enqueue_job", side_effect=enqueue_job
+        ):
+            with self.assertRaises(RuntimeError):
+                self.job.run(dryrun=True, memory_profiling=False)
+
+        self.job.sync.refresh_from_db()
+        self.assertEqual({"create": 1, "delete": 2}, self.job.sync.summary)
+
+    def test_run_sync_partition(self):
+        """Test that a child job syncs only its partition, in a child Sync of the coordinating job's Sync."""
+        parent = Sync.objects.create(source="source", target="target", diff={})
+        partitions = []
+        self.job.load_source_adapter = lambda: partitions.append(self.job.current_partition)
+        self.job.get_partitions = lambda: ["ams", "fra"]
+        self.job.run(dryrun=True, memory_profiling=False, sync_partition='"ams"', parent_sync=str(parent.pk))
+        self.assertEqual(["ams"], partitions)
+        self.assertEqual(parent, self.job.sync.parent)
+        self.assertEqual("ams", self.job.sync.partition)
+
+    def test_run_records_model_statistics(self):
+        """Test that per-model object counts and sync durations are recorded on the Sync."""
+
+        def load_source_adapter():
+            self.job.source_adapter = SnapshotAdapter()
+            self.job.source_adapter.add_device("sw01", interfaces=["eth0", "eth1"])
+            self.job.source_adapter.load_statistics = {"device": 0.5}
+
+        def load_target_adapter():
+            self.job.target_adapter = SnapshotAdapter()
+            self.job.target_adapter.orm_cache_statistics = lambda: {"extras.status": {"hit": 3, "miss": 1}}
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.load_target_adapter = load_target_adapter
+        self.job.run(dryrun=False, memory_profiling=False)
+        self.job.sync.refresh_from_db()
+        statistics = self.job.sync.model_statistics
+        self.assertEqual({"count": 3, "seconds": None}, statistics["target_orm_cache"]["extras.status"]["hit"])
+        self.assertEqual({"count": 1, "seconds": 0.5}, statistics["source_load"]["device"]["load"])
+        self.assertEqual({"count": 2, "seconds": None}, statistics["source_load"]["interface"]["load"])
+        self.assertNotIn("target_load", statistics)
+        self.assertEqual(1, statistics["sync"]["device"]["create"]["count"])
+        self.assertEqual(2, statistics["sync"]["interface"]["create"]["count"])
+        self.assertGreaterEqual(statistics["sync"]["interface"]["create"]["seconds"], 0)
+
+    def test_run_deletes_stale_snapshots(self):
+        """Test that snapshots older than the most recent successful snapshot of the job are deleted."""
+        self.job.job_result.job_model = Job.objects.get(
+            module_name="nautobot_ssot.jobs.examples", job_class_name="ExampleDataSource"
+        )
+        self.job.job_result.save()
+        syncs = []
+        for days_ago, status in (
+            (3, JobResultStatusChoices.STATUS_SUCCESS),
+            (2, JobResultStatusChoices.STATUS_SUCCESS),
+            (1, JobResultStatusChoices.STATUS_FAILURE),
+        ):
+            job_result = JobResult.objects.create(
+                name="fake job", task_name="fake job", job_model=self.job.job_result.job_model, status=status
+            )
+            sync = Sync.objects.create(
+                source="Source",
+                target="Target",
+                diff={},
+                job_result=job_result,
+                start_time=timezone.now() - datetime.timedelta(days=days_ago),
+            )
+            SyncAdapterSnapshot.save_adapter(sync, SyncAdapterSideChoices.SIDE_SOURCE, SnapshotAdapter())
+            syncs.append(sync)
+
+        with patch.object(self.job_class, "save_adapter_snapshots", True):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual(
+            {syncs[1].pk, syncs[2].pk},
+            set(SyncAdapterSnapshot.objects.exclude(sync=self.job.sync).values_list("sync", flat=True)),
+        )
+
+    def test_merge_adapter_snapshot(self):
+        """Test that records missing from an incremental load are restored from the snapshot."""
+        previous = SnapshotAdapter()
+        previous.add_device("sw01", interfaces=["eth0", "eth1"])
+        previous.add_device("sw02", interfaces=["eth0"])
+        previous.add_device("sw03")
+        snapshot_data = {
+            model_name: [obj.dict() for obj in previous.get_all(model_name)]
+            for model_name in previous.store.get_all_model_names()
+        }
+
+        # sw01 changed and got a new interface, sw01 eth1 and sw03 were deleted, sw02 is unchanged.
+        adapter = SnapshotAdapter()
+        adapter.add_device("sw01", description="changed", interfaces=["eth2"])
+        deletions = {("interface", "sw01__eth1"), ("device", "sw03")}
+        self.assertEqual(3, self.job._merge_adapter_snapshot(adapter, snapshot_data, deletions))
+
+        self.assertEqual(["sw01", "sw02"], sorted(device.name for device in adapter.get_all("device")))
+        sw01 = adapter.get("device", "sw01")
+        self.assertEqual("changed", sw01.description)
+        self.assertEqual(["sw01__eth2", "sw01__eth0"], sw01.interfaces)
+        self.assertEqual(["sw02__eth0"], adapter.get("device", "sw02").interfaces)
+        self.assertEqual(
+            ["sw01__eth0", "sw01__eth2", "sw02__eth0"],
+            sorted(interface.get_unique_id() for interface in adapter.get_all("interface")),
+        )
+
     def test_as_form(self):
         """Test the as_form() method."""
         form = self.job.as_form()
@@ -93,6 +458,30 @@ class BaseJobTestCase(TransactionTestCase):
         self.assertTrue(self.job.sync.dry_run)
         self.assertEqual(self.job.job_result, self.job.sync.job_result)
 
+    def test_run_parallel_loading(self):
+        """Test the run() method loads the source adapter in a separate thread when parallel loading is enabled."""
+        load_threads = {}
+        self.job.load_source_adapter = lambda: load_threads.update(source=threading.current_thread())
+        self.job.load_target_adapter = lambda: load_threads.update(target=threading.current_thread())
+        with patch.object(self.job_class, "parallel_loading", True):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertNotEqual(load_threads["source"], threading.current_thread())
+        self.assertEqual(load_threads["target"], threading.current_thread())
+        self.assertIsNotNone(self.job.sync.source_load_time)
+        self.assertIsNotNone(self.job.sync.target_load_time)
+        self.assertIsNotNone(self.job.sync.diff_time)
+
+    def test_run_parallel_loading_source_failure(self):
+        """Test that an exception raised while loading the source adapter in parallel mode is propagated."""
+
+        def failing_load():
+            raise ValueError("Source unavailable")
+
+        self.job.load_source_adapter = failing_load
+        with patch.object(self.job_class, "parallel_loading", True):
+            with self.assertRaises(ValueError):
+                self.job.run(dryrun=True, memory_profiling=False)
+
     def test_job_dryrun_false(self):
         """Test the job is not ran in dryrun mode."""
         with patch.object(DataSyncBaseJob, "execute_sync") as mock_execute_sync:
@@ -131,6 +520,23 @@ class BaseJobTestCase(TransactionTestCase):
         self.job.run(dryrun=False, memory_profiling=True)
         mock_malloc_start.assert_called()
 
+    def test_job_memory_profiling_snapshots(self):
+        """Test that the top allocation sites of each phase are recorded when memory profiling."""
+        self.addCleanup(tracemalloc.stop)
+        retained = []
+
+        def load_source_adapter():
+            retained.append([str(i) for i in range(10000)])
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.memory_profiling_top_allocations = 5
+        self.job.run(dryrun=False, memory_profiling=True)
+        snapshots = {snapshot.phase: snapshot for snapshot in self.job.sync.memory_snapshots.all()}
+        self.assertEqual(["source_load", "target_load", "diff", "sync"], list(snapshots))
+        source_load = snapshots["source_load"]
+        self.assertLessEqual(len(source_load.top_allocations), 5)
+        self.assertIn(__file__, [allocation["file"] for allocation in source_load.top_allocations])
+
     @patch("tracemalloc.start")
     def test_job_memory_profiling_false(self, mock_malloc_start):
         """Test the job is ran in dryrun mode."""
@@ -147,6 +553,46 @@ class BaseJobTestCase(TransactionTestCase):
         self.job.source_adapter.diff_to.assert_called()
         self.job.sync.save.assert_has_calls([call(), call()])
 
+    def test_calculate_diff_chunked(self):
+        """Test calculate_diff() method with chunked diff storage."""
+        self.job.sync = Mock()
+        self.job.sync.diff_chunks.count.return_value = 0
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        with patch.object(self.job_class, "diff_storage", DiffStorageChoices.STORAGE_CHUNKED), patch(
+            "nautobot_ssot.jobs.base.SyncDiffChunk.save_diff"
+        ) as mock_save_diff:
+            self.job.calculate_diff()
+        mock_save_diff.assert_called_once_with(
+            self.job.sync, self.job.source_adapter.diff_to(), chunk_size=self.job.diff_chunk_size, start_index=0
+        )
+        self.job.source_adapter.diff_to().dict.assert_not_called()
+
+    def test_calculate_diff_chunked_append(self):
+        """Test that calculate_diff() appends to the chunks already stored, e.g. by earlier partitions."""
+        self.job.sync = Mock()
+        self.job.sync.diff_chunks.count.return_value = 3
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        with patch.object(self.job_class, "diff_storage", DiffStorageChoices.STORAGE_CHUNKED), patch(
+            "nautobot_ssot.jobs.base.SyncDiffChunk.save_diff"
+        ) as mock_save_diff:
+            self.job.calculate_diff()
+        mock_save_diff.assert_called_once_with(
+            self.job.sync, self.job.source_adapter.diff_to(), chunk_size=self.job.diff_chunk_size, start_index=3
+        )
+
+    def test_calculate_diff_compressed(self):
+        """Test calculate_diff() method with compressed diff storage."""
+        self.job.sync = Mock()
+        self.job.source_adapter = Mock()
+        self.job.target_adapter = Mock()
+        self.job.source_adapter.diff_to().dict.return_value = {"location": {}}
+        with patch.object(self.job_class, "diff_storage", DiffStorageChoices.STORAGE_COMPRESSED):
+            self.job.calculate_diff()
+        self.assertEqual({}, self.job.sync.diff)
+        self.assertEqual(Sync.compress_diff({"location": {}}), self.job.sync.diff_compressed)
+
     def test_calculate_diff_fail_diff_save_too_large(self):
         """Test calculate_diff() method logs failure."""
         self.job.sync = Mock()
@@ -174,6 +620,82 @@ class BaseJobTestCase(TransactionTestCase):
             self.job.calculate_diff()
 
 
+class SyncLogEntryBufferTestCase(TransactionTestCase):
+    """Test the SyncLogEntryBuffer class."""
+
+    databases = (
+        "default",
+        "job_logs",
+    )
+
+    def setUp(self):
+        """Per-test setup."""
+        super().setUp()
+        self.sync = Sync.objects.create(source="Source", target="Target", diff={})
+
+    def _entry(self):
+        return SyncLogEntry(
+            sync=self.sync,
+            action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+            status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+        )
+
+    def test_flush_on_size(self):
+        """Test that the buffer is flushed once it reaches its maximum size."""
+        buffer = SyncLogEntryBuffer(max_size=3, max_age=3600)
+        buffer.add(self._entry())
+        buffer.add(self._entry())
+        self.assertEqual(0, SyncLogEntry.objects.count())
+        self.assertEqual(2, len(buffer))
+        buffer.add(self._entry())
+        self.assertEqual(3, SyncLogEntry.objects.count())
+        self.assertEqual(0, len(buffer))
+
+    def test_flush_on_age(self):
+        """Test that the buffer is flushed once its oldest entry is older than the maximum age."""
+        buffer = SyncLogEntryBuffer(max_size=1000, max_age=0)
+        buffer.add(self._entry())
+        self.assertEqual(1, SyncLogEntry.objects.count())
+
+    def test_flush_resolves_synced_objects(self):
+        """Test that the synced objects of the entries are only resolved when the buffer is flushed."""
+        resolve_synced_objects = Mock()
+        buffer = SyncLogEntryBuffer(max_size=1000, max_age=3600, resolve_synced_objects=resolve_synced_objects)
+        entry = self._entry()
+        buffer.add(entry, ("tenant", "Tenant 1"))
+        buffer.add(self._entry())
+        resolve_synced_objects.assert_not_called()
+        buffer.flush()
+        resolve_synced_objects.assert_called_once_with([(entry, ("tenant", "Tenant 1"))])
+        self.assertEqual(2, SyncLogEntry.objects.count())
+
+    def test_flush_defer_resolution(self):
+        """Test that entries with synced objects are held back while their resolution is deferred."""
+        resolve_synced_objects = Mock()
+        buffer = SyncLogEntryBuffer(max_size=2, max_age=3600, resolve_synced_objects=resolve_synced_objects)
+        buffer.defer_resolution = True
+        entry = self._entry()
+        buffer.add(entry, ("tenant", "Tenant 1"))
+        buffer.add(self._entry())
+        resolve_synced_objects.assert_not_called()
+        self.assertEqual(1, SyncLogEntry.objects.count())
+        self.assertEqual(1, len(buffer))
+        buffer.defer_resolution = False
+        buffer.flush()
+        resolve_synced_objects.assert_called_once_with([(entry, ("tenant", "Tenant 1"))])
+        self.assertEqual(2, SyncLogEntry.objects.count())
+
+    def test_flush(self):
+        """Test explicitly flushing the buffer."""
+        buffer = SyncLogEntryBuffer(max_size=1000, max_age=3600)
+        buffer.add(self._entry())
+        buffer.add(self._entry())
+        buffer.flush()
+        self.assertEqual(2, SyncLogEntry.objects.count())
+        buffer.flush()
+        self.assertEqual(2, SyncLogEntry.objects.count())
+
+
 class DataSourceTestCase(BaseJobTestCase):
     """Test the DataSource class."""
 
@@ -4,6 +4,7 @@ from io import StringIO
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
 from nautobot.dcim.models import (
     Device,
@@ -15,6 +16,10 @@ from nautobot.dcim.models import (
 )
 from nautobot.extras.models import CustomField, Role, Status
 
+from nautobot_ssot.choices import SyncAdapterSideChoices
+from nautobot_ssot.models import Sync, SyncAdapterSnapshot
+from nautobot_ssot.tests.snapshot_base_classes import SnapshotAdapter
+
 
 class TestElongateInterfaceNames(TestCase):
     """Unittests for elongate_interface_names command."""
@@ -187,3 +192,42 @@ class TestElongateInterfaceNames(TestCase):
             stdout=out,
         )
         self.assertEqual(out.getvalue().strip(), "Updating ssot_test_1.ge2 >> GigabitEthernet2")
+
+
+class TestCompressSyncDiffs(TestCase):
+    """Unittests for compress_sync_diffs command."""
+
+    def test_compress_sync_diffs(self):
+        diff = {"location": {"ams01": {"+": {"description": "Amsterdam"}}}}
+        sync = Sync.objects.create(source="Some other system", target="Nautobot", diff=diff)
+        Sync.objects.create(source="Some other system", target="Nautobot", diff={})
+        out = StringIO()
+        call_command("compress_sync_diffs", "--no-color", "--skip-checks", batch_size=1, stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Compressed the diffs of 1 Sync records.")
+        sync.refresh_from_db()
+        self.assertEqual(sync.diff, {})
+        self.assertEqual(sync.decoded_diff, diff)
+
+
+class TestDiffSyncSnapshots(TestCase):
+    """Unittests for diff_sync_snapshots command."""
+
+    def test_diff_sync_snapshots(self):
+        syncs = []
+        for devices in (["sw01", "sw02"], ["sw01", "sw03"]):
+            adapter = SnapshotAdapter()
+            for device in devices:
+                adapter.add_device(device)
+            sync = Sync.objects.create(source="Some other system", target="Nautobot", diff={})
+            SyncAdapterSnapshot.save_adapter(sync, SyncAdapterSideChoices.SIDE_SOURCE, adapter)
+            syncs.append(sync)
+        out = StringIO()
+        call_command("diff_sync_snapshots", "--no-color", "--skip-checks", syncs[0].pk, syncs[1].pk, stdout=out)
+        output = out.getvalue()
+        self.assertIn("1 create, 0 update, 1 delete", output)
+        self.assertIn("sw03", output)
+
+    def test_diff_sync_snapshots_missing_snapshot(self):
+        sync = Sync.objects.create(source="Some other system", target="Nautobot", diff={})
+        with self.assertRaises(CommandError):
+            call_command("diff_sync_snapshots", "--no-color", "--skip-checks", sync.pk, sync.pk, side="target")
@@ -0,0 +1,89 @@
+"""Test cases for the Prometheus metrics of nautobot_ssot."""
+
+import datetime
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils.timezone import now
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import Job, JobResult
+
+from nautobot_ssot import metrics
+from nautobot_ssot.models import Sync, SyncMetricWindow
+
+
+@patch.dict(metrics.PLUGIN_SETTINGS, {"metrics_cache_ttl": 0})
+class MetricsTestCase(TestCase):
+    """Tests for the metric collectors."""
+
+    def setUp(self):
+        """Create a couple of Syncs for the example data source job."""
+        job = Job.objects.get(module_name="nautobot_ssot.jobs.examples", job_class_name="ExampleDataSource")
+        self.job_label = ".".join(job.natural_key())
+        for days_ago, memory in ((3, 1024), (2, None), (1, None)):
+            job_result = JobResult.objects.create(
+                name=job.name, job_model=job, task_name=job.class_path, status=JobResultStatusChoices.STATUS_SUCCESS
+            )
+            Sync.objects.create(
+                source="Example Data Source",
+                target="Nautobot",
+                start_time=now() - datetime.timedelta(days=days_ago),
+                diff_time=datetime.timedelta(seconds=days_ago),
+                source_load_memory_final=memory,
+                diff={},
+                summary={"create": days_ago},
+                job_result=job_result,
+            )
+
+    def test_get_job_syncs(self):
+        """Test that the latest Syncs of all jobs are retrieved with a fixed number of queries."""
+        with self.assertNumQueries(2):
+            job_syncs = metrics.get_job_syncs()
+        self.assertEqual(1, len(job_syncs))
+        self.assertEqual(self.job_label, job_syncs[0].job_label)
+        self.assertEqual(datetime.timedelta(seconds=1), job_syncs[0].last_sync.diff_time)
+        self.assertEqual(1024, job_syncs[0].last_memory_profiled_sync.source_load_memory_final)
+
+    def test_metric_ssot_jobs(self):
+        """Test that the phase durations of the latest Sync are exported in milliseconds."""
+        samples = next(metrics.metric_ssot_jobs()).samples
+        self.assertIn(1000.0, [sample.value for sample in samples if sample.labels["phase"] == "diff_time"])
+
+    def test_metric_syncs(self):
+        """Test that the number of Syncs per status is counted with a single query."""
+        with self.assertNumQueries(1):
+            samples = next(metrics.metric_syncs()).samples
+        values = {sample.labels["sync_type"]: sample.value for sample in samples}
+        self.assertEqual(3, values["total_syncs"])
+        self.assertEqual(3, values["success_syncs"])
+        self.assertEqual(0, values["failure_syncs"])
+
+    def test_metric_memory_usage(self):
+        """Test that the memory usage of the latest memory profiled Sync is exported."""
+        samples = next(metrics.metric_memory_usage()).samples
+        values = {sample.labels["phase"]: sample.value for sample in samples}
+        self.assertEqual({"source_load_memory_final": 1024}, values)
+
+    def test_metric_sync_histograms(self):
+        """Test that histograms are built from the metric windows maintained as Syncs finish."""
+        for sync in Sync.objects.all():
+            SyncMetricWindow.record_sync(sync, window_size=2)
+        histograms = {histogram.name: histogram for histogram in metrics.metric_sync_histograms()}
+        samples = {
+            (sample.name, sample.labels.get("le")): sample.value
+            for sample in histograms["nautobot_ssot_sync_phase_duration_seconds"].samples
+            if sample.labels["phase"] == "diff_time"
+        }
+        # Only the two most recent Syncs, with diff times of 2 and 1 seconds, are in the window.
+        self.assertEqual(1, samples[("nautobot_ssot_sync_phase_duration_seconds_bucket", "1.0")])
+        self.assertEqual(2, samples[("nautobot_ssot_sync_phase_duration_seconds_bucket", "5.0")])
+        self.assertEqual(2, samples[("nautobot_ssot_sync_phase_duration_seconds_gcount", None)])
+        self.assertEqual(3, samples[("nautobot_ssot_sync_phase_duration_seconds_gsum", None)])
+
+    def test_cache(self):
+        """Test that the collected data is cached for the configured TTL."""
+        with patch.dict(metrics.PLUGIN_SETTINGS, {"metrics_cache_ttl": 60}):
+            metrics.get_job_syncs()
+            with self.assertNumQueries(0):
+                metrics.get_job_syncs()
+        metrics._cache.clear()  # pylint: disable=protected-access
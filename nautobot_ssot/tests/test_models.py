@@ -4,12 +4,13 @@ import datetime
 import time
 import uuid
 
+from diffsync.diff import Diff, DiffElement
 from django.test import TestCase
 from django.utils.timezone import now
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import Job, JobResult
 
-from nautobot_ssot.models import Sync
+from nautobot_ssot.models import Sync, SyncDiffChunk
 
 
 class SyncTestCase(TestCase):
@@ -101,3 +102,70 @@ class SyncTestCase(TestCase):
         self.source_sync.refresh_from_db()
         actual = self.source_sync.diff["uuid"]
         self.assertEqual(actual, expected)
+
+    def test_decoded_diff_compressed(self):
+        """Test that a compressed diff is transparently decoded, including objects handled by DiffJSONEncoder."""
+        self.source_sync.diff_compressed = Sync.compress_diff({"uuid": uuid.UUID(int=1)})
+        self.source_sync.validated_save()
+        self.source_sync.refresh_from_db()
+        self.assertEqual({"uuid": "00000000-0000-0000-0000-000000000001"}, self.source_sync.decoded_diff)
+
+    def test_decoded_diff_uncompressed(self):
+        """Test that an uncompressed diff is returned as-is."""
+        self.source_sync.diff = {"location": {}}
+        self.assertEqual({"location": {}}, self.source_sync.decoded_diff)
+
+    def test_model_statistics_rows(self):
+        """Test that the nested model statistics are flattened and the throughput is calculated."""
+        self.source_sync.model_statistics = {
+            "source_load": {"location": {"load": {"count": 10, "seconds": 2.0}}},
+            "sync": {"location": {"create": {"count": 3, "seconds": None}}},
+        }
+        rows = self.source_sync.model_statistics_rows
+        self.assertEqual(
+            {"phase": "source_load", "model": "location", "action": "load", "count": 10, "seconds": 2.0, "rate": 5.0},
+            rows[0],
+        )
+        self.assertEqual(
+            {"phase": "sync", "model": "location", "action": "create", "count": 3, "seconds": None, "rate": None},
+            rows[1],
+        )
+
+
+class SyncDiffChunkTestCase(TestCase):
+    """Tests for the SyncDiffChunk model."""
+
+    def setUp(self):
+        """Per-test setup function."""
+        self.sync = Sync.objects.create(source="Some other system", target="Nautobot", diff={})
+        self.diff = Diff()
+        for name in ("ams01", "ber01", "fra01"):
+            element = DiffElement("location", name, {"name": name})
+            element.add_attrs(source={"description": f"{name} (source)"}, dest={"description": name})
+            self.diff.add(element)
+        unchanged = DiffElement("location", "lon01", {"name": "lon01"})
+        unchanged.add_attrs(source={"description": "lon01"}, dest={"description": "lon01"})
+        self.diff.add(unchanged)
+        tenant = DiffElement("tenant", "Tenant 1", {"name": "Tenant 1"})
+        tenant.add_attrs(source={"description": ""})
+        self.diff.add(tenant)
+
+    def test_save_diff(self):
+        """Test that a diff is split into chunks per model type and chunk size, skipping unchanged elements."""
+        self.assertEqual(3, SyncDiffChunk.save_diff(self.sync, self.diff, chunk_size=2))
+        chunks = list(self.sync.diff_chunks.all())
+        self.assertEqual([0, 1, 2], [chunk.index for chunk in chunks])
+        self.assertEqual(["location", "location", "tenant"], [chunk.model_type for chunk in chunks])
+        self.assertEqual(["ams01", "ber01"], list(chunks[0].diff))
+        self.assertTrue(self.sync.has_chunked_diff)
+
+    def test_save_diff_start_index(self):
+        """Test that chunks can be appended to the chunks already stored for a Sync."""
+        SyncDiffChunk.save_diff(self.sync, self.diff, chunk_size=2)
+        self.assertEqual(3, SyncDiffChunk.save_diff(self.sync, self.diff, chunk_size=2, start_index=3))
+        self.assertEqual(list(range(6)), list(self.sync.diff_chunks.values_list("index", flat=True)))
+
+    def test_merge(self):
+        """Test that merging all chunks results in the same dictionary as `Diff.dict()`."""
+        SyncDiffChunk.save_diff(self.sync, self.diff, chunk_size=2)
+        self.assertEqual(self.diff.dict(), SyncDiffChunk.merge(self.sync.diff_chunks.all()))
@@ -0,0 +1,53 @@
+"""Test cases for the sampling CPU profiler."""
+
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from nautobot_ssot.profiling import SamplingProfiler
+
+
+def busy_wait(seconds):
+    """Keep the current thread busy for the given number of seconds."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+class SamplingProfilerTestCase(SimpleTestCase):
+    """Tests for the SamplingProfiler class."""
+
+    def test_sample(self):
+        """Test that a sample records the stack of the current thread, outermost frame first."""
+        profiler = SamplingProfiler()
+        profiler.add_thread()
+        profiler.phase = "diff"
+        profiler.sample()
+        self.assertEqual(["diff"], profiler.phases)
+        (stack,) = profiler.samples["diff"]
+        self.assertTrue(stack[-1].startswith("sample ("))
+        self.assertTrue(stack[-2].startswith("test_sample ("))
+
+    def test_collapsed_stacks(self):
+        """Test the collapsed stack output format."""
+        profiler = SamplingProfiler()
+        profiler.samples["load"][("main (a.py:1)", "load (b.py:2)")] += 3
+        profiler.samples["load"][("main (a.py:1)",)] += 1
+        self.assertEqual("main (a.py:1);load (b.py:2) 3\nmain (a.py:1) 1\n", profiler.collapsed_stacks("load"))
+
+    def test_background_sampling(self):
+        """Test that the profiled threads are sampled in the background, per phase."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        profiler.phase = "source_load"
+        worker = threading.Thread(target=lambda: (profiler.add_thread(), busy_wait(0.2), profiler.remove_thread()))
+        worker.start()
+        busy_wait(0.1)
+        profiler.phase = "target_load"
+        busy_wait(0.1)
+        worker.join()
+        profiler.stop()
+        self.assertEqual(["source_load", "target_load"], profiler.phases)
+        self.assertIn("busy_wait", profiler.collapsed_stacks("source_load"))
+        self.assertIn("<lambda>", profiler.collapsed_stacks("source_load"))
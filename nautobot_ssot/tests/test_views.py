@@ -11,7 +11,7 @@ from nautobot.extras.models import Job, JobResult
 from nautobot.users.models import ObjectPermission
 
 from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
-from nautobot_ssot.models import Sync, SyncLogEntry
+from nautobot_ssot.models import Sync, SyncDiffChunk, SyncLogEntry
 
 
 class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
@@ -106,6 +106,21 @@ class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
             200,
         )
 
+    def test_sync_view_chunked_diff(self):
+        """Test that the SyncView renders a single chunk of a chunked diff per page."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        sync = Sync.objects.first()
+        SyncDiffChunk.objects.create(sync=sync, index=0, model_type="location", diff={"ams01": {"+": {}}})
+        SyncDiffChunk.objects.create(sync=sync, index=1, model_type="location", diff={"ber01": {"+": {}}})
+
+        response = self.client.get(f"{sync.get_absolute_url()}?diff_page=2")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual({"location": {"ber01": {"+": {}}}}, response.context["diff"])
+        self.assertEqual(2, response.context["diff_page"].paginator.num_pages)
+
     def test_has_advanced_tab(self):
         pass
 
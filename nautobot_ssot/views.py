@@ -1,7 +1,6 @@
 """Django views for Single Source of Truth (SSoT)."""
 
-import pprint
-
+from django.core.paginator import Paginator
 from django.http import Http404
 from django.shortcuts import get_object_or_404, render
 from django.views import View as DjangoView
@@ -17,14 +16,14 @@ from .filters import SyncFilterSet, SyncLogEntryFilterSet
 from .forms import SyncFilterForm, SyncLogEntryFilterForm
 from .jobs import get_data_jobs
 from .jobs.base import DataSource, DataTarget
-from .models import Sync, SyncLogEntry
+from .models import Sync, SyncDiffChunk, SyncLogEntry
 from .tables import DashboardTable, SyncLogEntryTable, SyncTable, SyncTableSingleSourceOrTarget
 
 
 class DashboardView(ObjectListView):
     """Dashboard / overview of SSoT."""
 
-    queryset = Sync.objects.defer("diff").all()
+    queryset = Sync.objects.defer("diff", "diff_compressed").all()
     table = DashboardTable
     action_buttons = []
     template_name = "nautobot_ssot/dashboard.html"
@@ -134,9 +133,16 @@ class SyncView(ObjectView):
     template_name = "nautobot_ssot/sync_detail.html"
 
     def get_extra_context(self, request, instance):
-        """Add additional context to the view."""
+        """Add additional context to the view.
+
+        Chunked diffs are paginated, so only a single chunk is read from the database per request.
+        """
+        if not instance.has_chunked_diff:
+            return {"diff": instance.decoded_diff}
+        diff_page = Paginator(instance.diff_chunks.all(), per_page=1).get_page(request.GET.get("diff_page"))
         return {
-            "diff": pprint.pformat(instance.diff, width=180, compact=True),
+            "diff": SyncDiffChunk.merge(diff_page),
+            "diff_page": diff_page,
         }
 
 